@@ -1,16 +1,47 @@
+import asyncio
+import codecs
+import contextlib
+import email.utils
+import fnmatch
+import gzip
 import inspect
+import itertools
 import json
+import random
 import re
 import sys
-from collections import ChainMap
-from collections.abc import Iterator, Mapping, MutableMapping
-from datetime import datetime
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Collection, Iterable, Iterator, Mapping, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime
+from datetime import time as time_of_day
 from enum import Enum
 from types import UnionType
-from typing import Any, ClassVar, Generic, TypeAlias, TypeVar, Union, get_args, get_origin
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Literal,
+    TypeAlias,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    overload,
+)
 
 import dateutil.parser
+import dateutil.tz
 import requests
+import requests.adapters
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 if sys.version_info >= (3, 14):
     import annotationlib
@@ -18,6 +49,40 @@ if sys.version_info >= (3, 14):
 JsonObject: TypeAlias = MutableMapping[str, Any]
 
 
+def _json_default(value: Any) -> Any:
+    """
+    Converts the values orjson encodes natively, but the standard library does
+    not, as orjson does: enumerations to their value and dates and times to
+    ISO 8601 strings.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date, time_of_day)):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _json_dumps(value: Any) -> bytes:
+    """
+    Encodes a JSON data structure compactly as UTF-8. orjson is used if it is
+    installed, the standard library otherwise or for values orjson rejects,
+    e.g. integers beyond 64 bits. Both encode the same values the same way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=_json_default).encode()
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Decodes a JSON document, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class Platform(Enum):
     """
     Known deployments of the API. http.net Internet GmbH also operates the
@@ -34,8 +99,552 @@ class Platform(Enum):
         return self.value
 
 
+class Transport(ABC):
+    """
+    Sends the requests of a :class:`Client` over the network. A client may be
+    shared by several threads, so implementations have to be safe to use from
+    several threads at once.
+    """
+
+    @abstractmethod
+    def post(self, url: str, data: bytes, headers: Mapping[str, str],
+             timeout: float | tuple[float, float]) -> JsonObject:
+        """
+        Posts a request and returns the JSON data structure of the response.
+
+        :param url: URL of the method that is called
+        :param data: Body of the request, encoded as JSON in UTF-8
+        :param headers: HTTP headers of the request
+        :param timeout: Seconds to wait for the server, or a tuple of the
+            seconds to wait for the connection and for the response
+        :return: JSON data structure of the response
+        :raises requests.HTTPError: if the server answered with an error status
+        """
+
+    def post_measured(self, url: str, data: bytes, headers: Mapping[str, str],
+                      timeout: float | tuple[float, float]) -> tuple[JsonObject, int | None, int | None]:
+        """
+        Like :meth:`post`, but also returns the size of the response: the bytes
+        received, which are compressed if the server compressed them, and the
+        bytes after decompression. Either is ``None`` if it is unknown, which it
+        is unless a transport overrides this method.
+        """
+        return self.post(url, data, headers, timeout), None, None
+
+    def post_stream(self, url: str, data: bytes, headers: Mapping[str, str],
+                    timeout: float | tuple[float, float]) -> Iterator[bytes]:
+        """
+        Like :meth:`post`, but returns the body of the response in chunks as
+        they arrive, decompressed if the server compressed it. Unless a
+        transport overrides this method, the whole body is a single chunk.
+
+        :raises requests.HTTPError: on retrieving the first chunk, if the
+            server answered with an error status
+        """
+        yield _json_dumps(self.post(url, data, headers, timeout))
+
+    @abstractmethod
+    def close(self) -> None:
+        """Releases the connections of this transport."""
+
+
+class RequestsTransport(Transport):
+    """
+    The default transport, based on :mod:`requests`.
+
+    Connections are kept open and pooled per host, so consecutive requests to
+    the API reuse them. The pool is shared by all threads, each of which uses a
+    session of its own.
+
+    :param pool_size: Number of connections kept open per host. Set it to the
+        number of threads that share the client.
+    :param pool_hosts: Number of hosts to keep connections open to
+    :param pool_block: Whether a thread waits for a free connection once
+        ``pool_size`` connections to a host are in use. By default an
+        additional connection is opened, which is closed after the request.
+    :param keep_alive: Whether connections are kept open after a request
+    """
+
+    DEFAULT_POOL_SIZE = requests.adapters.DEFAULT_POOLSIZE
+    DEFAULT_POOL_HOSTS = requests.adapters.DEFAULT_POOLSIZE
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, pool_hosts: int = DEFAULT_POOL_HOSTS,
+                 pool_block: bool = False, keep_alive: bool = True) -> None:
+        self.pool_size = pool_size
+        self.pool_hosts = pool_hosts
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.__adapter = requests.adapters.HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size,
+                                                       pool_block=pool_block)
+        self.__local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """
+        Returns the session of the current thread. Sessions are not meant to be
+        shared by threads, but all of them share the pool of the adapter.
+        """
+        session = getattr(self.__local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', self.__adapter)
+            session.mount('http://', self.__adapter)
+            self.__local.session = session
+        return session
+
+    def post(self, url: str, data: bytes, headers: Mapping[str, str],
+             timeout: float | tuple[float, float]) -> JsonObject:
+        return self.post_measured(url, data, headers, timeout)[0]
+
+    def post_measured(self, url: str, data: bytes, headers: Mapping[str, str],
+                      timeout: float | tuple[float, float]) -> tuple[JsonObject, int | None, int | None]:
+        if not self.keep_alive:
+            headers = {**headers, 'Connection': 'close'}
+        response = self._session().post(url, data=data, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        content = response.content
+        # urllib3 counts the bytes read from the connection, before decompression.
+        raw = getattr(response, 'raw', None)
+        received = raw.tell() if raw is not None else None
+        return _json_loads(content), received, len(content)
+
+    def post_stream(self, url: str, data: bytes, headers: Mapping[str, str],
+                    timeout: float | tuple[float, float]) -> Iterator[bytes]:
+        if not self.keep_alive:
+            headers = {**headers, 'Connection': 'close'}
+        with self._session().post(url, data=data, headers=headers, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=RequestsTransport.STREAM_CHUNK_SIZE)
+
+    def close(self) -> None:
+        self.__adapter.close()
+
+
+def _succeeded(response: JsonObject) -> bool:
+    """Returns whether the API carried out a request, rather than accepting it."""
+    return str(response.get('status', '')).lower() == 'success'
+
+
+class ResponseCache:
+    """
+    Keeps the responses of reading requests, so that repeating a request
+    within ``ttl`` seconds is answered without asking the API again. Reading
+    requests are those of the ``*Find`` and ``*Info`` methods and of
+    ``nameserverSetGetDefault``. Any other request is considered writing and
+    discards every cached response of the same service, e.g. of ``dns``, once
+    it has been made.
+
+    Only successful responses are kept. They are shared by everyone who makes
+    the same request and must not be modified. The cache is safe to use from
+    several threads at once. A response whose request was already being made
+    when the service was invalidated is not kept, since it may predate the
+    write.
+
+    :param ttl: Seconds a response is kept
+    :param max_size: Number of responses that are kept. Beyond that, the least
+        recently used response is discarded.
+    """
+
+    READ_METHOD_SUFFIXES = ('Find', 'Info')
+    READ_METHODS = frozenset({'nameserverSetGetDefault'})
+
+    def __init__(self, ttl: float = 60, max_size: int = 1024) -> None:
+        if ttl <= 0:
+            raise ValueError(f'TTL must be positive, got {ttl}')
+        if max_size < 1:
+            raise ValueError(f'Size must be at least 1, got {max_size}')
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[tuple[str, str, str], tuple[float, JsonObject]] = OrderedDict()
+        self.__lock = threading.Lock()
+        # Counts the invalidations, and records the count at the last one of
+        # each service and of all services.
+        self.__invalidations = 0
+        self.__invalidated: dict[str, int] = {}
+        self.__invalidated_all = 0
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    @classmethod
+    def is_read_method(cls, method: str) -> bool:
+        """Returns whether the responses of a method can be cached."""
+        return method.endswith(cls.READ_METHOD_SUFFIXES) or method in cls.READ_METHODS
+
+    @staticmethod
+    def _key(service: str, method: str, parameters: Mapping[str, Any] | None) -> tuple[str, str, str]:
+        return service, method, json.dumps(parameters or {}, sort_keys=True, default=str)
+
+    def get(self, service: str, method: str, parameters: Mapping[str, Any] | None = None) -> JsonObject | None:
+        """
+        Returns the cached response of a request, or ``None`` if there is none
+        or it has expired.
+        """
+        key = self._key(service, method, parameters)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self.__entries[key]
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def generation(self, service: str) -> int:
+        """
+        Returns a number that changes whenever the responses of a service are
+        invalidated. It is taken before a request is made and passed to
+        :meth:`put` with its response.
+        """
+        with self.__lock:
+            return self.__generation(service)
+
+    def __generation(self, service: str) -> int:
+        return max(self.__invalidated.get(service, 0), self.__invalidated_all)
+
+    def put(self, service: str, method: str, parameters: Mapping[str, Any] | None,
+            response: JsonObject, generation: int | None = None) -> None:
+        """
+        Caches the response of a request.
+
+        :param generation: :meth:`generation` of the service before the request
+            was made. If the service has been invalidated since, the response
+            is not cached.
+        """
+        key = self._key(service, method, parameters)
+        with self.__lock:
+            if generation is not None and generation != self.__generation(service):
+                return
+            self.__entries[key] = (time.monotonic() + self.ttl, response)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, service: str | None = None) -> None:
+        """
+        Discards the cached responses of a service, or all of them.
+
+        :param service: Name of the service, e.g. ``dns``
+        """
+        with self.__lock:
+            self.__invalidations += 1
+            if service is None:
+                self.__invalidated_all = self.__invalidations
+                self.__entries.clear()
+            else:
+                self.__invalidated[service] = self.__invalidations
+                for key in [key for key in self.__entries if key[0] == service]:
+                    del self.__entries[key]
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is sent again, and when.
+
+    Requests are retried after an error of the connection, a timeout, or one of
+    the HTTP ``statuses``, such as 429 (Too Many Requests) or 503 (Service
+    Unavailable). Only reading requests are retried, see
+    :meth:`ResponseCache.is_read_method`. A writing request might have been
+    carried out although its response was lost, so it is not sent twice.
+
+    The time between two attempts doubles with every attempt, starting at
+    ``backoff`` seconds, and is randomized so that clients that failed at the
+    same time do not retry at the same time. If the server sends a
+    ``Retry-After`` header, its time is waited instead.
+
+    :param attempts: Number of times a request is sent at most, including the
+        first one. 1 disables retrying.
+    :param backoff: Seconds to wait before the second attempt at most
+    :param max_delay: Seconds to wait between two attempts at most. If the
+        server asks to wait longer, the request is not retried.
+    :param statuses: HTTP statuses after which a request is retried
+    :param jitter: Whether to wait a random time up to the backoff, instead of
+        exactly the backoff
+    """
+
+    DEFAULT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, attempts: int = 3, backoff: float = 0.5, max_delay: float = 30,
+                 statuses: Collection[int] = DEFAULT_STATUSES, jitter: bool = True) -> None:
+        if attempts < 1:
+            raise ValueError(f'Attempts must be at least 1, got {attempts}')
+        if backoff < 0 or max_delay < 0:
+            raise ValueError('Backoff and delay must not be negative')
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+        self.jitter = jitter
+
+    def retries(self, method: str) -> bool:
+        """Returns whether the requests of a method may be retried."""
+        return self.attempts > 1 and ResponseCache.is_read_method(method)
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """
+        Returns the seconds to wait after a failed attempt.
+
+        :param attempt: Number of the attempt that failed, starting at 1
+        :param retry_after: Value of the ``Retry-After`` header of the response
+        :return: Seconds to wait, or ``None`` if the request is not retried
+        """
+        if attempt >= self.attempts:
+            return None
+        if retry_after is not None:
+            seconds = self._seconds(retry_after)
+            if seconds is not None:
+                return seconds if seconds <= self.max_delay else None
+        delay = min(self.max_delay, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def _seconds(retry_after: str) -> float | None:
+        """Converts a ``Retry-After`` header, either seconds or a date, to seconds."""
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            return None
+        return max(0.0, (date - datetime.now(date.tzinfo)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Limits the rate of the requests of a client, and optionally how many of
+    them are made at once. All services of a client share its limiter, so the
+    threads or tasks that use them share its limits as well.
+
+    The rate is limited by a token bucket: it holds up to ``burst`` tokens and
+    is refilled by ``rate`` tokens per second. Every request takes as many
+    tokens as its method weighs and waits until the bucket has refilled
+    enough. Requests answered from a :class:`ResponseCache` take none, retried
+    ones take tokens for every attempt.
+
+    :param rate: Tokens added per second, i.e. requests per second if every
+        method weighs 1
+    :param burst: Tokens the bucket holds, i.e. how many requests can be made
+        at once after a pause. Defaults to ``rate``, but at least 1.
+    :param max_in_flight: Number of requests made at once at most. By default
+        it is not limited.
+    :param weights: Tokens per request of certain methods, by method name or
+        by a pattern such as ``*Find``. Exact names take precedence over
+        patterns, which are tried in the given order. Any other method weighs
+        1.
+    """
+
+    # Seconds between checks for a free slot while a task waits for one.
+    _ASYNC_POLL_INTERVAL = 0.01
+
+    def __init__(self, rate: float, burst: float | None = None, max_in_flight: int | None = None,
+                 weights: Mapping[str, float] | None = None) -> None:
+        if rate <= 0:
+            raise ValueError(f'Rate must be positive, got {rate}')
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f'Requests in flight must be at least 1, got {max_in_flight}')
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        if self.burst <= 0:
+            raise ValueError(f'Burst must be positive, got {burst}')
+        self.max_in_flight = max_in_flight
+        self.weights = dict(weights or {})
+        self.__tokens = self.burst
+        self.__updated = time.monotonic()
+        self.__in_flight = 0
+        self.__lock = threading.Lock()
+        self.__slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+
+    def weight(self, method: str) -> float:
+        """Returns the number of tokens a request of a method takes."""
+        try:
+            return self.weights[method]
+        except KeyError:
+            pass
+        for pattern, weight in self.weights.items():
+            if fnmatch.fnmatchcase(method, pattern):
+                return weight
+        return 1.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+        self.__updated = now
+
+    def _reserve(self, method: str) -> float:
+        """Takes the tokens of a request and returns the seconds to wait until they are available."""
+        with self.__lock:
+            self._refill()
+            self.__tokens -= self.weight(method)
+            return max(0.0, -self.__tokens / self.rate)
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds a request of weight 1 would currently wait for tokens."""
+        with self.__lock:
+            self._refill()
+            return max(0.0, (1 - self.__tokens) / self.rate)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently being made."""
+        return self.__in_flight
+
+    def _enter(self) -> None:
+        with self.__lock:
+            self.__in_flight += 1
+
+    def _exit(self) -> None:
+        with self.__lock:
+            self.__in_flight -= 1
+        if self.__slots is not None:
+            self.__slots.release()
+
+    @contextlib.contextmanager
+    def throttle(self, method: str) -> Iterator[None]:
+        """
+        Waits until a request of a method may be made, and keeps its slot
+        while the context is entered.
+        """
+        if self.__slots is not None:
+            self.__slots.acquire()
+        self._enter()
+        try:
+            delay = self._reserve(method)
+            if delay:
+                time.sleep(delay)
+            yield
+        finally:
+            self._exit()
+
+    @contextlib.asynccontextmanager
+    async def throttle_async(self, method: str) -> AsyncIterator[None]:
+        """
+        Like :meth:`throttle`, but waits without blocking the event loop. The
+        slots are shared with threads, so a task checks periodically whether
+        one has become free.
+        """
+        if self.__slots is not None:
+            while not self.__slots.acquire(blocking=False):
+                await asyncio.sleep(RateLimiter._ASYNC_POLL_INTERVAL)
+        self._enter()
+        try:
+            delay = self._reserve(method)
+            if delay:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            self._exit()
+
+
+class RequestCompression:
+    """
+    Compresses the bodies of large requests with gzip. Only use it if the
+    server accepts compressed requests.
+
+    :param threshold: Bytes a body must have at least to be compressed
+    :param methods: Names of the methods whose requests are compressed. By
+        default those that carry whole zones or templates.
+    :param level: Compression level from 1 (fastest) to 9 (smallest)
+    """
+
+    DEFAULT_METHODS = frozenset({'zoneUpdate', 'zoneRecreate', 'templateRecreate'})
+
+    def __init__(self, threshold: int = 64 * 1024, methods: Collection[str] = DEFAULT_METHODS,
+                 level: int = 6) -> None:
+        if threshold < 0:
+            raise ValueError(f'Threshold must not be negative, got {threshold}')
+        if not 1 <= level <= 9:
+            raise ValueError(f'Level must be between 1 and 9, got {level}')
+        self.threshold = threshold
+        self.methods = frozenset(methods)
+        self.level = level
+
+    def compresses(self, method: str, size: int) -> bool:
+        """Returns whether a request of a method whose body has ``size`` bytes is compressed."""
+        return method in self.methods and size >= self.threshold
+
+
+class TransferStats:
+    """
+    Counts the successful requests of a client, in ``calls``, and the bytes of
+    their bodies: ``request_bytes`` before and ``request_bytes_sent`` after
+    compression, ``response_bytes`` after and ``response_bytes_received``
+    before decompression. :attr:`methods` has the same counts for each method.
+
+    The compressed size of a response is only known if the transport reports
+    it, see :meth:`Transport.post_measured`. Otherwise the response is counted
+    as uncompressed.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.request_bytes = 0
+        self.request_bytes_sent = 0
+        self.response_bytes = 0
+        self.response_bytes_received = 0
+        self.methods: dict[str, TransferStats] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes that compression saved in both directions."""
+        return (self.request_bytes - self.request_bytes_sent) + (self.response_bytes - self.response_bytes_received)
+
+    def _add(self, request_bytes: int, request_bytes_sent: int, response_bytes: int,
+             response_bytes_received: int) -> None:
+        self.calls += 1
+        self.request_bytes += request_bytes
+        self.request_bytes_sent += request_bytes_sent
+        self.response_bytes += response_bytes
+        self.response_bytes_received += response_bytes_received
+
+    def record(self, method: str, request_bytes: int, request_bytes_sent: int,
+               response_bytes: int | None, response_bytes_received: int | None) -> None:
+        """Counts a request of a method, see the attributes for the sizes."""
+        if response_bytes is None:
+            response_bytes = response_bytes_received or 0
+        if response_bytes_received is None:
+            response_bytes_received = response_bytes
+        with self.__lock:
+            self._add(request_bytes, request_bytes_sent, response_bytes, response_bytes_received)
+            method_stats = self.methods.get(method)
+            if method_stats is None:
+                method_stats = self.methods[method] = TransferStats()
+            method_stats._add(request_bytes, request_bytes_sent, response_bytes, response_bytes_received)
+
+
 class Client:
+    """
+    Makes the requests of the services. A client can be shared by several
+    threads, as long as its transport supports it, which the default one does.
+
+    :param transport: Transport that sends the requests. By default a
+        :class:`RequestsTransport` with default settings is used.
+    :param cache: Cache for the responses of reading requests. By default
+        nothing is cached.
+    :param retry: Policy for retrying failed requests. By default reading
+        requests are sent up to three times, see :class:`RetryPolicy`.
+    :param limiter: Limits the rate and concurrency of the requests. By
+        default they are not limited.
+    :param coalesce: Whether identical reading requests that are made while
+        the first of them is still waiting for its response share that
+        response, instead of making requests of their own
+    :param compression: Which request bodies to compress. By default none
+        are. Compressed responses are always accepted, and the bytes saved
+        either way are counted in :attr:`stats`.
+    """
+
     USER_AGENT = 'HTTP.NET Partner API Python client 1.0'
+    ACCEPT_ENCODING = 'gzip, deflate'
     BASE_URL = str(Platform.HTTP_NET)
     VERSION = 'v1'
     FORMAT = 'json'
@@ -43,7 +652,10 @@ class Client:
 
     def __init__(self, auth_token: str, owner_account_id: str | None = None,
                  timeout: float | tuple[float, float] | None = None,
-                 base_url: Platform | str = Platform.HTTP_NET) -> None:
+                 base_url: Platform | str = Platform.HTTP_NET,
+                 transport: Transport | None = None, cache: ResponseCache | None = None,
+                 retry: RetryPolicy | None = None, limiter: RateLimiter | None = None,
+                 coalesce: bool = False, compression: RequestCompression | None = None) -> None:
         self.auth_token = auth_token
         self.base_url = str(base_url).rstrip('/')
         self.owner_account_id = owner_account_id
@@ -53,8 +665,30 @@ class Client:
                 self.timeout = timeout
         elif timeout is not None and timeout > 0:
             self.timeout = timeout
-        self.__session = requests.Session()
-        self.__session.headers.update({'User-Agent': Client.USER_AGENT})
+        self.transport = transport if transport is not None else RequestsTransport()
+        self.cache = cache
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.limiter = limiter
+        self.coalesce = coalesce
+        self.compression = compression
+        self.stats = TransferStats()
+        self.__pending: dict[tuple[str, str, str], Future[JsonObject]] = {}
+        self.__pending_lock = threading.Lock()
+        self._connection_errors: tuple[type[Exception], ...] = (requests.ConnectionError, requests.Timeout)
+
+    def _url(self, service: str, method: str) -> str:
+        return f'{self.base_url}/{service}/{Client.VERSION}/{Client.FORMAT}/{method}'
+
+    def _request(self, parameters: Mapping[str, Any] | None = None) -> JsonObject:
+        """
+        Builds the body of a request. The authentication parameters take
+        precedence over the given ones, so that they cannot be overridden.
+        """
+        request: JsonObject = dict(parameters) if parameters else {}
+        request['authToken'] = self.auth_token
+        if self.owner_account_id:
+            request['ownerAccountId'] = self.owner_account_id
+        return request
 
     def call(self, service: str, method: str,
              parameters: Mapping[str, Any] | None = None) -> JsonObject:
@@ -66,17 +700,264 @@ class Client:
         :param parameters: Mapping of input parameters
         :return: JSON data structure of the response
         """
-        url = f'{self.base_url}/{service}/{Client.VERSION}/{Client.FORMAT}/{method}'
-        request: ChainMap[str, Any] = ChainMap({
-            'authToken': self.auth_token,
-        })
-        if self.owner_account_id:
-            request['ownerAccountId'] = self.owner_account_id
-        if parameters is not None:
-            request.maps.append(dict(parameters))
-        response = self.__session.post(url, data=json.dumps(dict(request)), timeout=self.timeout)
-        response.raise_for_status()
-        return response.json()
+        cache = self.cache
+        if not ResponseCache.is_read_method(method):
+            try:
+                return self._post(service, method, parameters)
+            finally:
+                if cache is not None:
+                    cache.invalidate(service)
+        generation = None
+        if cache is not None:
+            response = cache.get(service, method, parameters)
+            if response is not None:
+                return response
+            generation = cache.generation(service)
+        if self.coalesce:
+            response = self._post_coalesced(service, method, parameters)
+        else:
+            response = self._post(service, method, parameters)
+        if cache is not None and _succeeded(response):
+            cache.put(service, method, parameters, response, generation)
+        return response
+
+    def _post_coalesced(self, service: str, method: str, parameters: Mapping[str, Any] | None) -> JsonObject:
+        """
+        Makes a reading request, unless an identical one is already waiting
+        for its response, which is then shared. Failures are shared as well.
+        """
+        key = ResponseCache._key(service, method, parameters)
+        with self.__pending_lock:
+            pending = self.__pending.get(key)
+            if pending is None:
+                future: Future[JsonObject] = Future()
+                self.__pending[key] = future
+        if pending is not None:
+            return pending.result()
+        try:
+            response = self._post(service, method, parameters)
+        except BaseException as e:
+            with self.__pending_lock:
+                del self.__pending[key]
+            future.set_exception(e)
+            raise
+        with self.__pending_lock:
+            del self.__pending[key]
+        future.set_result(response)
+        return response
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float | None:
+        """
+        Returns the seconds to wait before retrying a request that failed with
+        ``error``, or ``None`` if it is not retried.
+        """
+        if isinstance(error, self._connection_errors):
+            return self.retry.delay(attempt)
+        # The HTTP errors of requests and httpx both carry the response.
+        response = getattr(error, 'response', None)
+        if getattr(response, 'status_code', None) in self.retry.statuses:
+            return self.retry.delay(attempt, response.headers.get('Retry-After'))
+        return None
+
+    def _body(self, method: str, parameters: Mapping[str, Any] | None) -> tuple[bytes, bytes, dict[str, str]]:
+        """
+        Encodes the body of a request. Returns the body, the body as it is
+        sent, i.e. compressed if it is, and the headers of the request.
+        """
+        data = _json_dumps(self._request(parameters))
+        headers = {'User-Agent': Client.USER_AGENT, 'Accept-Encoding': Client.ACCEPT_ENCODING}
+        if self.compression is not None and self.compression.compresses(method, len(data)):
+            headers['Content-Encoding'] = 'gzip'
+            return data, gzip.compress(data, self.compression.level), headers
+        return data, data, headers
+
+    def _post(self, service: str, method: str, parameters: Mapping[str, Any] | None) -> JsonObject:
+        url = self._url(service, method)
+        data, body, headers = self._body(method, parameters)
+        retries = self.retry.retries(method)
+        attempt = 1
+        while True:
+            try:
+                with self.limiter.throttle(method) if self.limiter is not None else contextlib.nullcontext():
+                    response, received, decoded = self.transport.post_measured(url, data=body, headers=headers,
+                                                                               timeout=self.timeout)
+                self.stats.record(method, len(data), len(body), decoded, received)
+                return response
+            except Exception as e:
+                delay = self._retry_delay(e, attempt) if retries else None
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def stream(self, service: str, method: str,
+               parameters: Mapping[str, Any] | None = None) -> Iterator[bytes]:
+        """
+        Calls the method of a service and returns the body of the response in
+        chunks as they arrive. The request is made once the first chunk is
+        requested. Its response is neither cached nor shared with identical
+        requests, but failed requests are retried as by :meth:`call` until the
+        response begins.
+
+        :param service: Name of the service
+        :param method: Name of the method
+        :param parameters: Mapping of input parameters
+        :return: Iterator over the chunks of the body of the response
+        """
+        url = self._url(service, method)
+        data, body, headers = self._body(method, parameters)
+        retries = self.retry.retries(method)
+        attempt = 1
+        while True:
+            try:
+                with self.limiter.throttle(method) if self.limiter is not None else contextlib.nullcontext():
+                    chunks = self.transport.post_stream(url, data=body, headers=headers, timeout=self.timeout)
+                    first_chunk = next(chunks, b'')
+                break
+            except Exception as e:
+                delay = self._retry_delay(e, attempt) if retries else None
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+        try:
+            response_bytes = len(first_chunk)
+            yield first_chunk
+            for chunk in chunks:
+                response_bytes += len(chunk)
+                yield chunk
+        finally:
+            if self.cache is not None and not ResponseCache.is_read_method(method):
+                self.cache.invalidate(service)
+        self.stats.record(method, len(data), len(body), response_bytes, None)
+
+    def close(self) -> None:
+        """Releases the connections of the transport."""
+        self.transport.close()
+
+
+class AsyncClient(Client):
+    """
+    A :class:`Client` whose requests can also be awaited, see
+    :meth:`call_async`. The asynchronous requests are made through
+    `httpx <https://www.python-httpx.org/>`__, which is installed with the
+    ``async`` extra of this package.
+
+    The connections of the asynchronous requests are pooled. Close them with
+    :meth:`aclose` or by using the client as an asynchronous context manager.
+    """
+
+    def __init__(self, auth_token: str, owner_account_id: str | None = None,
+                 timeout: float | tuple[float, float] | None = None,
+                 base_url: Platform | str = Platform.HTTP_NET,
+                 transport: Transport | None = None, cache: ResponseCache | None = None,
+                 retry: RetryPolicy | None = None, limiter: RateLimiter | None = None,
+                 coalesce: bool = False, compression: RequestCompression | None = None) -> None:
+        super().__init__(auth_token, owner_account_id=owner_account_id, timeout=timeout,
+                         base_url=base_url, transport=transport, cache=cache, retry=retry, limiter=limiter,
+                         coalesce=coalesce, compression=compression)
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError('The asynchronous client requires httpx, install "httpnet[async]".') from e
+        self._connection_errors = (*self._connection_errors, httpx.TransportError)
+        if isinstance(self.timeout, tuple):
+            connect_timeout, read_timeout = self.timeout
+            async_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        else:
+            async_timeout = httpx.Timeout(self.timeout)
+        self.__async_session = httpx.AsyncClient(timeout=async_timeout)
+        # Keyed by the event loop as well, since its futures cannot be awaited from another one.
+        self.__pending_async: dict[tuple[asyncio.AbstractEventLoop, tuple[str, str, str]],
+                                   asyncio.Future[JsonObject]] = {}
+
+    async def call_async(self, service: str, method: str,
+                         parameters: Mapping[str, Any] | None = None) -> JsonObject:
+        """
+        Calls the method of a service without blocking the event loop.
+
+        :param service: Name of the service
+        :param method: Name of the method
+        :param parameters: Mapping of input parameters
+        :return: JSON data structure of the response
+        """
+        cache = self.cache
+        if not ResponseCache.is_read_method(method):
+            try:
+                return await self._post_async(service, method, parameters)
+            finally:
+                if cache is not None:
+                    cache.invalidate(service)
+        generation = None
+        if cache is not None:
+            response = cache.get(service, method, parameters)
+            if response is not None:
+                return response
+            generation = cache.generation(service)
+        if self.coalesce:
+            response = await self._post_coalesced_async(service, method, parameters)
+        else:
+            response = await self._post_async(service, method, parameters)
+        if cache is not None and _succeeded(response):
+            cache.put(service, method, parameters, response, generation)
+        return response
+
+    async def _post_coalesced_async(self, service: str, method: str,
+                                    parameters: Mapping[str, Any] | None) -> JsonObject:
+        """Counterpart of :meth:`Client._post_coalesced` for the tasks of an event loop."""
+        loop = asyncio.get_running_loop()
+        key = (loop, ResponseCache._key(service, method, parameters))
+        pending = self.__pending_async.get(key)
+        if pending is not None:
+            # Shielded, so that a cancelled waiter does not cancel the request of the others.
+            return await asyncio.shield(pending)
+        future: asyncio.Future[JsonObject] = loop.create_future()
+        self.__pending_async[key] = future
+        try:
+            response = await self._post_async(service, method, parameters)
+        except BaseException as e:
+            del self.__pending_async[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Retrieved, so that it is not reported if nobody else waits.
+                future.exception()
+            raise
+        del self.__pending_async[key]
+        future.set_result(response)
+        return response
+
+    async def _post_async(self, service: str, method: str, parameters: Mapping[str, Any] | None) -> JsonObject:
+        url = self._url(service, method)
+        data, body, headers = self._body(method, parameters)
+        retries = self.retry.retries(method)
+        attempt = 1
+        while True:
+            try:
+                async with (self.limiter.throttle_async(method) if self.limiter is not None
+                            else contextlib.nullcontext()):
+                    response = await self.__async_session.post(url, content=body, headers=headers)
+                response.raise_for_status()
+                content = response.content
+                self.stats.record(method, len(data), len(body), len(content), response.num_bytes_downloaded)
+                return _json_loads(content)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt) if retries else None
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """Closes the connections of the asynchronous requests."""
+        await self.__async_session.aclose()
+
+    async def __aenter__(self) -> 'AsyncClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
 
 def camel_case(snake_str: str) -> str:
@@ -115,52 +996,166 @@ def _field_types(cls: type) -> Mapping[str, Any]:
     return inspect.get_annotations(cls)
 
 
-class ElementMeta(type):
-    def __new__(mcs, typename: str, bases, ns):
-        if ns.get('_root', False):
-            return super().__new__(mcs, typename, bases, ns)
-        fields = _declared_field_names(ns)
-        ns['__slots__'] = fields
-        # Mirror of ``__slots__`` that is visible to static type checkers.
-        ns['_fields'] = tuple(fields)
-        return super().__new__(mcs, typename, bases, ns)
+# The timestamps the API sends, e.g. ``2015-09-02T10:14:02Z`` or
+# ``2015-01-01T00:00:00``, and dates like ``2015-12-31``.
+_ISO_DATETIME = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(?:(Z)|([+-])(\d{2}):?(\d{2}))?)?'
+)
 
 
-def _from_json_value(value, type_):
-    if value is None:
-        return None
-    if type_ is Any:
-        return value
+def _parse_datetime(value: str) -> datetime:
+    """
+    Parses a timestamp of the API. The formats the API uses are parsed
+    directly, which is much faster than the general parser of ``dateutil``
+    that any other value is left to. Both return the same time zones.
+    """
+    match = _ISO_DATETIME.fullmatch(value)
+    if match is None:
+        return dateutil.parser.parse(value)
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hours, offset_minutes = match.groups()
+    tzinfo: Any = None
+    if utc:
+        tzinfo = dateutil.tz.UTC
+    elif sign:
+        offset = int(offset_hours) * 3600 + int(offset_minutes) * 60
+        if offset == 0:
+            tzinfo = dateutil.tz.UTC
+        else:
+            tzinfo = dateutil.tz.tzoffset(None, -offset if sign == '-' else offset)
+    try:
+        return datetime(int(year), int(month), int(day),
+                        int(hour or 0), int(minute or 0), int(second or 0),
+                        int(fraction.ljust(6, '0')) if fraction else 0, tzinfo)
+    except ValueError:
+        # Leaves the error to the general parser, e.g. for a month of 13.
+        return dateutil.parser.parse(value)
+
+
+_Decoder: TypeAlias = Callable[[Any], Any]
+_Encoder: TypeAlias = Callable[[Any], Any]
+
+# Exceptions that make the conversion of a union try its next member.
+_UNION_ERRORS = (AttributeError, TypeError, ValueError)
+
+
+def _identity(value):
+    return value
+
+
+def _decoder(type_) -> _Decoder:
+    """
+    Creates a function that converts a JSON value, which must not be ``None``,
+    to ``type_``. The annotation is inspected once, so that converting a value
+    does not have to do it again.
+    """
+    if type_ is Any or type_ is None:
+        return _identity
     origin = get_origin(type_)
     if origin in (Union, UnionType):
         args = get_args(type_)
-        for arg in args:
-            if arg is type(None):
-                continue
-            try:
-                return _from_json_value(value, arg)
-            except (AttributeError, TypeError, ValueError):
-                continue
-        # The API uses an empty string to denote an unset value, e.g. for the
-        # deletion date of a domain that is not scheduled for deletion.
-        if value == '' and type(None) in args:
-            return None
-        return value
+        optional = type(None) in args
+        decoders = [_decoder(arg) for arg in args if arg is not type(None)]
+
+        def decode_union(value):
+            for decode in decoders:
+                try:
+                    return decode(value)
+                except _UNION_ERRORS:
+                    continue
+            # The API uses an empty string to denote an unset value, e.g. for
+            # the deletion date of a domain that is not scheduled for deletion.
+            if optional and value == '':
+                return None
+            return value
+        return decode_union
     if origin is not None:
         args = get_args(type_)
         # Mappings have to be handled before the sequence case, iterating one
         # would yield its keys instead of its items.
         if isinstance(origin, type) and issubclass(origin, Mapping):
-            value_type = args[1] if len(args) > 1 else None
-            return {k: _from_json_value(v, value_type) for k, v in value.items()}
-        return [_from_json_value(v, args[0]) for v in value] if args else list(value)
-    if type_ is datetime and isinstance(value, str):
-        return dateutil.parser.parse(value)
-    if isinstance(type_, type) and issubclass(type_, Element):
-        return type_.from_json(value)
+            decode_value = _decoder(args[1] if len(args) > 1 else None)
+            return lambda value: {k: None if v is None else decode_value(v) for k, v in value.items()}
+        if not args:
+            return list
+        decode_item = _decoder(args[0])
+        return lambda value: [None if v is None else decode_item(v) for v in value]
+    if type_ is datetime:
+        def decode_datetime(value):
+            if isinstance(value, str):
+                return _parse_datetime(value)
+            return datetime(value)
+        return decode_datetime
     if not isinstance(type_, type):
-        return value
-    return type_(value)
+        return _identity
+    if issubclass(type_, Element):
+        return type_.from_json
+    if issubclass(type_, Enum):
+        members = type_._value2member_map_
+
+        def decode_enum(value):
+            try:
+                return members[value]
+            except (KeyError, TypeError):
+                # Leaves aliases, ``_missing_`` and the error to the enum.
+                return type_(value)
+        return decode_enum
+    if type_ in (str, int, float, bool):
+        # Values of exactly the annotated type are returned unchanged by the
+        # constructor anyway, so the call can be skipped for them.
+        return lambda value: value if value.__class__ is type_ else type_(value)
+    return type_
+
+
+class ElementMeta(type):
+    def __new__(mcs, typename: str, bases, ns):
+        if ns.get('_root', False):
+            return super().__new__(mcs, typename, bases, ns)
+        fields = _declared_field_names(ns)
+        ns['__slots__'] = fields
+        # Mirror of ``__slots__`` that is visible to static type checkers.
+        ns['_fields'] = tuple(fields)
+        return super().__new__(mcs, typename, bases, ns)
+
+    def _decoding_plan(cls) -> dict[str, tuple[str, _Decoder]]:
+        """
+        Returns the plan for converting the JSON data structure of this element
+        class: the name of the field and the converter for every key the API
+        uses. The plan is created on first use, since annotations may refer to
+        classes that are declared after this one.
+        """
+        plan = cls.__dict__.get('_json_decoding_plan')
+        if plan is None:
+            plan = {}
+            for field, type_ in _field_types(cls).items():
+                field_id = camel_case(field)
+                # Only keys that convert back to the field name are known in
+                # advance, any other ones are looked up on demand.
+                if snake_case(field_id) == field:
+                    plan[field_id] = (field, _decoder(type_))
+            cls._json_decoding_plan = plan
+        return plan
+
+    def _field_ids(cls) -> dict[str, str]:
+        """Returns the key the API uses for every field of this class."""
+        field_ids = cls.__dict__.get('_json_field_ids')
+        if field_ids is None:
+            field_ids = {field: field_id for field, field_id, _ in cls._encoding_plan()}
+            cls._json_field_ids = field_ids
+        return field_ids
+
+    def _encoding_plan(cls) -> tuple[tuple[str, str, _Encoder], ...]:
+        """
+        Returns the plan for converting an element of this class to JSON: the
+        name of every field, its key in the API and its converter. The plan is
+        created on first use, like the decoding plan.
+        """
+        plan = cls.__dict__.get('_json_encoding_plan')
+        if plan is None:
+            plan = tuple((field, camel_case(field), _encoder(type_))
+                         for field, type_ in _field_types(cls).items())
+            cls._json_encoding_plan = plan
+        return plan
 
 
 def _to_json_value(value, type_):
@@ -183,6 +1178,43 @@ def _to_json_value(value, type_):
     raise TypeError(f'Unknown type: {type_}')
 
 
+def _encoder(type_) -> _Encoder:
+    """
+    Creates a function that converts a value, which must not be ``None``, of a
+    field annotated with ``type_`` to JSON. It takes a shortcut for values of
+    the annotated type and leaves any other value to :func:`_to_json_value`,
+    so the result is the same either way.
+    """
+    def encode(value):
+        return _to_json_value(value, type_)
+
+    origin = get_origin(type_)
+    if origin in (Union, UnionType):
+        args = [arg for arg in get_args(type_) if arg is not type(None)]
+        # A union of several types is left to the generic conversion.
+        return _encoder(args[0]) if len(args) == 1 else encode
+    if origin is not None:
+        args = get_args(type_)
+        if isinstance(origin, type) and issubclass(origin, Mapping):
+            encode_value = _encoder(args[1]) if len(args) > 1 else encode
+            return lambda value: ({k: None if v is None else encode_value(v) for k, v in value.items()}
+                                  if value.__class__ is dict else encode(value))
+        encode_item = _encoder(args[0]) if args else encode
+        return lambda value: ([None if v is None else encode_item(v) for v in value]
+                              if value.__class__ in (list, tuple) else encode(value))
+    if not isinstance(type_, type):
+        return encode
+    if type_ in (str, int, float, bool):
+        return lambda value: value if isinstance(value, (str, int, float)) else encode(value)
+    if type_ is datetime:
+        return lambda value: value.isoformat() if value.__class__ is datetime else encode(value)
+    if issubclass(type_, Element):
+        return lambda value: value.to_json() if isinstance(value, Element) else encode(value)
+    if issubclass(type_, Enum) and not issubclass(type_, (str, int, float)):
+        return lambda value: str(value) if value.__class__ is type_ else encode(value)
+    return encode
+
+
 class Element(metaclass=ElementMeta):
     """
     Base class of all objects the API exchanges. Subclasses declare their
@@ -212,36 +1244,125 @@ class Element(metaclass=ElementMeta):
         :return: JSON data structure of this element
         """
         fields: JsonObject = {}
-        for field, type_ in _field_types(type(self)).items():
+        for field, field_id, encode in type(self)._encoding_plan():
             value = getattr(self, field, None)
             if value is not None:
-                field_id = camel_case(field)
-                fields[field_id] = _to_json_value(value, type_)
+                fields[field_id] = encode(value)
         return fields
 
     @classmethod
-    def from_json(cls, data: JsonObject):
+    def from_json(cls, data: JsonObject, fields: Collection[str] | None = None, lazy: bool = False):
         """
         Creates an element from the JSON data structure of the API. Field names
         are converted from ``camelCase`` to ``snake_case``, values are
         converted to the types the fields are annotated with.
 
         :param data: JSON data structure as returned by the API
+        :param fields: Names of the only fields to convert. All other fields
+            are ``None``. Since such an element is incomplete by design, the
+            checks of the constructor are skipped.
+        :param lazy: Whether to convert each field only when it is read for the
+            first time. The element keeps a reference to ``data`` until then.
+            The checks of the constructor are skipped, since they would read
+            the fields right away.
         :return: New element
         :raises KeyError: if the data contains a field this element does not
-            declare
+            declare, or if ``fields`` names one
+        :raises ValueError: if both ``fields`` and ``lazy`` are given
         """
-        fields: JsonObject = {}
-        field_types = _field_types(cls)
+        if lazy:
+            if fields is not None:
+                raise ValueError('Fields cannot be selected for a lazy element')
+            return cls._from_json_lazy(data)
+        if fields is not None:
+            return cls._from_json_projection(data, fields)
+        fields = {}
+        plan = cls._decoding_plan()
         for field_id, value in data.items():
-            field = snake_case(field_id)
             try:
-                field_type = field_types[field]
-            except KeyError as e:
-                raise KeyError(f'No field "{field}" defined in API model "{cls.__qualname__}"') from e
-            fields[field] = _from_json_value(value, field_type)
+                field, decode = plan[field_id]
+            except KeyError:
+                field, decode = cls._plan_key(plan, field_id)
+            fields[field] = None if value is None else decode(value)
         return cls(**fields)
 
+    @classmethod
+    def _from_json_projection(cls, data: JsonObject, fields: Collection[str]):
+        """
+        Creates an element of which only the given fields are converted, see
+        :meth:`from_json`. All other keys of the data are skipped unseen.
+        """
+        selected_fields = frozenset(fields)
+        for field in selected_fields.difference(cls._fields):
+            raise KeyError(f'No field "{field}" defined in API model "{cls.__qualname__}"')
+        values: JsonObject = {}
+        plan = cls._decoding_plan()
+        for field_id, value in data.items():
+            try:
+                field, decode = plan[field_id]
+            except KeyError:
+                if snake_case(field_id) not in selected_fields:
+                    continue
+                field, decode = cls._plan_key(plan, field_id)
+            if field in selected_fields:
+                values[field] = None if value is None else decode(value)
+        element = cls.__new__(cls)
+        Element.__init__(element, **values)
+        return element
+
+    @classmethod
+    def _from_json_lazy(cls, data: JsonObject):
+        """
+        Creates an element whose fields are converted on first access, see
+        :meth:`from_json`. Its fields are left unset, so that reading one of
+        them ends up in :meth:`__getattr__`.
+        """
+        plan = cls._decoding_plan()
+        irregular_keys: dict[str, str] = {}
+        for field_id in data:
+            # Unknown keys are rejected right away, as for any other element.
+            if field_id not in plan:
+                field, _ = cls._plan_key(plan, field_id)
+                irregular_keys[field] = field_id
+        element = cls.__new__(cls)
+        # Elements have a ``__dict__`` besides their slots, since the base
+        # class declares no slots. It holds the data that is not converted yet.
+        element.__dict__['_json'] = data
+        element.__dict__['_json_keys'] = irregular_keys
+        return element
+
+    def __getattr__(self, name: str):
+        """
+        Converts a field of a lazy element on first access, see
+        :meth:`from_json`. Any other attribute that is not set does not exist.
+        """
+        data = self.__dict__.get('_json')
+        field_ids = type(self)._field_ids()
+        if data is None or name not in field_ids:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'",
+                                 name=name, obj=self)
+        field_id = self.__dict__['_json_keys'].get(name, field_ids[name])
+        value = data.get(field_id)
+        if value is not None:
+            value = type(self)._decoding_plan()[field_id][1](value)
+        setattr(self, name, value)
+        return value
+
+    @classmethod
+    def _plan_key(cls, plan: dict[str, tuple[str, _Decoder]], field_id: str) -> tuple[str, _Decoder]:
+        """
+        Adds a key to the decoding plan that is spelled differently than the
+        API usually does, e.g. ``DNSSecMode`` instead of ``dnsSecMode``.
+        """
+        field = snake_case(field_id)
+        field_types = _field_types(cls)
+        try:
+            field_type = field_types[field]
+        except KeyError as e:
+            raise KeyError(f'No field "{field}" defined in API model "{cls.__qualname__}"') from e
+        plan[field_id] = (field, _decoder(field_type))
+        return plan[field_id]
+
 
 class ServiceException(Exception):
     """
@@ -250,6 +1371,294 @@ class ServiceException(Exception):
     """
 
 
+def _check_response(response: JsonObject) -> JsonObject:
+    """
+    Returns the response of a request if the API accepted it.
+
+    :raises ServiceException: if the API rejected the request
+    """
+    status = str(response.get('status', '')).lower()
+    if status not in {'success', 'pending'}:
+        errors = response.get('errors') or []
+        error_messages = [f'{error["text"]} ({error["code"]}).' for error in errors]
+        raise ServiceException(' '.join(error_messages) or f'API returned status "{status}".')
+    return response
+
+
+def _filter_value(value: Any) -> str:
+    """Returns a value to filter by as the API expects it, i.e. as a string."""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return json.dumps(value).strip('"').replace(r'\"', '"')
+
+
+class Filter(ABC):
+    """
+    A condition on the elements of a listing, which the API evaluates. Filters
+    are built from :class:`Field` objects and combined with ``&`` (and) and
+    ``|`` (or), or with :func:`all_of` and :func:`any_of`:
+
+    .. code-block:: python
+
+        (Field('RecordType') == 'A') | (Field('RecordType') == 'AAAA')
+    """
+
+    @abstractmethod
+    def to_json(self) -> JsonObject:
+        """Returns the filter as the API expects it."""
+
+    def __and__(self, other: 'Filter') -> 'Filter':
+        return Connective('AND', self, other)
+
+    def __or__(self, other: 'Filter') -> 'Filter':
+        return Connective('OR', self, other)
+
+
+class Condition(Filter):
+    """
+    Compares a field to a value.
+
+    :param field: Name of the field, as named by the API
+    :param value: Value to compare to. An asterisk matches any number of
+        characters. Enumerations are compared by their value, dates in ISO 8601
+        format.
+    :param relation: One of the relations the API supports: ``equal``,
+        ``unequal``, ``greater``, ``greaterEqual``, ``less`` and ``lessEqual``
+    """
+
+    RELATIONS = frozenset({'equal', 'unequal', 'greater', 'greaterEqual', 'less', 'lessEqual'})
+
+    def __init__(self, field: str, value: Any, relation: str = 'equal') -> None:
+        if relation not in Condition.RELATIONS:
+            raise ValueError(f'Unknown relation "{relation}"')
+        self.field = field
+        self.value = value
+        self.relation = relation
+
+    def to_json(self) -> JsonObject:
+        json_filter: JsonObject = {'field': self.field, 'value': _filter_value(self.value)}
+        # Equality is what the API assumes without a relation.
+        if self.relation != 'equal':
+            json_filter['relation'] = self.relation
+        return json_filter
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.field!r}, {self.value!r}, {self.relation!r})'
+
+
+class Connective(Filter):
+    """
+    Combines filters, which either all (``AND``) or any (``OR``) have to
+    match. Nested connectives of the same kind are flattened.
+
+    :raises ValueError: if no filters are given
+    """
+
+    def __init__(self, connective: Literal['AND', 'OR'], *filters: Filter) -> None:
+        if not filters:
+            raise ValueError('At least one filter is required')
+        self.connective = connective
+        self.filters: list[Filter] = []
+        for filter_ in filters:
+            if isinstance(filter_, Connective) and filter_.connective == connective:
+                self.filters.extend(filter_.filters)
+            else:
+                self.filters.append(filter_)
+
+    def to_json(self) -> JsonObject:
+        if len(self.filters) == 1:
+            return self.filters[0].to_json()
+        return dict(
+            subFilterConnective=self.connective,
+            subFilter=[filter_.to_json() for filter_ in self.filters]
+        )
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.connective!r}, {", ".join(map(repr, self.filters))})'
+
+
+def all_of(*filters: Filter) -> Filter:
+    """Returns a filter that matches if all the given filters match."""
+    return Connective('AND', *filters)
+
+
+def any_of(*filters: Filter) -> Filter:
+    """Returns a filter that matches if any of the given filters matches."""
+    return Connective('OR', *filters)
+
+
+class Field:
+    """
+    A field of the API to build filters with. The comparison operators return
+    :class:`Condition` objects:
+
+    .. code-block:: python
+
+        Field('DomainNameAce') == '*.de'
+        Field('DomainRenewOn') < datetime(2025, 1, 1, tzinfo=timezone.utc)
+        Field('RecordType').is_in(['A', 'AAAA'])
+
+    :param name: Name of the field, as named by the API
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, value: Any) -> Condition:  # type: ignore[override]
+        return Condition(self.name, value)
+
+    def __ne__(self, value: Any) -> Condition:  # type: ignore[override]
+        return Condition(self.name, value, 'unequal')
+
+    def __gt__(self, value: Any) -> Condition:
+        return Condition(self.name, value, 'greater')
+
+    def __ge__(self, value: Any) -> Condition:
+        return Condition(self.name, value, 'greaterEqual')
+
+    def __lt__(self, value: Any) -> Condition:
+        return Condition(self.name, value, 'less')
+
+    def __le__(self, value: Any) -> Condition:
+        return Condition(self.name, value, 'lessEqual')
+
+    def is_in(self, values: Iterable[Any]) -> Filter:
+        """
+        Returns a filter that matches if the field equals any of the values.
+
+        :raises ValueError: if no values are given
+        """
+        conditions = [Condition(self.name, value) for value in values]
+        if not conditions:
+            raise ValueError(f'No values given for field "{self.name}"')
+        return any_of(*conditions)
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _StreamedPage:
+    """
+    Parses a page of a listing while its response arrives, see
+    :meth:`Client.stream`. Iterating over it yields the JSON data structures
+    of the elements of the page as soon as each one is complete. Afterwards,
+    :attr:`body` holds the rest of the page, such as ``totalPages``.
+    """
+
+    # Consumed text is only discarded beyond this many characters, since
+    # discarding it means copying the rest of the buffer.
+    _COMPACTION_THRESHOLD = 64 * 1024
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._complete = False
+        self.response: JsonObject = {}
+        self.body: JsonObject = {}
+
+    def _read(self) -> bool:
+        """Appends the next chunk to the buffer, returns whether there was one."""
+        if self._complete:
+            return False
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                if self._position > _StreamedPage._COMPACTION_THRESHOLD:
+                    self._buffer = self._buffer[self._position:]
+                    self._position = 0
+                self._buffer += text
+                return True
+        self._buffer += self._text_decoder.decode(b'', final=True)
+        self._complete = True
+        return False
+
+    def _peek(self) -> str:
+        """Skips whitespace and returns the next character, or '' at the end."""
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                return ''
+
+    def _expect(self, character: str) -> None:
+        if self._peek() != character:
+            raise ValueError(f'Expected "{character}" at position {self._position} of the response')
+        self._position += 1
+
+    def _value(self) -> Any:
+        """Parses the next value, reading more of the response until it is complete."""
+        self._peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._read():
+                continue
+            self._position = end
+            return value
+
+    def _keys(self) -> Iterator[str]:
+        """
+        Iterates over the keys of the next object. After each key, the caller
+        has to consume its value before continuing the iteration.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._position += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            yield key
+            if self._peek() != ',':
+                self._expect('}')
+                return
+            self._position += 1
+
+    def _items(self) -> Iterator[Any]:
+        self._expect('[')
+        if self._peek() == ']':
+            self._position += 1
+            return
+        while True:
+            yield self._value()
+            if self._peek() != ',':
+                self._expect(']')
+                return
+            self._position += 1
+
+    def __iter__(self) -> Iterator[JsonObject]:
+        """
+        :raises ServiceException: once the page is complete, if the API
+            rejected the request
+        """
+        for key in self._keys():
+            if key == 'response' and self._peek() == '{':
+                body: JsonObject = {}
+                for body_key in self._keys():
+                    if body_key == 'data' and self._peek() == '[':
+                        yield from self._items()
+                    else:
+                        body[body_key] = self._value()
+                self.response[key] = body
+            else:
+                self.response[key] = self._value()
+        _check_response(self.response)
+        self.body = self.response.get('response') or {}
+
+
 T = TypeVar('T', bound=Element)
 
 
@@ -268,6 +1677,182 @@ def _element_class_of(service_class: type) -> Any:
     raise TypeError(f'{service_class.__qualname__} does not specify an element type')
 
 
+def _read_ahead(concurrency: int | None, prefetch: int | None) -> int:
+    """
+    Validates the ``concurrency`` and ``prefetch`` arguments of a listing and
+    returns the number of pages to request ahead.
+    """
+    if concurrency is not None and concurrency < 1:
+        raise ValueError(f'Concurrency must be at least 1, got {concurrency}')
+    if prefetch is not None and prefetch < 0:
+        raise ValueError(f'Prefetch must not be negative, got {prefetch}')
+    if prefetch is None:
+        return concurrency if concurrency is not None and concurrency > 1 else 0
+    return prefetch
+
+
+def _listing_decoder(element_class: type[T], raw: bool, fields: Iterable[str] | None,
+                     lazy: bool) -> Callable[[JsonObject], Any]:
+    """
+    Returns the function that converts the elements of a listing, according to
+    the ``raw``, ``fields`` and ``lazy`` arguments of the listing.
+    """
+    if raw:
+        if fields is not None or lazy:
+            raise ValueError('Fields cannot be selected or converted lazily for a raw listing')
+        return _identity
+    if lazy:
+        if fields is not None:
+            raise ValueError('Fields cannot be selected for a lazy listing')
+        return lambda data: element_class.from_json(data, lazy=True)
+    if fields is not None:
+        selected_fields = frozenset(fields)
+        for field in selected_fields.difference(element_class._fields):
+            raise KeyError(f'No field "{field}" defined in API model "{element_class.__qualname__}"')
+        return lambda data: element_class.from_json(data, fields=selected_fields)
+    return element_class.from_json
+
+
+_Item = TypeVar('_Item')
+
+
+class Listing(Iterator[_Item]):
+    """
+    The result of :meth:`Service.find`: an iterator over the matching
+    elements that also tells how many there are.
+
+    The API reports the totals with every page, so they are known once the
+    first page has been retrieved, and reading them retrieves it if it has
+    not been yet. ``len()`` is the number of elements the listing yields in
+    total and costs no request beyond the first page either. While
+    streaming, the first page is read as it is iterated, so the totals are
+    ``None`` and ``len()`` raises a :exc:`TypeError` until it has been
+    iterated completely. A listing is always true, use ``len()`` to tell
+    whether it is empty.
+    """
+
+    def __init__(self, service: 'Service[Any]', parameters: Mapping[str, Any], page: int | None,
+                 decode: Callable[[JsonObject], _Item], concurrency: int, read_ahead: int,
+                 stream: bool) -> None:
+        self._service = service
+        self._parameters = parameters
+        self._page = page
+        self._decode = decode
+        self._concurrency = concurrency
+        self._read_ahead = read_ahead
+        self._stream = stream
+        # The first page is kept until it is iterated, its totals and length for good.
+        self._first_page: JsonObject | None = None
+        self._totals: tuple[int | None, int | None, int] | None = None
+        self._pages: Iterator[Iterator[_Item]] | None = None
+        self._current: Iterator[_Item] = iter(())
+        self.pages_fetched = 0
+        """Number of pages whose elements have been retrieved so far."""
+
+    def _first(self) -> tuple[int | None, int | None, int] | None:
+        """
+        Returns the total number of elements and pages and the number of
+        elements on the first page, retrieving it unless streaming.
+        """
+        if self._totals is None and not self._stream:
+            first_page = self._service._find_page(self._parameters, self._page or 1)
+            self.pages_fetched += 1
+            self._totals = (first_page.get('totalEntries'), first_page.get('totalPages'),
+                            len(first_page.get('data') or []))
+            self._first_page = first_page
+        return self._totals
+
+    @property
+    def total_entries(self) -> int | None:
+        """Number of elements matching the filters, on all pages."""
+        totals = self._first()
+        return totals[0] if totals is not None else None
+
+    @property
+    def total_pages(self) -> int | None:
+        """Number of pages of the listing."""
+        totals = self._first()
+        return totals[1] if totals is not None else None
+
+    def __len__(self) -> int:
+        totals = self._first()
+        if totals is None:
+            raise TypeError('The length of a streamed listing is known once its first page has been read')
+        total_entries, _, length = totals
+        if self._page:
+            return length
+        return total_entries or 0
+
+    def __bool__(self) -> bool:
+        # A listing is true like any other iterator, also when it is empty,
+        # so that testing it neither makes a request nor fails while streaming.
+        return True
+
+    def _decode_streamed(self, streamed_page: _StreamedPage) -> Iterator[_Item]:
+        length = 0
+        for json_element in streamed_page:
+            length += 1
+            yield self._decode(json_element)
+        self.pages_fetched += 1
+        if self._totals is None:
+            body = streamed_page.body
+            self._totals = (body.get('totalEntries'), body.get('totalPages'), length)
+
+    def _iterate_pages(self) -> Iterator[Iterator[_Item]]:
+        service = self._service
+        if self._stream:
+            for streamed_page in service._stream_pages(self._parameters, self._page):
+                yield self._decode_streamed(streamed_page)
+            return
+        totals = self._first()
+        assert totals is not None
+        # Handed over, so that the listing does not keep the page once it has been iterated.
+        first_page, self._first_page = self._first_page, None
+        assert first_page is not None
+        if self._page:
+            remaining_pages = range(0)
+        else:
+            total_pages = min(totals[1] or 0, Service._MAX_PAGES)
+            remaining_pages = range(2, total_pages + 1)
+        response_bodies = service._find_pages(self._parameters, first_page, remaining_pages,
+                                              concurrency=self._concurrency,
+                                              read_ahead=self._read_ahead if remaining_pages else 0)
+        del first_page
+        for index, response_body in enumerate(response_bodies):
+            if index:
+                self.pages_fetched += 1
+            yield map(self._decode, response_body.get('data') or [])
+
+    def __next__(self) -> _Item:
+        while True:
+            try:
+                return next(self._current)
+            except StopIteration:
+                pass
+            if self._pages is None:
+                self._pages = self._iterate_pages()
+            self._current = next(self._pages)
+
+    def pages(self) -> Iterator[list[_Item]]:
+        """
+        Returns an iterator over the remaining elements, page by page. If the
+        elements of a page have been partly iterated over already, the first
+        list holds the rest of them.
+        """
+        rest = list(self._current)
+        if rest:
+            yield rest
+        if self._pages is None:
+            self._pages = self._iterate_pages()
+        for page in self._pages:
+            yield list(page)
+
+    def close(self) -> None:
+        """Stops retrieving pages, including those requested ahead."""
+        if self._pages is not None:
+            self._pages.close()
+
+
 class Service(Generic[T]):
     _MAX_PAGES = 1000000
 
@@ -321,14 +1906,23 @@ class Service(Generic[T]):
         """
         return f'{self._element_name[0].upper()}{self._element_name[1:]}Id'
 
+    def _element_key(self, data: JsonObject) -> str:
+        """
+        Returns the ID of an element from its JSON data, i.e. the value that
+        :attr:`_find_filter_name` selects the element by.
+        """
+        return data['id']
+
+    def _normalized_key(self, key: str) -> str:
+        """
+        Returns an ID in the form in which IDs are compared, so that e.g. the
+        name of a domain matches regardless of its case.
+        """
+        return key
+
     def _call(self, method: str, parameters: Mapping[str, Any] | None = None) -> JsonObject:
         response = self._client.call(self._service_domain, method, parameters)
-        status = str(response.get('status', '')).lower()
-        if status not in {'success', 'pending'}:
-            errors = response.get('errors') or []
-            error_messages = [f'{error["text"]} ({error["code"]}).' for error in errors]
-            raise ServiceException(' '.join(error_messages) or f'API returned status "{status}".')
-        return response
+        return _check_response(response)
 
     def _get_by_info(self, key: str, /) -> T:
         """
@@ -367,8 +1961,52 @@ class Service(Generic[T]):
         """
         return self._get_by_find(key)
 
+    def get_many(self, keys: Iterable[str], chunk_size: int = 100,
+                 missing_ok: bool = False) -> dict[str, T]:
+        """
+        Retrieves several elements by their IDs.
+
+        Instead of one request per element as with :meth:`get`, the listing is
+        filtered for up to ``chunk_size`` IDs at once.
+
+        :param keys: IDs of the elements, or whatever else :meth:`get` of the
+            service accepts, such as the names of domains, which match
+            regardless of their case and a trailing dot
+        :param chunk_size: Number of IDs to filter for per request
+        :param missing_ok: Whether to leave out IDs of which no element exists
+            instead of raising
+        :return: Dictionary from the IDs to the elements, in the order of
+            ``keys``
+        :raises ValueError: if ``chunk_size`` is less than 1
+        :raises KeyError: if no element exists for some of the IDs and
+            ``missing_ok`` is false. Its argument is the list of these IDs.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1, not {chunk_size}')
+        keys = list(dict.fromkeys(keys))
+        normalized_keys = list(dict.fromkeys(self._normalized_key(key) for key in keys))
+        json_elements: dict[str, JsonObject] = {}
+        for start in range(0, len(normalized_keys), chunk_size):
+            chunk = normalized_keys[start:start + chunk_size]
+            parameters = self._find_parameters(limit=len(chunk), where=Field(self._find_filter_name).is_in(chunk))
+            page = 1
+            while True:
+                response_body = self._find_page(parameters, page)
+                for json_element in (response_body.get('data') or []):
+                    json_elements[self._normalized_key(self._element_key(json_element))] = json_element
+                if page >= min(response_body.get('totalPages', 0), Service._MAX_PAGES):
+                    break
+                page += 1
+        missing_keys = [key for key in keys if self._normalized_key(key) not in json_elements]
+        if missing_keys and not missing_ok:
+            raise KeyError(missing_keys)
+        return {
+            key: self._element_class.from_json(json_elements[self._normalized_key(key)])
+            for key in keys if self._normalized_key(key) in json_elements
+        }
+
     def _find_parameters(self, limit: int | None = None, sort: str | None = None,
-                         filters: Mapping[str, Any] | None = None) -> JsonObject:
+                         filters: Mapping[str, Any] | None = None, where: Filter | None = None) -> JsonObject:
         parameters: JsonObject = {}
         if limit:
             parameters['limit'] = limit
@@ -378,63 +2016,173 @@ class Service(Generic[T]):
             else:
                 sort_params = dict(field=sort, order='asc')
             parameters['sort'] = sort_params
-        if filters:
+        if where is not None:
+            if filters:
+                where = all_of(*(Condition(field, value) for field, value in filters.items()), where)
+            parameters['filter'] = where.to_json()
+        elif filters:
             parameters['filter'] = dict(
                 subFilterConnective='AND',
-                subFilter=[
-                    dict(field=field, value=json.dumps(value).strip('"').replace(r'\"', '"'))
-                    for field, value in filters.items()
-                ]
+                subFilter=[dict(field=field, value=_filter_value(value)) for field, value in filters.items()]
             )
         return parameters
 
+    def _find_page(self, parameters: Mapping[str, Any], page: int) -> JsonObject:
+        """
+        Retrieves a single page of a listing.
+
+        :param parameters: Parameters of the listing as built by
+            :meth:`_find_parameters`
+        :param page: Number of the page, starting at 1
+        :return: Body of the response, i.e. the page including ``data`` and
+            ``totalPages``
+        """
+        response = self._call(
+            method=self._find_method_name,
+            parameters={**parameters, 'page': page}
+        )
+        return response.get('response', {})
+
+    def _stream_pages(self, parameters: Mapping[str, Any], page: int | None) -> Iterator[_StreamedPage]:
+        """
+        Requests the pages of a listing one after another, streaming their
+        responses, see :class:`_StreamedPage`. A page has to be iterated
+        before the next one is requested.
+
+        :param parameters: Parameters of the listing as built by
+            :meth:`_find_parameters`
+        :param page: Number of the only page to retrieve, or ``None`` for all
+        """
+        page_number = page or 1
+        while True:
+            streamed_page = _StreamedPage(self._client.stream(
+                self._service_domain, self._find_method_name, {**parameters, 'page': page_number}))
+            yield streamed_page
+            if page or page_number >= min(streamed_page.body.get('totalPages', 0), Service._MAX_PAGES):
+                return
+            page_number += 1
+
+    def _find_pages(self, parameters: Mapping[str, Any], first_page: JsonObject, pages: Iterable[int],
+                    concurrency: int, read_ahead: int) -> Iterator[JsonObject]:
+        """
+        Yields ``first_page``, which has already been retrieved, followed by the
+        given further pages. These are retrieved in the background through a
+        pool of ``concurrency`` threads, starting before ``first_page`` is
+        yielded, and are yielded in the order of ``pages``. No more than
+        ``read_ahead`` pages are requested ahead of the one that is yielded, so
+        a slow consumer does not cause the whole listing to pile up in memory.
+        Without ``read_ahead``, each page is retrieved when it is needed.
+        """
+        pages = iter(pages)
+        if not read_ahead:
+            yield first_page
+            del first_page
+            for page in pages:
+                yield self._find_page(parameters, page)
+            return
+        pending: deque[Future[JsonObject]] = deque()
+        executor = ThreadPoolExecutor(max_workers=min(concurrency, read_ahead),
+                                      thread_name_prefix=f'{type(self).__name__}.find')
+        try:
+            for page in itertools.islice(pages, read_ahead):
+                pending.append(executor.submit(self._find_page, parameters, page))
+            yield first_page
+            del first_page
+            while pending:
+                response_body = pending.popleft().result()
+                # Request the next page before handing out this one, so that the
+                # consumer's work overlaps with the request.
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(executor.submit(self._find_page, parameters, next_page))
+                yield response_body
+        finally:
+            # Pages that have not been started yet are not needed any more if
+            # the consumer stops early or a request fails.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @overload
     def find(self, limit: int | None = None, page: int | None = None,
-             sort: str | None = None, **filters) -> Iterator[T]:
+             sort: str | None = None, concurrency: int | None = None,
+             prefetch: int | None = None, *, raw: Literal[True],
+             where: Filter | None = None, stream: bool = False, **filters) -> 'Listing[JsonObject]': ...
+
+    @overload
+    def find(self, limit: int | None = None, page: int | None = None,
+             sort: str | None = None, concurrency: int | None = None,
+             prefetch: int | None = None, *, raw: Literal[False] = False,
+             fields: Iterable[str] | None = None, lazy: bool = False,
+             where: Filter | None = None, stream: bool = False, **filters) -> 'Listing[T]': ...
+
+    def find(self, limit: int | None = None, page: int | None = None,
+             sort: str | None = None, concurrency: int | None = None,
+             prefetch: int | None = None, *, raw: bool = False,
+             fields: Iterable[str] | None = None, lazy: bool = False,
+             where: Filter | None = None, stream: bool = False,
+             **filters) -> 'Listing[T] | Listing[JsonObject]':
         """
         Retrieves all elements matching the given filters. The results are
-        fetched page by page while the returned iterator is consumed.
+        fetched page by page while the returned iterator is consumed. The
+        iterator, a :class:`Listing`, also tells the number of matching
+        elements without a request of its own.
 
         :param limit: Number of elements per request, the API defaults to 25
         :param page: Number of the only page to retrieve. By default all pages
             are retrieved.
         :param sort: Name of the field to sort by, prefixed with ``~`` for
             descending order
+        :param concurrency: Number of pages to retrieve in parallel once the
+            first page has reported the total number of pages. The elements are
+            still yielded in the order of the pages. By default the pages are
+            retrieved one after another.
+        :param prefetch: Number of pages to request in the background while the
+            elements of the current page are consumed. Defaults to
+            ``concurrency`` if that is given, otherwise no pages are requested
+            ahead.
+        :param raw: Whether to yield the JSON data structures of the elements
+            as the API returned them, instead of elements
+        :param fields: Names of the only fields to convert, see
+            :meth:`Element.from_json`. The other fields of the elements are
+            ``None``.
+        :param lazy: Whether to convert the fields of the elements only when
+            they are read, see :meth:`Element.from_json`
+        :param where: Filter the elements have to match, see :class:`Filter`
+        :param stream: Whether to yield the elements of a page while its
+            response is still arriving, instead of once it is complete. Only
+            one element at a time is held in memory then, rather than the whole
+            page. Pages cannot be requested ahead in this mode.
         :param filters: Field names and values to filter by, as named by the
-            API. An asterisk in a value matches any number of characters.
-        :return: Iterator over the matching elements
+            API. An asterisk in a value matches any number of characters. They
+            have to match in addition to ``where``.
+        :return: Listing of the matching elements
+        :raises ValueError: if ``concurrency`` is less than 1, ``prefetch``
+            is negative, ``raw``, ``fields`` and ``lazy`` are combined, or
+            ``stream`` is combined with ``concurrency`` or ``prefetch``
+        :raises KeyError: if ``fields`` names a field the element does not
+            declare
         """
-        parameters = self._find_parameters(limit=limit, sort=sort, filters=filters)
-        if page:
-            page_range = range(page, page + 1)
-        else:
-            page_range = range(1, Service._MAX_PAGES)
-        for page in page_range:
-            parameters['page'] = page
-            response = self._call(
-                method=self._find_method_name,
-                parameters=parameters
-            )
-            response_body = response.get('response', {})
-            for json_element in (response_body.get('data') or []):
-                element = self._element_class.from_json(json_element)
-                yield element
-            total_pages = response_body.get('totalPages', 0)
-            if total_pages == 0 or page == total_pages:
-                break
-
-    def count(self, sort: str | None = None, **filters) -> int:
+        prefetch = _read_ahead(concurrency, prefetch)
+        decode = _listing_decoder(self._element_class, raw, fields, lazy)
+        if stream and prefetch:
+            raise ValueError('Pages cannot be requested ahead while streaming')
+        parameters = self._find_parameters(limit=limit, sort=sort, filters=filters, where=where)
+        return Listing(self, parameters, page, decode, concurrency=concurrency or 1, read_ahead=prefetch,
+                       stream=stream)
+
+    def count(self, sort: str | None = None, *, where: Filter | None = None, **filters) -> int:
         """
         Returns the number of elements matching the given filters without
         retrieving them. This is a single request, the API reports the total
         number of matches for every listing.
 
         :param sort: Name of the field to sort by, ignored for the result
+        :param where: Filter the elements have to match, see :class:`Filter`
         :param filters: Field names and values to filter by
         :return: Number of matching elements
         """
         response = self._call(
             method=self._find_method_name,
-            parameters={**self._find_parameters(limit=1, sort=sort, filters=filters), 'page': 1}
+            parameters={**self._find_parameters(limit=1, sort=sort, filters=filters, where=where), 'page': 1}
         )
         return response.get('response', {}).get('totalEntries', 0)
 
@@ -518,3 +2266,201 @@ class CrudService(CreatableService[T], UpdatableService[T], DeletableService[T])
     Services that deviate from it derive from :class:`Service` or from the
     individual base classes and declare their own methods.
     """
+
+
+class AsyncService(Generic[T]):
+    """
+    Asynchronous counterpart of :class:`Service`. It wraps a synchronous
+    service, from which it takes the names of the methods and the parameters of
+    the listings, and makes the same requests through
+    :meth:`AsyncClient.call_async`. The elements are the same as those of the
+    synchronous service.
+    """
+
+    def __init__(self, service: Service[T]) -> None:
+        if not isinstance(service._client, AsyncClient):
+            raise TypeError(f'{type(service).__qualname__} has to be created with an AsyncClient')
+        self._service = service
+        self._client: AsyncClient = service._client
+        self._element_class: type[T] = service._element_class
+
+    async def _call(self, method: str, parameters: Mapping[str, Any] | None = None) -> JsonObject:
+        response = await self._client.call_async(self._service._service_domain, method, parameters)
+        return _check_response(response)
+
+    async def _get_by_info(self, key: str, /) -> T:
+        """
+        Retrieves a single element through the ``<element>Info`` method, see
+        :meth:`Service._get_by_info`.
+        """
+        response = await self._call(
+            method=self._service._get_method_name,
+            parameters={self._service._id_name: key}
+        )
+        return self._element_class.from_json(response['response'])
+
+    async def _get_by_find(self, key: str, /) -> T:
+        """
+        Retrieves a single element by filtering the listing for its ID, see
+        :meth:`Service._get_by_find`.
+        """
+        filters: dict[str, Any] = {self._service._find_filter_name: key}
+        async for element in self.find(limit=1, page=1, **filters):
+            return element
+        raise KeyError(key)
+
+    async def get(self, key: str, /) -> T:
+        """
+        Retrieves a single element by its ID, see :meth:`Service.get`.
+
+        :param key: ID of the element
+        :return: The element
+        :raises KeyError: if no element with this ID exists
+        """
+        return await self._get_by_find(key)
+
+    async def _find_page(self, parameters: Mapping[str, Any], page: int) -> JsonObject:
+        response = await self._call(
+            method=self._service._find_method_name,
+            parameters={**parameters, 'page': page}
+        )
+        return response.get('response', {})
+
+    async def find(self, limit: int | None = None, page: int | None = None,
+                   sort: str | None = None, concurrency: int | None = None,
+                   prefetch: int | None = None, *, raw: bool = False,
+                   fields: Iterable[str] | None = None, lazy: bool = False,
+                   where: Filter | None = None, **filters) -> AsyncIterator[Any]:
+        """
+        Retrieves all elements matching the given filters, see
+        :meth:`Service.find` for the parameters. The pages that are requested
+        ahead are requested as tasks of the running event loop, at most
+        ``concurrency`` of them at a time.
+
+        :return: Asynchronous iterator over the matching elements
+        :raises ValueError: if ``concurrency`` is less than 1 or ``prefetch``
+            is negative
+        :raises TypeError: if a keyword argument is not the name of a field,
+            e.g. ``stream``, which only :meth:`Service.find` supports
+        """
+        for name in filters:
+            # The fields of the API are capitalized, anything else is an argument
+            # this method does not take rather than a filter.
+            if not name[:1].isupper():
+                raise TypeError(f"find() got an unexpected keyword argument '{name}'")
+        prefetch = _read_ahead(concurrency, prefetch)
+        decode = _listing_decoder(self._element_class, raw, fields, lazy)
+        parameters = self._service._find_parameters(limit=limit, sort=sort, filters=filters, where=where)
+        first_page = await self._find_page(parameters, page or 1)
+        if page:
+            remaining_pages = range(0)
+        else:
+            total_pages = min(first_page.get('totalPages', 0), Service._MAX_PAGES)
+            remaining_pages = range(2, total_pages + 1)
+        if not prefetch:
+            for json_element in (first_page.get('data') or []):
+                yield decode(json_element)
+            # Not kept while the further pages are iterated.
+            del first_page
+            for page in remaining_pages:
+                response_body = await self._find_page(parameters, page)
+                for json_element in (response_body.get('data') or []):
+                    yield decode(json_element)
+            return
+
+        semaphore = asyncio.Semaphore(concurrency or 1)
+
+        async def find_page(page: int) -> JsonObject:
+            async with semaphore:
+                return await self._find_page(parameters, page)
+
+        pages = iter(remaining_pages)
+        pending: deque[asyncio.Task[JsonObject]] = deque(
+            asyncio.create_task(find_page(page)) for page in itertools.islice(pages, prefetch))
+        try:
+            for json_element in (first_page.get('data') or []):
+                yield decode(json_element)
+            del first_page
+            while pending:
+                response_body = await pending.popleft()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(asyncio.create_task(find_page(next_page)))
+                for json_element in (response_body.get('data') or []):
+                    yield decode(json_element)
+        finally:
+            for task in pending:
+                task.cancel()
+            # Wait for the tasks, so that the exceptions of failed pages are
+            # retrieved rather than logged.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def count(self, sort: str | None = None, *, where: Filter | None = None, **filters) -> int:
+        """
+        Returns the number of elements matching the given filters without
+        retrieving them, see :meth:`Service.count`.
+
+        :param sort: Name of the field to sort by, ignored for the result
+        :param where: Filter the elements have to match, see :class:`Filter`
+        :param filters: Field names and values to filter by
+        :return: Number of matching elements
+        """
+        response_body = await self._find_page(
+            self._service._find_parameters(limit=1, sort=sort, filters=filters, where=where), 1)
+        return response_body.get('totalEntries', 0)
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.find()
+
+
+class AsyncCreatableService(AsyncService[T]):
+    """Asynchronous counterpart of :class:`CreatableService`."""
+
+    async def create(self, element: T, /) -> T:
+        """
+        Creates a new element, see :meth:`CreatableService.create`.
+
+        :param element: Complete element to be created. Its ID is ignored.
+        :return: The created element as stored by the API
+        """
+        response = await self._call(
+            method=self._service._create_method_name,
+            parameters={self._service._element_name: element.to_json()}
+        )
+        return self._element_class.from_json(response.get('response', {}))
+
+
+class AsyncUpdatableService(AsyncService[T]):
+    """Asynchronous counterpart of :class:`UpdatableService`."""
+
+    async def update(self, element: T, /) -> T:
+        """
+        Updates an existing element, see :meth:`UpdatableService.update`.
+
+        :param element: Complete element with the new values
+        :return: The updated element as stored by the API
+        """
+        response = await self._call(
+            method=self._service._update_method_name,
+            parameters={self._service._element_name: element.to_json()}
+        )
+        return self._element_class.from_json(response.get('response', {}))
+
+
+class AsyncDeletableService(AsyncService[T]):
+    """Asynchronous counterpart of :class:`DeletableService`."""
+
+    async def delete(self, key: str, /) -> None:
+        """
+        Deletes an element.
+
+        :param key: ID of the element to be deleted
+        """
+        await self._call(
+            method=self._service._delete_method_name,
+            parameters={self._service._id_name: key}
+        )
+
+
+class AsyncCrudService(AsyncCreatableService[T], AsyncUpdatableService[T], AsyncDeletableService[T]):
+    """Asynchronous counterpart of :class:`CrudService`."""
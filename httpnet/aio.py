@@ -0,0 +1,373 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from datetime import datetime
+
+from ._core import (
+    AsyncClient,
+    AsyncCrudService,
+    AsyncService,
+    AsyncUpdatableService,
+    JsonObject,
+    Platform,
+    RateLimiter,
+    RequestCompression,
+    ResponseCache,
+    RetryPolicy,
+)
+from .dns import (
+    DnsRecord,
+    NameserverSet,
+    NameserverSetService,
+    RecordService,
+    RecordTemplate,
+    RecordType,
+    Template,
+    TemplateReplacements,
+    TemplateService,
+    Zone,
+    ZoneChanges,
+    ZoneConfig,
+    ZoneConfigService,
+    ZoneService,
+    ZoneUpdateResult,
+    _record_changes,
+    _template_parameters,
+    _template_selection,
+    _template_update_parameters,
+    _zone_config_selection,
+    _zone_parameters,
+    _zone_update_parameters,
+)
+from .domain import Contact, ContactService, Domain, DomainService, DomainStatusResult, Job, JobService, TransferData
+from .email import (
+    DomainSettings,
+    DomainSettingsService,
+    Mailbox,
+    MailboxService,
+    Organization,
+    OrganizationService,
+    _mailbox_selection,
+)
+
+__all__ = [
+    'AsyncDomainService',
+    'AsyncHttpNetClient',
+    'AsyncMailboxService',
+    'AsyncNameserverSetService',
+    'AsyncTemplateService',
+    'AsyncZoneService',
+    'Platform',
+]
+
+
+class AsyncDomainService(AsyncService[Domain]):
+    """Asynchronous counterpart of :class:`~httpnet.domain.DomainService`."""
+
+    async def get(self, key: str, /) -> Domain:
+        """
+        Retrieves a domain by its name through the ``domainInfo`` method, see
+        :meth:`~httpnet.domain.DomainService.get`.
+
+        :param key: Name of the domain
+        :return: The domain
+        :raises ServiceException: if no domain with this name exists
+        """
+        return await self._get_by_info(key)
+
+    async def status(self, *names: str) -> list[DomainStatusResult]:
+        """See :meth:`~httpnet.domain.DomainService.status`."""
+        response = await self._call(
+            method='domainStatus',
+            parameters={'domainNames': list(names)}
+        )
+        return [DomainStatusResult.from_json(dsr) for dsr in response.get('responses', [])]
+
+    async def delete(self, name: str, exec_date: datetime | None = None) -> None:
+        """See :meth:`~httpnet.domain.DomainService.delete`."""
+        parameters: JsonObject = {'domainName': name}
+        if exec_date is not None:
+            parameters['execDate'] = exec_date.isoformat()
+        await self._call(method='domainDelete', parameters=parameters)
+
+    async def withdraw(self, name: str, disconnect: bool, exec_date: datetime | None = None) -> None:
+        """See :meth:`~httpnet.domain.DomainService.withdraw`."""
+        parameters: JsonObject = {'domainName': name, 'disconnect': disconnect}
+        if exec_date is not None:
+            parameters['execDate'] = exec_date.isoformat()
+        await self._call(method='domainWithdraw', parameters=parameters)
+
+    async def cancel_deletion(self, name: str) -> None:
+        """See :meth:`~httpnet.domain.DomainService.cancel_deletion`."""
+        await self._call(method='domainDeletionCancel', parameters={'domainName': name})
+
+    async def transfer(self, domain: Domain, transfer_data: TransferData) -> None:
+        """See :meth:`~httpnet.domain.DomainService.transfer`."""
+        await self._call(
+            method='domainTransfer',
+            parameters={'domain': domain.to_json(), 'transferData': transfer_data.to_json()}
+        )
+
+    async def acknowledge_transfer(self, name: str) -> None:
+        """See :meth:`~httpnet.domain.DomainService.acknowledge_transfer`."""
+        await self._call(method='domainTransferOutAck', parameters={'domainName': name})
+
+    async def restore(self, name: str) -> None:
+        """See :meth:`~httpnet.domain.DomainService.restore`."""
+        await self._call(method='domainRestore', parameters={'domainName': name})
+
+    async def request_authinfo2(self, name: str) -> None:
+        """See :meth:`~httpnet.domain.DomainService.request_authinfo2`."""
+        await self._call(method='domainCreateAuthInfo2', parameters={'domainName': name})
+
+
+class AsyncZoneService(AsyncService[Zone]):
+    """Asynchronous counterpart of :class:`~httpnet.dns.ZoneService`."""
+
+    async def create(self, zone: Zone, nameserver_set_id: str | None = None,
+                     use_default_nameserver_set: bool | None = None) -> Zone:
+        """See :meth:`~httpnet.dns.ZoneService.create`."""
+        response = await self._call(
+            method='zoneCreate',
+            parameters=_zone_parameters(zone, nameserver_set_id, use_default_nameserver_set)
+        )
+        return Zone.from_json(response.get('response', {}))
+
+    async def recreate(self, zone: Zone, nameserver_set_id: str | None = None,
+                       use_default_nameserver_set: bool | None = None) -> Zone:
+        """See :meth:`~httpnet.dns.ZoneService.recreate`."""
+        response = await self._call(
+            method='zoneRecreate',
+            parameters=_zone_parameters(zone, nameserver_set_id, use_default_nameserver_set)
+        )
+        return Zone.from_json(response.get('response', {}))
+
+    async def update(self, zone_config: ZoneConfig, records_to_add: Iterable[DnsRecord] = (),
+                     records_to_delete: Iterable[DnsRecord] = (),
+                     records_to_modify: Iterable[DnsRecord] = (), *,
+                     max_records: int | None = None, max_bytes: int | None = None) -> Zone:
+        """See :meth:`~httpnet.dns.ZoneService.update`."""
+        response: JsonObject = {}
+        for parameters in _zone_update_parameters(zone_config, records_to_add, records_to_delete,
+                                                  records_to_modify, max_records, max_bytes):
+            response = await self._call(method='zoneUpdate', parameters=parameters)
+        return Zone.from_json(response.get('response', {}))
+
+    async def update_many(self, changes: Iterable[ZoneChanges], concurrency: int = 4,
+                          progress: Callable[[ZoneUpdateResult, int, int], None] | None = None) \
+            -> list[ZoneUpdateResult]:
+        """
+        See :meth:`~httpnet.dns.ZoneService.update_many`. The updates are made
+        as tasks of the running event loop, at most ``concurrency`` of them at
+        a time.
+        """
+        if concurrency < 1:
+            raise ValueError(f'Concurrency must be at least 1, got {concurrency}')
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def update(zone_changes: ZoneChanges) -> ZoneUpdateResult:
+            zone_config, records_to_add, records_to_modify, records_to_delete = zone_changes
+            async with semaphore:
+                try:
+                    zone = await self.update(zone_config, records_to_add=records_to_add,
+                                             records_to_delete=records_to_delete, records_to_modify=records_to_modify)
+                except Exception as e:
+                    return ZoneUpdateResult(zone_config, error=e)
+            return ZoneUpdateResult(zone_config, zone=zone)
+
+        tasks = [asyncio.ensure_future(update(zone_changes)) for zone_changes in changes]
+        if progress is not None:
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                progress(await task, done, len(tasks))
+        return list(await asyncio.gather(*tasks))
+
+    async def sync(self, zone_config: ZoneConfig, desired_records: Iterable[DnsRecord]) -> Zone:
+        """See :meth:`~httpnet.dns.ZoneService.sync`."""
+        if not zone_config.id:
+            raise ValueError('The zone config has no ID')
+        zone = await self.get(zone_config.id)
+        records_to_add, records_to_modify, records_to_delete = _record_changes(zone, desired_records)
+        if not (records_to_add or records_to_modify or records_to_delete):
+            return zone
+        return await self.update(zone_config, records_to_add=records_to_add, records_to_delete=records_to_delete,
+                                 records_to_modify=records_to_modify)
+
+    async def delete(self, zone_config_id: str) -> None:
+        """See :meth:`~httpnet.dns.ZoneService.delete`."""
+        await self._call(method='zoneDelete', parameters={'zoneConfigId': zone_config_id})
+
+    async def purge_restorable(self, zone_config_id: str) -> None:
+        """See :meth:`~httpnet.dns.ZoneService.purge_restorable`."""
+        await self._call(method='zonePurgeRestorable', parameters={'zoneConfigId': zone_config_id})
+
+    async def change_content(self, record_type: RecordType, old_content: str, new_content: str,
+                             include_templates: bool, include_sub_accounts: bool) -> None:
+        """See :meth:`~httpnet.dns.ZoneService.change_content`."""
+        await self._call(
+            method='changeContent',
+            parameters={
+                'recordType': record_type,
+                'oldContent': old_content,
+                'newContent': new_content,
+                'includeTemplates': include_templates,
+                'includeSubAccounts': include_sub_accounts,
+            }
+        )
+
+    async def untie_from_templates(self, zone_config_ids: Iterable[str] | None = None,
+                                   zone_config_names: Iterable[str] | None = None) -> None:
+        """See :meth:`~httpnet.dns.ZoneService.untie_from_templates`."""
+        await self._call(
+            method='zonesUntieFromTemplates',
+            parameters=_zone_config_selection(zone_config_ids, zone_config_names)
+        )
+
+    async def tie_to_templates(self, zone_config_ids: Iterable[str] | None = None,
+                               zone_config_names: Iterable[str] | None = None) -> None:
+        """See :meth:`~httpnet.dns.ZoneService.tie_to_templates`."""
+        await self._call(
+            method='zonesTieToTemplates',
+            parameters=_zone_config_selection(zone_config_ids, zone_config_names)
+        )
+
+
+class AsyncNameserverSetService(AsyncCrudService[NameserverSet]):
+    """Asynchronous counterpart of :class:`~httpnet.dns.NameserverSetService`."""
+
+    async def get_default(self) -> NameserverSet:
+        """See :meth:`~httpnet.dns.NameserverSetService.get_default`."""
+        response = await self._call(method='nameserverSetGetDefault')
+        return NameserverSet.from_json(response.get('response', {}))
+
+
+class AsyncTemplateService(AsyncService[Template]):
+    """Asynchronous counterpart of :class:`~httpnet.dns.TemplateService`."""
+
+    async def create(self, template: Template, record_templates: Iterable[RecordTemplate]) -> Template:
+        """See :meth:`~httpnet.dns.TemplateService.create`."""
+        response = await self._call(
+            method='templateCreate',
+            parameters=_template_parameters(template, record_templates, None)
+        )
+        return Template.from_json(response.get('response', {}))
+
+    async def recreate(self, template: Template, record_templates: Iterable[RecordTemplate],
+                       replacements: TemplateReplacements | None = None) -> Template:
+        """See :meth:`~httpnet.dns.TemplateService.recreate`."""
+        response = await self._call(
+            method='templateRecreate',
+            parameters=_template_parameters(template, record_templates, replacements)
+        )
+        return Template.from_json(response.get('response', {}))
+
+    async def update(self, template: Template,
+                     record_templates_to_add: Iterable[RecordTemplate],
+                     record_templates_to_delete: Iterable[RecordTemplate],
+                     replacements: TemplateReplacements | None = None, *,
+                     max_records: int | None = None, max_bytes: int | None = None) -> Template:
+        """See :meth:`~httpnet.dns.TemplateService.update`."""
+        response: JsonObject = {}
+        for parameters in _template_update_parameters(template, record_templates_to_add, record_templates_to_delete,
+                                                      replacements, max_records, max_bytes):
+            response = await self._call(method='templateUpdate', parameters=parameters)
+        return Template.from_json(response.get('response', {}))
+
+    async def delete(self, template_id: str | None = None, template_name: str | None = None) -> None:
+        """See :meth:`~httpnet.dns.TemplateService.delete`."""
+        await self._call(method='templateDelete', parameters=_template_selection(template_id, template_name))
+
+
+class AsyncMailboxService(AsyncService[Mailbox]):
+    """Asynchronous counterpart of :class:`~httpnet.email.MailboxService`."""
+
+    async def delete(self, mailbox_id: str | None = None, email_address: str | None = None,
+                     exec_date: datetime | None = None) -> None:
+        """See :meth:`~httpnet.email.MailboxService.delete`."""
+        parameters = _mailbox_selection(mailbox_id, email_address)
+        if exec_date is not None:
+            parameters['execDate'] = exec_date.isoformat()
+        await self._call(method='mailboxDelete', parameters=parameters)
+
+    async def cancel_deletion(self, mailbox_id: str | None = None, email_address: str | None = None) -> Mailbox:
+        """See :meth:`~httpnet.email.MailboxService.cancel_deletion`."""
+        response = await self._call(
+            method='mailboxDeletionCancel',
+            parameters=_mailbox_selection(mailbox_id, email_address)
+        )
+        return Mailbox.from_json(response.get('response', {}))
+
+    async def restore(self, mailbox_id: str | None = None, email_address: str | None = None) -> Mailbox:
+        """See :meth:`~httpnet.email.MailboxService.restore`."""
+        response = await self._call(
+            method='mailboxRestore',
+            parameters=_mailbox_selection(mailbox_id, email_address)
+        )
+        return Mailbox.from_json(response.get('response', {}))
+
+    async def purge_restorable(self, mailbox_id: str | None = None, email_address: str | None = None) -> None:
+        """See :meth:`~httpnet.email.MailboxService.purge_restorable`."""
+        await self._call(
+            method='mailboxPurgeRestorable',
+            parameters=_mailbox_selection(mailbox_id, email_address)
+        )
+
+
+class AsyncHttpNetClient:
+    """
+    An asynchronous client for the http.net Partner API.
+
+    It offers the same services as :class:`~httpnet.client.HttpNetClient`,
+    whose operations can be awaited, including those specific to a service
+    such as :meth:`AsyncZoneService.update`. ``find`` is iterated with
+    ``async for``. All requests share one pool of
+    connections, so many of them can be made concurrently, e.g. with
+    :func:`asyncio.gather`, from a single thread.
+
+    The client has to be closed with :meth:`aclose`, or be used as an
+    asynchronous context manager. Reading requests can be cached by passing a
+    :class:`~httpnet.client.ResponseCache` as ``cache``, and are retried
+    according to ``retry``. A :class:`~httpnet.client.RateLimiter` passed as
+    ``limiter`` can be shared with synchronous clients. With ``coalesce``,
+    tasks that make the same reading request at the same time share one
+    request. ``compression`` and :attr:`stats` are those of
+    :class:`~httpnet.client.HttpNetClient`.
+    """
+
+    def __init__(self, auth_token: str, owner_account_id: str | None = None,
+                 timeout: float | tuple[float, float] | None = None,
+                 base_url: Platform | str = Platform.HTTP_NET,
+                 cache: ResponseCache | None = None, retry: RetryPolicy | None = None,
+                 limiter: RateLimiter | None = None, coalesce: bool = False,
+                 compression: RequestCompression | None = None) -> None:
+        self.__client = AsyncClient(auth_token, owner_account_id=owner_account_id, timeout=timeout,
+                                    base_url=base_url, cache=cache, retry=retry, limiter=limiter,
+                                    coalesce=coalesce, compression=compression)
+        self.stats = self.__client.stats
+
+        # Domains
+        self.domains = AsyncDomainService(DomainService(self.__client))
+        self.domain_contacts: AsyncService[Contact] = AsyncService(ContactService(self.__client))
+        self.domain_jobs: AsyncService[Job] = AsyncService(JobService(self.__client))
+
+        # DNS
+        self.dns_zone_configs: AsyncService[ZoneConfig] = AsyncService(ZoneConfigService(self.__client))
+        self.dns_records: AsyncService[DnsRecord] = AsyncService(RecordService(self.__client))
+        self.dns_zones = AsyncZoneService(ZoneService(self.__client))
+        self.nameserver_sets = AsyncNameserverSetService(NameserverSetService(self.__client))
+        self.dns_templates = AsyncTemplateService(TemplateService(self.__client))
+
+        # Email
+        self.mailboxes = AsyncMailboxService(MailboxService(self.__client))
+        self.email_organizations: AsyncCrudService[Organization] = \
+            AsyncCrudService(OrganizationService(self.__client))
+        self.email_domain_settings: AsyncUpdatableService[DomainSettings] = \
+            AsyncUpdatableService(DomainSettingsService(self.__client))
+
+    async def aclose(self) -> None:
+        """Closes the connections of the client."""
+        await self.__client.aclose()
+
+    async def __aenter__(self) -> 'AsyncHttpNetClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
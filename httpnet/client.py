@@ -1,9 +1,41 @@
-from ._core import Client, Platform
+from ._core import (
+    Client,
+    Condition,
+    Connective,
+    Field,
+    Filter,
+    Platform,
+    RateLimiter,
+    RequestCompression,
+    RequestsTransport,
+    ResponseCache,
+    RetryPolicy,
+    TransferStats,
+    Transport,
+    all_of,
+    any_of,
+)
 from .dns import NameserverSetService, RecordService, TemplateService, ZoneConfigService, ZoneService
 from .domain import ContactService, DomainService, JobService
 from .email import DomainSettingsService, MailboxService, OrganizationService
 
-__all__ = ['HttpNetClient', 'Platform']
+__all__ = [
+    'Condition',
+    'Connective',
+    'Field',
+    'Filter',
+    'HttpNetClient',
+    'Platform',
+    'RateLimiter',
+    'RequestCompression',
+    'RequestsTransport',
+    'ResponseCache',
+    'RetryPolicy',
+    'TransferStats',
+    'Transport',
+    'all_of',
+    'any_of',
+]
 
 
 class HttpNetClient:
@@ -12,13 +44,32 @@ class HttpNetClient:
 
     The same API is operated for hosting.de, pass ``Platform.HOSTING_DE`` as
     ``base_url`` to use it.
+
+    All services share the connections of the client, which can be shared by
+    several threads. Pass a :class:`RequestsTransport` with a larger
+    ``pool_size`` as ``transport`` when more than ten threads use it at once.
+
+    Pass a :class:`ResponseCache` as ``cache`` to answer repeated reading
+    requests of all services from it. Failed reading requests are retried
+    according to ``retry``, see :class:`RetryPolicy`. Pass a
+    :class:`RateLimiter` as ``limiter`` to stay within the rate limits of the
+    API when several threads use the client. With ``coalesce``, threads that
+    make the same reading request at the same time share one request. Pass
+    a :class:`RequestCompression` as ``compression`` to compress large zone
+    updates, and see :attr:`stats` for the bytes compression saved.
     """
 
     def __init__(self, auth_token: str, owner_account_id: str | None = None,
                  timeout: float | tuple[float, float] | None = None,
-                 base_url: Platform | str = Platform.HTTP_NET) -> None:
+                 base_url: Platform | str = Platform.HTTP_NET,
+                 transport: Transport | None = None, cache: ResponseCache | None = None,
+                 retry: RetryPolicy | None = None, limiter: RateLimiter | None = None,
+                 coalesce: bool = False, compression: RequestCompression | None = None) -> None:
         self.__client = Client(auth_token, owner_account_id=owner_account_id, timeout=timeout,
-                               base_url=base_url)
+                               base_url=base_url, transport=transport, cache=cache, retry=retry,
+                               limiter=limiter, coalesce=coalesce, compression=compression)
+
+        self.stats = self.__client.stats
 
         # Domains
         self.domains = DomainService(self.__client)
@@ -1,8 +1,9 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from enum import Enum
 
-from httpnet._core import CrudService, Element, Service
+from httpnet._core import CrudService, Element, JsonObject, Service, _json_dumps
 
 
 class SoaValues(Element):
@@ -113,6 +114,184 @@ class Zone(Element):
     records: Iterable[DnsRecord]
 
 
+# Types whose content ends with a domain name.
+_NAME_TYPES = frozenset({RecordType.ALIAS, RecordType.CNAME, RecordType.MX, RecordType.NS, RecordType.PTR,
+                         RecordType.SRV})
+
+
+def _domain_name(name: str) -> str:
+    """Returns a domain name in the form it is compared in: without the trailing dot and in lower case."""
+    return name.rstrip('.').lower()
+
+
+def _record_key(record: DnsRecord) -> tuple[str, RecordType | None, str | None]:
+    """
+    Returns what identifies a record within its zone: its name, type and
+    content. Domain names are compared regardless of the trailing dot and case.
+    """
+    content = record.content
+    tokens = content.split() if content else []
+    if record.type in _NAME_TYPES and tokens:
+        *values, name = tokens
+        content = ' '.join([*values, _domain_name(name)])
+    return _domain_name(record.name or ''), record.type, content
+
+
+def _record_differs(current: DnsRecord, desired: DnsRecord) -> bool:
+    """Tells whether a record has to be modified to match the desired one."""
+    return (_record_key(current) != _record_key(desired)
+            or (desired.ttl is not None and desired.ttl != current.ttl)
+            or (desired.priority is not None and desired.priority != current.priority))
+
+
+def _batches(max_records: int | None, max_bytes: int | None,
+             *record_lists: list[JsonObject]) -> Iterator[tuple[list[JsonObject], ...]]:
+    """
+    Splits lists of encoded records into batches of at most ``max_records``
+    records whose encoded size is at most ``max_bytes``, except for records
+    that exceed it on their own. The lists are batched one after another, and
+    each batch is a tuple with a list per input list. Without limits the lists
+    make up a single batch.
+
+    :raises ValueError: if a limit is less than 1
+    """
+    if max_records is not None and max_records < 1:
+        raise ValueError(f'The maximum number of records must be at least 1, got {max_records}')
+    if max_bytes is not None and max_bytes < 1:
+        raise ValueError(f'The maximum number of bytes must be at least 1, got {max_bytes}')
+    if max_records is None and max_bytes is None:
+        yield record_lists
+        return
+    batch: tuple[list[JsonObject], ...] = tuple([] for _ in record_lists)
+    records = size = 0
+    for index, record_list in enumerate(record_lists):
+        for record in record_list:
+            # The records are separated by a comma in the body.
+            record_size = len(_json_dumps(record)) + 1 if max_bytes is not None else 0
+            if records and ((max_records is not None and records >= max_records)
+                            or (max_bytes is not None and size + record_size > max_bytes)):
+                yield batch
+                batch = tuple([] for _ in record_lists)
+                records = size = 0
+            batch[index].append(record)
+            records += 1
+            size += record_size
+    yield batch
+
+
+def _zone_parameters(zone: Zone, nameserver_set_id: str | None,
+                     use_default_nameserver_set: bool | None) -> JsonObject:
+    """Returns the parameters of ``zoneCreate`` and ``zoneRecreate``."""
+    parameters = zone.to_json()
+    if nameserver_set_id is not None:
+        parameters['nameserverSetId'] = nameserver_set_id
+    if use_default_nameserver_set is not None:
+        parameters['useDefaultNameserverSet'] = use_default_nameserver_set
+    return parameters
+
+
+def _zone_update_parameters(zone_config: ZoneConfig, records_to_add: Iterable[DnsRecord],
+                            records_to_delete: Iterable[DnsRecord], records_to_modify: Iterable[DnsRecord],
+                            max_records: int | None, max_bytes: int | None) -> Iterator[JsonObject]:
+    """Yields the parameters of the ``zoneUpdate`` requests of an update, see :meth:`ZoneService.update`."""
+    zone_config_json = zone_config.to_json()
+    for to_delete, to_modify, to_add in _batches(
+            max_records, max_bytes, [r.to_json() for r in records_to_delete],
+            [r.to_json() for r in records_to_modify], [r.to_json() for r in records_to_add]):
+        yield {
+            'zoneConfig': zone_config_json,
+            'recordsToAdd': to_add,
+            'recordsToModify': to_modify,
+            'recordsToDelete': to_delete,
+        }
+
+
+def _record_changes(zone: 'Zone', desired_records: Iterable[DnsRecord]) \
+        -> tuple[list[DnsRecord], list[DnsRecord], list[DnsRecord]]:
+    """
+    Returns the records to add, modify and delete to change the records of a
+    zone to the desired ones, see :meth:`ZoneService.sync`.
+
+    :raises ValueError: if a desired record has an ID that no record of the
+        zone has, or that another desired record has as well
+    """
+    current_by_key: dict[tuple[str, RecordType | None, str | None], list[DnsRecord]] = {}
+    for record in zone.records:
+        current_by_key.setdefault(_record_key(record), []).append(record)
+    unmatched = {record.id: record for record in zone.records}
+
+    # Identical desired records stand for a single one.
+    unique: dict[tuple[str, RecordType | None, str | None], DnsRecord] = {}
+    for desired in desired_records:
+        if desired.id is not None and desired.id not in unmatched:
+            raise ValueError(f'Record {desired.id} is not a record of the zone')
+        unique.setdefault(_record_key(desired), desired)
+
+    # The current records that desired ones name by ID are not matched otherwise.
+    named = {desired.id for desired in unique.values() if desired.id is not None}
+    records_to_add = []
+    records_to_modify = []
+    for desired in unique.values():
+        if desired.id is not None:
+            if desired.id not in unmatched:
+                raise ValueError(f'Record {desired.id} is desired more than once')
+            current = unmatched.pop(desired.id)
+            if _record_differs(current, desired):
+                records_to_modify.append(desired)
+            continue
+        candidates = current_by_key.get(_record_key(desired), [])
+        current = next((record for record in candidates if record.id in unmatched and record.id not in named), None)
+        if current is None:
+            records_to_add.append(desired)
+            continue
+        del unmatched[current.id]
+        if _record_differs(current, desired):
+            records_to_modify.append(DnsRecord(
+                id=current.id, name=desired.name, type=desired.type, content=desired.content,
+                ttl=desired.ttl, priority=desired.priority))
+    records_to_delete = [record for record in unmatched.values() if record.type is not RecordType.SOA]
+    return records_to_add, records_to_modify, records_to_delete
+
+
+def _zone_config_selection(zone_config_ids: Iterable[str] | None,
+                           zone_config_names: Iterable[str] | None) -> JsonObject:
+    """Returns the parameters selecting zones by the IDs or names of their configs."""
+    if zone_config_ids:
+        return {'zoneConfigIds': list(zone_config_ids)}
+    if zone_config_names:
+        return {'zoneConfigNames': list(zone_config_names)}
+    raise ValueError('Either zone config ids or zone config names are required')
+
+
+class ZoneUpdateResult:
+    """
+    The outcome of one of the updates made by :meth:`ZoneService.update_many`.
+
+    :param zone_config: Configuration of the zone that was updated
+    :param zone: The zone after the update, or ``None`` if it failed
+    :param error: The exception the update raised, or ``None`` if it succeeded
+    """
+
+    def __init__(self, zone_config: ZoneConfig, zone: 'Zone | None' = None,
+                 error: Exception | None = None) -> None:
+        self.zone_config = zone_config
+        self.zone = zone
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the update was made."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f'error={self.error!r}' if self.error is not None else 'succeeded'
+        return f'{self.__class__.__qualname__}(zone_config={self.zone_config.name or self.zone_config.id!r}, {outcome})'
+
+
+ZoneChanges = tuple[ZoneConfig, Iterable[DnsRecord], Iterable[DnsRecord], Iterable[DnsRecord]]
+"""The configuration of a zone and the records to add, modify and delete."""
+
+
 class ZoneConfigService(Service[ZoneConfig]):
     """Zone configs are created, updated and deleted through :class:`ZoneService`."""
 
@@ -129,46 +308,121 @@ class ZoneService(Service[Zone]):
     # A zone is identified by its zone config, ``ZoneId`` is not a filter field.
     _find_filter_name = 'ZoneConfigId'
 
+    def _element_key(self, data: JsonObject) -> str:
+        return data['zoneConfig']['id']
+
     def create(self, zone: Zone, nameserver_set_id: str | None = None,
                use_default_nameserver_set: bool | None = None) -> Zone:
-        parameters = zone.to_json()
-        if nameserver_set_id is not None:
-            parameters['nameserverSetId'] = nameserver_set_id
-        if use_default_nameserver_set is not None:
-            parameters['useDefaultNameserverSet'] = use_default_nameserver_set
         response = self._call(
             method='zoneCreate',
-            parameters=parameters
+            parameters=_zone_parameters(zone, nameserver_set_id, use_default_nameserver_set)
         )
         return Zone.from_json(response.get('response', {}))
 
     def recreate(self, zone: Zone, nameserver_set_id: str | None = None,
                  use_default_nameserver_set: bool | None = None) -> Zone:
-        parameters = zone.to_json()
-        if nameserver_set_id is not None:
-            parameters['nameserverSetId'] = nameserver_set_id
-        if use_default_nameserver_set is not None:
-            parameters['useDefaultNameserverSet'] = use_default_nameserver_set
         response = self._call(
             method='zoneRecreate',
-            parameters=parameters
+            parameters=_zone_parameters(zone, nameserver_set_id, use_default_nameserver_set)
         )
         return Zone.from_json(response.get('response', {}))
 
     def update(self, zone_config: ZoneConfig, records_to_add: Iterable[DnsRecord] = (),
                records_to_delete: Iterable[DnsRecord] = (),
-               records_to_modify: Iterable[DnsRecord] = ()) -> Zone:
-        response = self._call(
-            method='zoneUpdate',
-            parameters={
-                'zoneConfig': zone_config.to_json(),
-                'recordsToAdd': [r.to_json() for r in records_to_add],
-                'recordsToModify': [r.to_json() for r in records_to_modify],
-                'recordsToDelete': [r.to_json() for r in records_to_delete],
-            }
-        )
+               records_to_modify: Iterable[DnsRecord] = (), *,
+               max_records: int | None = None, max_bytes: int | None = None) -> Zone:
+        """
+        Adds, modifies and deletes records of a zone.
+
+        Large changes can be split into several ``zoneUpdate`` requests, sent
+        one after another: deletions first, then modifications, then
+        additions. The changes are not atomic then, an error leaves the
+        batches sent before it applied.
+
+        :param zone_config: Configuration of the zone
+        :param records_to_add: Records to add
+        :param records_to_delete: Records to delete
+        :param records_to_modify: Records to modify, with their IDs
+        :param max_records: Maximum number of records per request
+        :param max_bytes: Maximum size of the encoded records per request
+        :return: The zone after the last request
+        :raises ValueError: if a maximum is less than 1
+        """
+        response: JsonObject = {}
+        for parameters in _zone_update_parameters(zone_config, records_to_add, records_to_delete,
+                                                  records_to_modify, max_records, max_bytes):
+            response = self._call(
+                method='zoneUpdate',
+                parameters=parameters
+            )
         return Zone.from_json(response.get('response', {}))
 
+    def update_many(self, changes: Iterable[ZoneChanges], concurrency: int = 4,
+                    progress: Callable[[ZoneUpdateResult, int, int], None] | None = None) -> list[ZoneUpdateResult]:
+        """
+        Updates many zones, several at a time. A failing update does not stop
+        the others, its exception is reported instead.
+
+        :param changes: For each zone, its configuration and the records to
+            add, modify and delete, as passed to :meth:`update`
+        :param concurrency: Number of updates made at the same time
+        :param progress: Function called in the calling thread after each
+            update with its result, the number of updates done so far and the
+            total number of updates
+        :return: The results of the updates, in the order of ``changes``
+        :raises ValueError: if ``concurrency`` is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f'Concurrency must be at least 1, got {concurrency}')
+        changes = list(changes)
+
+        def update(zone_changes: ZoneChanges) -> ZoneUpdateResult:
+            zone_config, records_to_add, records_to_modify, records_to_delete = zone_changes
+            try:
+                zone = self.update(zone_config, records_to_add=records_to_add, records_to_delete=records_to_delete,
+                                   records_to_modify=records_to_modify)
+            except Exception as e:
+                return ZoneUpdateResult(zone_config, error=e)
+            return ZoneUpdateResult(zone_config, zone=zone)
+
+        with ThreadPoolExecutor(max_workers=concurrency,
+                                thread_name_prefix=f'{type(self).__name__}.update_many') as executor:
+            futures = [executor.submit(update, zone_changes) for zone_changes in changes]
+            if progress is not None:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    progress(future.result(), done, len(futures))
+        return [future.result() for future in futures]
+
+    def sync(self, zone_config: ZoneConfig, desired_records: Iterable[DnsRecord]) -> Zone:
+        """
+        Changes the records of a zone to the desired ones with as few changes
+        as possible.
+
+        The current records are retrieved once. A desired record that has an
+        ID replaces the current record with that ID. Otherwise it corresponds
+        to the current record with the same name, type and content, and only
+        its TTL and priority are modified if they are given and differ. Desired
+        records without a counterpart are added, and current records without
+        one are deleted, except for the SOA record, which the API maintains
+        itself. Desired records with the same name, type and content count
+        once. All changes are sent in a single ``zoneUpdate``, and nothing is
+        sent if the zone is in sync already.
+
+        :param zone_config: Configuration of the zone, with its ID
+        :param desired_records: All records the zone is to contain
+        :return: The zone after the update, or as it is if it was in sync
+        :raises ValueError: if the zone config has no ID, or a desired record
+            has an ID that no current record or another desired record has
+        """
+        if not zone_config.id:
+            raise ValueError('The zone config has no ID')
+        zone = self.get(zone_config.id)
+        records_to_add, records_to_modify, records_to_delete = _record_changes(zone, desired_records)
+        if not (records_to_add or records_to_modify or records_to_delete):
+            return zone
+        return self.update(zone_config, records_to_add=records_to_add, records_to_delete=records_to_delete,
+                           records_to_modify=records_to_modify)
+
     def delete(self, zone_config_id: str) -> None:
         self._call(
             method='zoneDelete',
@@ -196,30 +450,16 @@ class ZoneService(Service[Zone]):
 
     def untie_from_templates(self, zone_config_ids: Iterable[str] | None = None,
                              zone_config_names: Iterable[str] | None = None) -> None:
-        parameters = {}
-        if zone_config_ids:
-            parameters['zoneConfigIds'] = list(zone_config_ids)
-        elif zone_config_names:
-            parameters['zoneConfigNames'] = list(zone_config_names)
-        else:
-            raise ValueError('Either zone config ids or zone config names are required')
         self._call(
             method='zonesUntieFromTemplates',
-            parameters=parameters
+            parameters=_zone_config_selection(zone_config_ids, zone_config_names)
         )
 
     def tie_to_templates(self, zone_config_ids: Iterable[str] | None = None,
                          zone_config_names: Iterable[str] | None = None) -> None:
-        parameters = {}
-        if zone_config_ids:
-            parameters['zoneConfigIds'] = list(zone_config_ids)
-        elif zone_config_names:
-            parameters['zoneConfigNames'] = list(zone_config_names)
-        else:
-            raise ValueError('Either zone config ids or zone config names are required')
         self._call(
             method='zonesTieToTemplates',
-            parameters=parameters
+            parameters=_zone_config_selection(zone_config_ids, zone_config_names)
         )
 
 
@@ -268,57 +508,94 @@ class RecordTemplate(Element):
     priority: int | None
 
 
+def _template_parameters(template: Template, record_templates: Iterable[RecordTemplate],
+                         replacements: TemplateReplacements | None) -> JsonObject:
+    """Returns the parameters of ``templateCreate`` and ``templateRecreate``."""
+    parameters = {
+        'dnsTemplate': template.to_json(),
+        'recordTemplates': [r.to_json() for r in record_templates]
+    }
+    if replacements:
+        parameters['replacements'] = replacements.to_json()
+    return parameters
+
+
+def _template_update_parameters(template: Template, record_templates_to_add: Iterable[RecordTemplate],
+                                record_templates_to_delete: Iterable[RecordTemplate],
+                                replacements: TemplateReplacements | None, max_records: int | None,
+                                max_bytes: int | None) -> Iterator[JsonObject]:
+    """Yields the parameters of the ``templateUpdate`` requests of an update, see :meth:`TemplateService.update`."""
+    template_json = template.to_json()
+    for to_delete, to_add in _batches(
+            max_records, max_bytes, [r.to_json() for r in record_templates_to_delete],
+            [r.to_json() for r in record_templates_to_add]):
+        parameters = {
+            'dnsTemplate': template_json,
+            'recordTemplatesToAdd': to_add,
+            'recordTemplatesToDelete': to_delete,
+        }
+        if replacements:
+            parameters['replacements'] = replacements.to_json()
+        yield parameters
+
+
+def _template_selection(template_id: str | None, template_name: str | None) -> JsonObject:
+    """Returns the parameters selecting a template by its ID or name."""
+    if template_id:
+        return {'templateId': template_id}
+    if template_name:
+        return {'templateName': template_name}
+    raise ValueError('Either id or name are required.')
+
+
 class TemplateService(Service[Template]):
     def create(self, template: Template, record_templates: Iterable[RecordTemplate]) -> Template:
         response = self._call(
             method='templateCreate',
-            parameters={
-                'dnsTemplate': template.to_json(),
-                'recordTemplates': [r.to_json() for r in record_templates]
-            }
+            parameters=_template_parameters(template, record_templates, None)
         )
         return Template.from_json(response.get('response', {}))
 
     def recreate(self, template: Template, record_templates: Iterable[RecordTemplate],
                  replacements: TemplateReplacements | None = None) -> Template:
-        parameters = {
-            'dnsTemplate': template.to_json(),
-            'recordTemplates': [r.to_json() for r in record_templates]
-        }
-        if replacements:
-            parameters['replacements'] = replacements.to_json()
         response = self._call(
             method='templateRecreate',
-            parameters=parameters
+            parameters=_template_parameters(template, record_templates, replacements)
         )
         return Template.from_json(response.get('response', {}))
 
     def update(self, template: Template,
                record_templates_to_add: Iterable[RecordTemplate],
                record_templates_to_delete: Iterable[RecordTemplate],
-               replacements: TemplateReplacements | None = None) -> Template:
-        parameters = {
-            'dnsTemplate': template.to_json(),
-            'recordTemplatesToAdd': [r.to_json() for r in record_templates_to_add],
-            'recordTemplatesToDelete': [r.to_json() for r in record_templates_to_delete],
-        }
-        if replacements:
-            parameters['replacements'] = replacements.to_json()
-        response = self._call(
-            method='templateUpdate',
-            parameters=parameters
-        )
+               replacements: TemplateReplacements | None = None, *,
+               max_records: int | None = None, max_bytes: int | None = None) -> Template:
+        """
+        Adds and deletes record templates of a template. Large changes can be
+        split into several requests as by :meth:`ZoneService.update`,
+        deletions first.
+
+        :param template: The template
+        :param record_templates_to_add: Record templates to add
+        :param record_templates_to_delete: Record templates to delete
+        :param replacements: Values replacing the placeholders in the records
+            of the zones tied to the template, sent with every request
+        :param max_records: Maximum number of record templates per request
+        :param max_bytes: Maximum size of the encoded record templates per
+            request
+        :return: The template after the last request
+        :raises ValueError: if a maximum is less than 1
+        """
+        response: JsonObject = {}
+        for parameters in _template_update_parameters(template, record_templates_to_add, record_templates_to_delete,
+                                                      replacements, max_records, max_bytes):
+            response = self._call(
+                method='templateUpdate',
+                parameters=parameters
+            )
         return Template.from_json(response.get('response', {}))
 
     def delete(self, template_id: str | None = None, template_name: str | None = None) -> None:
-        parameters = {}
-        if template_id:
-            parameters['templateId'] = template_id
-        elif template_name:
-            parameters['templateName'] = template_name
-        else:
-            raise ValueError('Either id or name are required.')
         self._call(
             method='templateDelete',
-            parameters=parameters
+            parameters=_template_selection(template_id, template_name)
         )
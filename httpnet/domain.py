@@ -3,7 +3,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from httpnet._core import Element, Service
+from httpnet._core import Element, JsonObject, Service
+from httpnet.dns import _domain_name
 
 
 class ContactType(Enum):
@@ -250,6 +251,14 @@ class TransferData(Element):
 
 class DomainService(Service[Domain]):
     _id_name = 'domainName'
+    # Domains are looked up by name, see get.
+    _find_filter_name = 'DomainName'
+
+    def _element_key(self, data: JsonObject) -> str:
+        return data['name']
+
+    def _normalized_key(self, key: str) -> str:
+        return _domain_name(key)
 
     def get(self, key: str, /) -> Domain:
         """
@@ -2,7 +2,8 @@ from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
 
-from httpnet._core import CrudService, Element, Service, UpdatableService
+from httpnet._core import CrudService, Element, JsonObject, Service, UpdatableService
+from httpnet.dns import _domain_name
 
 
 class SpamFilter(Element):
@@ -83,18 +84,21 @@ class Mailbox(Element):
                 raise ValueError('List of forwarder targets is required for Forwarder mailboxes.')
 
 
+def _mailbox_selection(mailbox_id: str | None, email_address: str | None) -> JsonObject:
+    """Returns the parameters selecting a mailbox by its ID or email address."""
+    if mailbox_id:
+        return {'mailboxId': mailbox_id}
+    if email_address:
+        return {'emailAddress': email_address}
+    raise ValueError('Either mailbox id or email address are required.')
+
+
 class MailboxService(Service[Mailbox]):
     _find_method_name = 'mailboxesFind'
 
     def delete(self, mailbox_id: str | None = None, email_address: str | None = None,
                exec_date: datetime | None = None) -> None:
-        parameters = {}
-        if mailbox_id:
-            parameters['mailboxId'] = mailbox_id
-        elif email_address:
-            parameters['emailAddress'] = email_address
-        else:
-            raise ValueError('Either mailbox id or email address are required.')
+        parameters = _mailbox_selection(mailbox_id, email_address)
         if exec_date is not None:
             parameters['execDate'] = exec_date.isoformat()
         self._call(
@@ -103,13 +107,7 @@ class MailboxService(Service[Mailbox]):
         )
 
     def cancel_deletion(self, mailbox_id: str | None = None, email_address: str | None = None) -> Mailbox:
-        parameters = {}
-        if mailbox_id:
-            parameters['mailboxId'] = mailbox_id
-        elif email_address:
-            parameters['emailAddress'] = email_address
-        else:
-            raise ValueError('Either mailbox id or email address are required.')
+        parameters = _mailbox_selection(mailbox_id, email_address)
         response = self._call(
             method='mailboxDeletionCancel',
             parameters=parameters
@@ -117,13 +115,7 @@ class MailboxService(Service[Mailbox]):
         return Mailbox.from_json(response.get('response', {}))
 
     def restore(self, mailbox_id: str | None = None, email_address: str | None = None) -> Mailbox:
-        parameters = {}
-        if mailbox_id:
-            parameters['mailboxId'] = mailbox_id
-        elif email_address:
-            parameters['emailAddress'] = email_address
-        else:
-            raise ValueError('Either mailbox id or email address are required.')
+        parameters = _mailbox_selection(mailbox_id, email_address)
         response = self._call(
             method='mailboxRestore',
             parameters=parameters
@@ -131,13 +123,7 @@ class MailboxService(Service[Mailbox]):
         return Mailbox.from_json(response.get('response', {}))
 
     def purge_restorable(self, mailbox_id: str | None = None, email_address: str | None = None) -> None:
-        parameters = {}
-        if mailbox_id:
-            parameters['mailboxId'] = mailbox_id
-        elif email_address:
-            parameters['emailAddress'] = email_address
-        else:
-            raise ValueError('Either mailbox id or email address are required.')
+        parameters = _mailbox_selection(mailbox_id, email_address)
         self._call(
             method='mailboxPurgeRestorable',
             parameters=parameters
@@ -177,3 +163,9 @@ class DomainSettingsService(UpdatableService[DomainSettings]):
 
     # Domain settings carry no ID of their own, they are keyed by domain name.
     _find_filter_name = 'DomainName'
+
+    def _element_key(self, data: JsonObject) -> str:
+        return data['domainName']
+
+    def _normalized_key(self, key: str) -> str:
+        return _domain_name(key)
@@ -0,0 +1,213 @@
+import json
+import os
+import sqlite3
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generic
+
+from ._core import JsonObject, Service, T, _filter_value, camel_case
+
+__all__ = ['Mirror']
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS elements (
+    listing TEXT NOT NULL,
+    key TEXT NOT NULL,
+    last_change_date TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (listing, key)
+);
+CREATE TABLE IF NOT EXISTS listings (
+    listing TEXT PRIMARY KEY,
+    high_water_mark TEXT
+);
+'''
+
+
+def _default_last_change_date(data: JsonObject) -> str | None:
+    """Returns the date of the last change of an element, as the API sent it."""
+    if 'zoneConfig' in data:
+        return (data['zoneConfig'] or {}).get('lastChangeDate')
+    return data.get('lastChangeDate')
+
+
+class Mirror(Generic[T]):
+    """
+    A local copy of all elements of a service, stored in an SQLite database.
+
+    The first :meth:`sync` retrieves every element. Later ones retrieve the
+    elements sorted by the date of their last change, newest first, and stop
+    as soon as they reach an element that has not changed since the previous
+    sync. Elements that were deleted are not noticed this way, so if the
+    number of elements no longer matches the one the API reports, the mirror
+    is synchronized completely.
+
+    The elements are read from the mirror without asking the API. A database
+    can hold the mirrors of several services. A mirror must only be used by
+    the thread that created it.
+
+    :param service: Service whose elements are mirrored
+    :param path: Path of the database. By default it is kept in memory.
+    :param limit: Number of elements per request
+    :param sort: Field that the API sorts the elements by the date of their
+        last change with, e.g. ``DomainLastChangeDate``. By default it is
+        derived from the name of the element.
+    :param key: Function returning the ID of an element from its JSON data. By
+        default the element is identified as by :meth:`~httpnet._core.Service.get`.
+    :param last_change_date: Function returning the date of the last change of
+        an element from its JSON data
+    """
+
+    def __init__(self, service: Service[T], path: str | os.PathLike[str] = ':memory:',
+                 limit: int | None = 100, sort: str | None = None,
+                 key: Callable[[JsonObject], str] | None = None,
+                 last_change_date: Callable[[JsonObject], str | None] = _default_last_change_date) -> None:
+        self.service = service
+        self.limit = limit
+        element_name = service._element_name
+        self.sort = sort or f'{element_name[0].upper()}{element_name[1:]}LastChangeDate'
+        self._key = key or service._element_key
+        self._last_change_date = last_change_date
+        self._listing = f'{service._service_domain}/{service._find_method_name}'
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._connection.close()
+
+    @property
+    def high_water_mark(self) -> str | None:
+        """
+        Date of the newest change the mirror contains, as the API sent it, or
+        ``None`` if it has never been synchronized.
+        """
+        row = self._connection.execute(
+            'SELECT high_water_mark FROM listings WHERE listing = ?', (self._listing,)).fetchone()
+        return row[0] if row else None
+
+    def _store(self, data: JsonObject) -> str | None:
+        last_change_date = self._last_change_date(data)
+        self._connection.execute(
+            'INSERT OR REPLACE INTO elements (listing, key, last_change_date, data) VALUES (?, ?, ?, ?)',
+            (self._listing, self._key(data), last_change_date, json.dumps(data)))
+        return last_change_date
+
+    def _set_high_water_mark(self, high_water_mark: str | None) -> None:
+        self._connection.execute(
+            'INSERT OR REPLACE INTO listings (listing, high_water_mark) VALUES (?, ?)',
+            (self._listing, high_water_mark))
+
+    def sync(self, full: bool = False) -> int:
+        """
+        Brings the mirror up to date.
+
+        :param full: Whether to retrieve all elements even if the mirror has
+            been synchronized before
+        :return: Number of elements retrieved
+        """
+        high_water_mark = self.high_water_mark
+        if full or high_water_mark is None:
+            return self._sync_fully()
+        parameters = self.service._find_parameters(limit=self.limit, sort=f'~{self.sort}')
+        newest = high_water_mark
+        retrieved = 0
+        total_entries = None
+        with self._connection:
+            page = 1
+            while True:
+                response_body = self.service._find_page(parameters, page)
+                if total_entries is None:
+                    total_entries = response_body.get('totalEntries')
+                reached_high_water_mark = False
+                for data in (response_body.get('data') or []):
+                    last_change_date = self._last_change_date(data)
+                    # Elements changed at the high-water mark itself may or may
+                    # not have been seen, so only older ones end the sync.
+                    if last_change_date is not None and last_change_date < high_water_mark:
+                        reached_high_water_mark = True
+                        break
+                    self._store(data)
+                    retrieved += 1
+                    if last_change_date is not None and last_change_date > newest:
+                        newest = last_change_date
+                if reached_high_water_mark or page >= min(response_body.get('totalPages', 0), Service._MAX_PAGES):
+                    break
+                page += 1
+            self._set_high_water_mark(newest)
+        if total_entries is not None and total_entries != len(self):
+            # Elements have been deleted since the previous sync.
+            return retrieved + self._sync_fully()
+        return retrieved
+
+    def _sync_fully(self) -> int:
+        newest: str | None = None
+        retrieved = 0
+        with self._connection:
+            self._connection.execute('DELETE FROM elements WHERE listing = ?', (self._listing,))
+            for data in self.service.find(limit=self.limit, raw=True):
+                last_change_date = self._store(data)
+                retrieved += 1
+                if last_change_date is not None and (newest is None or last_change_date > newest):
+                    newest = last_change_date
+            self._set_high_water_mark(newest)
+        return retrieved
+
+    def _element(self, data: str) -> T:
+        return self.service._element_class.from_json(json.loads(data))
+
+    def get(self, key: str, /) -> T:
+        """
+        Returns a mirrored element by its ID.
+
+        :param key: ID of the element
+        :return: The element
+        :raises KeyError: if the mirror contains no element with this ID
+        """
+        row = self._connection.execute(
+            'SELECT data FROM elements WHERE listing = ? AND key = ?', (self._listing, key)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return self._element(row[0])
+
+    def find(self, **fields: Any) -> Iterator[T]:
+        """
+        Returns the mirrored elements whose fields have the given values.
+
+        :param fields: Names of fields as declared by the element, and the
+            values they must have. Enumerations are compared by their value.
+            Dates are compared once the elements are converted, since the API
+            may spell the same date differently.
+        :return: Iterator over the matching elements, in the order of their IDs
+        :raises KeyError: if a field is not declared by the element
+        """
+        query = 'SELECT data FROM elements WHERE listing = ?'
+        arguments: list[Any] = [self._listing]
+        dates: dict[str, datetime] = {}
+        for field, value in fields.items():
+            if field not in self.service._element_class._fields:
+                raise KeyError(f'No field "{field}" defined in API model '
+                               f'"{self.service._element_class.__qualname__}"')
+            if isinstance(value, datetime):
+                dates[field] = value
+                continue
+            if isinstance(value, Enum):
+                value = value.value
+            if value is not None and not isinstance(value, (str, int, float)):
+                value = _filter_value(value)
+            query += ' AND json_extract(data, ?) IS ?'
+            arguments += [f'$.{camel_case(field)}', value]
+        query += ' ORDER BY key'
+        for row in self._connection.execute(query, arguments).fetchall():
+            element = self._element(row[0])
+            if all(getattr(element, field) == value for field, value in dates.items()):
+                yield element
+
+    def __iter__(self) -> Iterator[T]:
+        return self.find()
+
+    def __len__(self) -> int:
+        row = self._connection.execute(
+            'SELECT COUNT(*) FROM elements WHERE listing = ?', (self._listing,)).fetchone()
+        return row[0]
@@ -0,0 +1,541 @@
+import io
+import os
+import re
+import tarfile
+import tempfile
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, TextIO, TypeVar
+
+from ._core import Field, Filter
+from .client import HttpNetClient
+from .dns import (
+    _NAME_TYPES,
+    DnsRecord,
+    RecordType,
+    SoaValues,
+    Zone,
+    ZoneConfig,
+    ZoneConfigType,
+)
+
+__all__ = ['ZoneExporter', 'ZoneImportResult', 'ZoneImporter', 'read_zone', 'write_zone']
+
+# TXT records consist of strings of at most 255 octets each.
+_MAX_STRING_LENGTH = 255
+
+# Tokens of an entry: quoted strings, comments, parentheses and anything else
+# up to the next whitespace that is not escaped.
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|;.*|[()]|(?:[^\s"();\\]|\\.)+')
+
+# Escapes within a character string: \DDD stands for the octet with the
+# decimal value DDD, \X for the character X.
+_ESCAPE = re.compile(r'\\(?:(\d{3})|(.))', re.DOTALL)
+
+_TTL = re.compile(r'(\d+)([smhdw]?)', re.IGNORECASE)
+_TTL_WITH_UNITS = re.compile(r'(?:\d+[smhdw])+', re.IGNORECASE)
+_TTL_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+_CLASSES = frozenset({'IN', 'CH', 'CS', 'HS'})
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+
+def _map(function: Callable[[_T], _R], items: Iterable[_T], concurrency: int) -> Iterator[_R]:
+    """
+    Applies a function to items through a pool of threads and yields the
+    results in the order of the items. Only a few items are submitted ahead
+    of the one whose result is yielded.
+    """
+    pending: deque[Future[_R]] = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='httpnet.zonefile')
+    try:
+        for item in items:
+            if len(pending) >= 2 * concurrency:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _absolute(name: str) -> str:
+    """Returns a domain name fully qualified, with a trailing dot."""
+    return name if name.endswith('.') else f'{name}.'
+
+
+def _strings(content: str) -> Iterator[str]:
+    """
+    Splits the content of a TXT record into pieces of at most 255 octets in
+    UTF-8, without splitting a character.
+    """
+    if content.isascii():
+        for i in range(0, max(len(content), 1), _MAX_STRING_LENGTH):
+            yield content[i:i + _MAX_STRING_LENGTH]
+        return
+    start = size = 0
+    for i, character in enumerate(content):
+        character_size = len(character.encode())
+        if size + character_size > _MAX_STRING_LENGTH:
+            yield content[start:i]
+            start = i
+            size = 0
+        size += character_size
+    yield content[start:]
+
+
+def _escape(string: str) -> str:
+    """
+    Escapes a character string: backslashes and quotes with a backslash,
+    characters that are not printable, such as line breaks, as their octets
+    in the form ``\\DDD``.
+    """
+    string = string.replace('\\', '\\\\').replace('"', '\\"')
+    if string.isprintable():
+        return string
+    return ''.join(character if character.isprintable()
+                   else ''.join(f'\\{octet:03d}' for octet in character.encode())
+                   for character in string)
+
+
+def _quote(content: str) -> str:
+    """Returns the content of a TXT record as a sequence of quoted strings."""
+    if content.startswith('"'):
+        # The API returns the content as it was entered, which may be quoted already.
+        return content
+    # The content is split before it is escaped, so an escape sequence is never split.
+    return ' '.join(f'"{_escape(string)}"' for string in _strings(content))
+
+
+def _rdata(record: DnsRecord) -> tuple[str, str]:
+    """Returns the type of a record as written in a zone file and its data."""
+    content = record.content or ''
+    record_type = record.type
+    if record_type is RecordType.NULLMX:
+        # A null MX record (RFC 7505) is an MX record of priority 0 without a host.
+        return 'MX', '0 .'
+    if record_type is RecordType.TXT:
+        return 'TXT', _quote(content)
+    if record_type is RecordType.SOA:
+        primary, mailbox, *values = content.split()
+        return 'SOA', ' '.join([_absolute(primary), _absolute(mailbox), *values])
+    if record_type in _NAME_TYPES and content:
+        # The domain name the content ends with is written fully qualified.
+        *values, name = content.split()
+        content = ' '.join([*values, _absolute(name)])
+    if record_type in (RecordType.MX, RecordType.SRV) and record.priority is not None:
+        content = f'{record.priority} {content}'
+    return str(record_type), content
+
+
+def write_zone(zone_config: ZoneConfig, records: Iterable[DnsRecord], file: TextIO) -> None:
+    """
+    Writes a zone as a master file as defined by RFC 1035.
+
+    The records are written as they are iterated over, with fully qualified
+    names, so the SOA record has to come first. Records without a TTL of
+    their own get the default TTL of the zone.
+
+    :param zone_config: Configuration of the zone
+    :param records: Records of the zone
+    :param file: File to write to
+    """
+    file.write(f'$ORIGIN {_absolute(zone_config.name or "")}\n')
+    if zone_config.soa_values is not None and zone_config.soa_values.ttl is not None:
+        file.write(f'$TTL {zone_config.soa_values.ttl}\n')
+    for record in records:
+        record_type, rdata = _rdata(record)
+        ttl = f'\t{record.ttl}' if record.ttl is not None else ''
+        file.write(f'{_absolute(record.name or zone_config.name or "")}{ttl}\tIN\t{record_type}\t{rdata}\n')
+
+
+def _tokens(line: str) -> list[str]:
+    """Splits a line of a master file into its tokens, without the comment."""
+    if '"' not in line and ';' not in line and '(' not in line and ')' not in line and '\\' not in line:
+        return line.split()
+    return [token for token in _TOKEN.findall(line) if not token.startswith(';')]
+
+
+def _entries(lines: Iterable[str]) -> Iterator[tuple[int, bool, list[str]]]:
+    """
+    Yields the entries of a master file: the number of the line each starts
+    on, whether it starts with whitespace, i.e. without an owner, and its
+    tokens. Entries that continue over several lines within parentheses are
+    joined.
+    """
+    tokens: list[str] = []
+    start = 0
+    blank_owner = False
+    depth = 0
+    for number, line in enumerate(lines, start=1):
+        line_tokens = _tokens(line)
+        if not depth:
+            if not line_tokens:
+                continue
+            start, blank_owner = number, line[0] in ' \t'
+        for token in line_tokens:
+            if token == '(':
+                depth += 1
+            elif token == ')':
+                if not depth:
+                    raise ValueError(f'Line {number}: unbalanced parenthesis')
+                depth -= 1
+            else:
+                tokens.append(token)
+        if not depth:
+            yield start, blank_owner, tokens
+            tokens = []
+    if depth:
+        raise ValueError(f'Line {start}: unbalanced parenthesis')
+
+
+def _parse_ttl(token: str) -> int:
+    """Converts a TTL, in seconds or with units as in ``1h30m``, to seconds."""
+    if token.isdigit():
+        return int(token)
+    if not _TTL_WITH_UNITS.fullmatch(token):
+        raise ValueError(f'Invalid TTL "{token}"')
+    return sum(int(value) * _TTL_UNITS[unit.lower()] for value, unit in _TTL.findall(token))
+
+
+def _qualify(name: str, origin: str | None) -> str:
+    """Returns a domain name relative to the origin fully qualified, without the trailing dot."""
+    if name == '@':
+        if origin is None:
+            raise ValueError('"@" used without an origin')
+        return origin
+    if name.endswith('.'):
+        return name[:-1]
+    if origin is None:
+        raise ValueError(f'Relative name "{name}" used without an origin')
+    return f'{name}.{origin}' if origin else name
+
+
+def _unescape(string: str) -> bytes:
+    """Returns the octets of a character string, with its escapes replaced."""
+    octets = bytearray()
+    position = 0
+    for match in _ESCAPE.finditer(string):
+        octets += string[position:match.start()].encode()
+        decimal, character = match.groups()
+        if decimal is not None:
+            if int(decimal) > 255:
+                raise ValueError(f'Invalid escape "\\{decimal}"')
+            octets.append(int(decimal))
+        else:
+            octets += character.encode()
+        position = match.end()
+    octets += string[position:].encode()
+    return bytes(octets)
+
+
+def _unquote(tokens: list[str]) -> str:
+    """Joins the character strings of a TXT record and decodes them as UTF-8."""
+    octets = b''.join(_unescape(token[1:-1] if token.startswith('"') else token) for token in tokens)
+    try:
+        return octets.decode()
+    except UnicodeDecodeError:
+        raise ValueError('TXT record is not valid UTF-8') from None
+
+
+def _mailbox(name: str) -> str:
+    """Converts the mailbox of an SOA record, as ``hostmaster.example.com``, to an email address."""
+    match = re.match(r'((?:[^.\\]|\\.)*)\.(.*)', name)
+    if match is None:
+        return name
+    return f'{match.group(1).replace(chr(92), "")}@{match.group(2)}'
+
+
+def read_zone(lines: Iterable[str], origin: str | None = None) -> Zone:
+    """
+    Reads a zone from a master file as defined by RFC 1035, e.g. as written
+    by BIND.
+
+    The SOA record sets the email address and the SOA values of the zone
+    config, the other records become its records. Records without a TTL of
+    their own get the one set by ``$TTL``, if any.
+
+    :param lines: Lines of the file, e.g. the open file
+    :param origin: Name of the zone, unless the file sets it with ``$ORIGIN``
+    :return: The zone, to be passed to :meth:`~httpnet.dns.ZoneService.create`
+    :raises ValueError: if the file is not a valid master file, uses
+        ``$INCLUDE``, a class other than ``IN`` or a type the API does not
+        support
+    """
+    origin = origin.rstrip('.') if origin is not None else None
+    # The zone is named after its SOA record, or else the first $ORIGIN.
+    zone_name = first_origin = None
+    default_ttl: int | None = None
+    owner: str | None = None
+    zone_config = ZoneConfig(type=ZoneConfigType.NATIVE)
+    records = []
+    for number, blank_owner, tokens in _entries(lines):
+        try:
+            if tokens[0].startswith('$'):
+                directive = tokens[0].upper()
+                if directive == '$ORIGIN':
+                    origin = _qualify(tokens[1], origin)
+                    first_origin = first_origin or origin
+                elif directive == '$TTL':
+                    default_ttl = _parse_ttl(tokens[1])
+                else:
+                    raise ValueError(f'Unsupported directive {tokens[0]}')
+                continue
+            position = 0
+            if not blank_owner:
+                owner = _qualify(tokens[0], origin)
+                position = 1
+            elif owner is None:
+                raise ValueError('The first record has no owner')
+            ttl = default_ttl
+            # The TTL and class may precede the type in either order.
+            while True:
+                token = tokens[position]
+                if token.upper() in _CLASSES:
+                    if token.upper() != 'IN':
+                        raise ValueError(f'Unsupported class {token}')
+                elif token[0].isdigit():
+                    ttl = _parse_ttl(token)
+                else:
+                    break
+                position += 1
+            type_name = tokens[position].upper()
+            rdata = tokens[position + 1:]
+            if type_name == 'SOA':
+                _primary, mailbox, _serial, refresh, retry, expire, minimum = rdata
+                zone_name = owner
+                zone_config.email_address = _mailbox(_qualify(mailbox, origin))
+                zone_config.soa_values = SoaValues(
+                    refresh=_parse_ttl(refresh), retry=_parse_ttl(retry), expire=_parse_ttl(expire),
+                    ttl=default_ttl if default_ttl is not None else ttl, negative_ttl=_parse_ttl(minimum))
+                continue
+            try:
+                record_type = RecordType[type_name]
+            except KeyError:
+                raise ValueError(f'Unsupported record type {tokens[position]}') from None
+            priority = None
+            if record_type is RecordType.TXT:
+                content = _unquote(rdata)
+            elif record_type is RecordType.MX and rdata[1] == '.':
+                record_type, priority, content = RecordType.NULLMX, 0, ''
+            else:
+                if record_type in (RecordType.MX, RecordType.SRV):
+                    priority, *rdata = rdata
+                    priority = int(priority)
+                if record_type in _NAME_TYPES:
+                    rdata[-1] = _qualify(rdata[-1], origin)
+                content = ' '.join(rdata)
+            records.append(DnsRecord(name=owner, type=record_type, content=content, ttl=ttl, priority=priority))
+        except (IndexError, ValueError) as e:
+            message = str(e) if isinstance(e, ValueError) else 'Incomplete record'
+            raise ValueError(f'Line {number}: {message}') from None
+    zone_config.name = zone_name or first_origin or origin
+    return Zone(zone_config=zone_config, records=records)
+
+
+class ZoneImportResult:
+    """
+    The outcome of importing a zone file with :class:`ZoneImporter`.
+
+    :param path: Path of the zone file
+    :param zone_config: Configuration of the zone, or ``None`` if the file
+        could not be read
+    :param zone: The zone as created, or ``None`` if the import failed
+    :param error: The exception the import raised, or ``None`` if it
+        succeeded
+    """
+
+    def __init__(self, path: str | os.PathLike[str], zone_config: ZoneConfig | None = None,
+                 zone: Zone | None = None, error: Exception | None = None) -> None:
+        self.path = path
+        self.zone_config = zone_config
+        self.zone = zone
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the zone was created."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f'error={self.error!r}' if self.error is not None else 'succeeded'
+        return f'{self.__class__.__qualname__}(path={os.fspath(self.path)!r}, {outcome})'
+
+
+class ZoneImporter:
+    """
+    Creates zones from master files, e.g. to migrate them from another
+    provider, see :func:`read_zone`.
+
+    :param api: Client to create the zones with
+    :param concurrency: Number of zones read and created at the same time
+    :param recreate: Whether to replace zones that exist already through
+        :meth:`~httpnet.dns.ZoneService.recreate` rather than create new ones
+    :param nameserver_set_id: ID of the name server set of the zones
+    :param use_default_nameserver_set: Whether to use the default name server
+        set of the account
+    :raises ValueError: if ``concurrency`` is less than 1
+    """
+
+    def __init__(self, api: HttpNetClient, concurrency: int = 4, recreate: bool = False,
+                 nameserver_set_id: str | None = None, use_default_nameserver_set: bool | None = None) -> None:
+        if concurrency < 1:
+            raise ValueError(f'Concurrency must be at least 1, got {concurrency}')
+        self.api = api
+        self.concurrency = concurrency
+        self.recreate = recreate
+        self.nameserver_set_id = nameserver_set_id
+        self.use_default_nameserver_set = use_default_nameserver_set
+
+    def import_zone(self, zone: Zone) -> Zone:
+        """
+        Creates or recreates a zone.
+
+        :param zone: The zone, e.g. as read by :func:`read_zone`
+        :return: The zone as created
+        """
+        push = self.api.dns_zones.recreate if self.recreate else self.api.dns_zones.create
+        return push(zone, nameserver_set_id=self.nameserver_set_id,
+                    use_default_nameserver_set=self.use_default_nameserver_set)
+
+    def _import_file(self, path: str | os.PathLike[str]) -> ZoneImportResult:
+        zone_config = None
+        try:
+            # A file named after its zone, as written by ZoneExporter, needs no $ORIGIN.
+            origin = os.path.basename(path).removesuffix('.zone')
+            with open(path, encoding='utf-8') as file:
+                zone = read_zone(file, origin)
+            zone_config = zone.zone_config
+            return ZoneImportResult(path, zone_config, zone=self.import_zone(zone))
+        except Exception as e:
+            return ZoneImportResult(path, zone_config, error=e)
+
+    def import_files(self, paths: Iterable[str | os.PathLike[str]],
+                     progress: Callable[[ZoneImportResult, int, int], None] | None = None) -> list[ZoneImportResult]:
+        """
+        Reads zone files and creates their zones, several at a time. A file
+        that cannot be read or whose zone the API rejects does not stop the
+        others, its exception is reported instead.
+
+        :param paths: Paths of the files. A file that does not set the name
+            of its zone with ``$ORIGIN`` or a fully qualified SOA record is
+            named after the file, without the extension ``.zone``.
+        :param progress: Function called in the calling thread after each
+            file with its result, the number of files done so far and the
+            total number of files
+        :return: The results of the files, in the order of ``paths``
+        """
+        paths = list(paths)
+        results = []
+        for done, result in enumerate(_map(self._import_file, paths, self.concurrency), start=1):
+            results.append(result)
+            if progress is not None:
+                progress(result, done, len(paths))
+        return results
+
+
+class ZoneExporter:
+    """
+    Exports zones as master files, e.g. for a backup.
+
+    The records of several zones are retrieved at the same time, each zone
+    page by page and written as its pages arrive, so no more than a few zones
+    are held in memory at once.
+
+    :param api: Client to retrieve the zones with
+    :param concurrency: Number of zones retrieved at the same time
+    :param limit: Number of records per request
+    :raises ValueError: if ``concurrency`` is less than 1
+    """
+
+    def __init__(self, api: HttpNetClient, concurrency: int = 4, limit: int = 1000) -> None:
+        if concurrency < 1:
+            raise ValueError(f'Concurrency must be at least 1, got {concurrency}')
+        self.api = api
+        self.concurrency = concurrency
+        self.limit = limit
+
+    def records(self, zone_config: ZoneConfig) -> Iterator[DnsRecord]:
+        """
+        Retrieves the records of a zone, its SOA record first.
+
+        :param zone_config: Configuration of the zone, with its ID
+        :return: Iterator over the records
+        """
+        zone = Field('ZoneConfigId') == zone_config.id
+        fields = ['name', 'type', 'content', 'ttl', 'priority']
+        yield from self.api.dns_records.find(
+            limit=self.limit, fields=fields, where=zone & (Field('RecordType') == RecordType.SOA))
+        yield from self.api.dns_records.find(
+            limit=self.limit, fields=fields, where=zone & (Field('RecordType') != RecordType.SOA))
+
+    def write(self, zone_config: ZoneConfig, file: TextIO) -> None:
+        """
+        Retrieves a zone and writes it as a master file, see :func:`write_zone`.
+
+        :param zone_config: Configuration of the zone, with its ID and name
+        :param file: File to write to
+        """
+        write_zone(zone_config, self.records(zone_config), file)
+
+    def _zone_configs(self, where: Filter | None, filters) -> Iterator[ZoneConfig]:
+        return self.api.dns_zone_configs.find(where=where, **filters)
+
+    def export_directory(self, path: str | os.PathLike[str], *, where: Filter | None = None, **filters) -> int:
+        """
+        Writes each zone to a file named after the zone with the extension
+        ``.zone`` in a directory. The directory is created if necessary.
+
+        :param path: Path of the directory
+        :param where: Filter selecting the zones, see
+            :meth:`~httpnet._core.Service.find`. By default, all zones are
+            exported.
+        :param filters: Further filters selecting the zones
+        :return: Number of zones written
+        """
+        os.makedirs(path, exist_ok=True)
+
+        def export(zone_config: ZoneConfig) -> None:
+            with open(os.path.join(path, f'{zone_config.name}.zone'), 'w', encoding='utf-8') as file:
+                self.write(zone_config, file)
+
+        return sum(1 for _ in _map(export, self._zone_configs(where, filters), self.concurrency))
+
+    def export_tar(self, file: IO[bytes], compression: str = '', *, where: Filter | None = None, **filters) -> int:
+        """
+        Writes the zones as a tar stream, each one as by
+        :meth:`export_directory`. The stream is written sequentially, so
+        ``file`` may be a pipe or socket. As the size of a file precedes it in
+        the stream, each zone is collected in a temporary file first, which is
+        kept in memory while it is small.
+
+        :param file: Binary file to write to
+        :param compression: Compression of the stream, one of ``''``, ``'gz'``,
+            ``'bz2'`` and ``'xz'``
+        :param where: Filter selecting the zones, see :meth:`export_directory`
+        :param filters: Further filters selecting the zones
+        :return: Number of zones written
+        """
+        def export(zone_config: ZoneConfig) -> tuple[ZoneConfig, IO[bytes]]:
+            zone_file = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+            text = io.TextIOWrapper(zone_file, encoding='utf-8', newline='')
+            self.write(zone_config, text)
+            text.flush()
+            text.detach()
+            return zone_config, zone_file
+
+        count = 0
+        with tarfile.open(fileobj=file, mode=f'w|{compression}') as archive:
+            for zone_config, zone_file in _map(export, self._zone_configs(where, filters), self.concurrency):
+                with zone_file:
+                    info = tarfile.TarInfo(f'{zone_config.name}.zone')
+                    info.size = zone_file.tell()
+                    info.mtime = int(time.time())
+                    zone_file.seek(0)
+                    archive.addfile(info, zone_file)
+                count += 1
+        return count
@@ -1,4 +1,5 @@
 import json
+from collections.abc import Callable, Iterator
 from typing import Any
 
 import pytest
@@ -14,9 +15,24 @@ class FakeResponse:
     def raise_for_status(self) -> None:
         pass
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
     def json(self) -> dict[str, Any]:
         return self._payload
 
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+
+    def __enter__(self) -> 'FakeResponse':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
 
 class RecordingSession:
     """Stands in for ``requests.Session`` and records the calls made to it."""
@@ -25,9 +41,19 @@ class RecordingSession:
         self.headers: dict[str, str] = {}
         self.calls: list[dict[str, Any]] = []
         self.responses: list[dict[str, Any]] = []
+        # Answers requests by their body instead of by the order of
+        # ``responses``, which is needed once requests are made concurrently.
+        self.responder: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        pass
 
-    def post(self, url: str, data: str, timeout: Any) -> FakeResponse:
-        self.calls.append({'url': url, 'body': json.loads(data), 'timeout': timeout})
+    def post(self, url: str, data: bytes, timeout: Any, headers: dict[str, str] | None = None,
+             stream: bool = False) -> FakeResponse:
+        body = json.loads(data)
+        self.calls.append({'url': url, 'body': body, 'timeout': timeout, 'headers': headers, 'stream': stream})
+        if self.responder is not None:
+            return FakeResponse(self.responder(body))
         payload = self.responses.pop(0) if self.responses else {'status': 'success', 'response': {}}
         return FakeResponse(payload)
 
@@ -0,0 +1,320 @@
+import asyncio
+import contextlib
+import json
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+import apidata
+import pytest
+
+from httpnet._core import AsyncClient, AsyncService, Client, Field, RateLimiter, ServiceException
+from httpnet.aio import AsyncHttpNetClient
+from httpnet.dns import DnsRecord, NameserverSet, RecordTemplate, RecordType, Template, Zone, ZoneConfig
+from httpnet.domain import ContactService
+
+httpx = pytest.importorskip('httpx')
+
+
+class RecordingTransport:
+    """Answers the requests of ``httpx.AsyncClient`` and records them."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.responses: list[dict[str, Any] | httpx.Response] = []
+        # Answers requests by their body, cf. ``RecordingSession.responder``.
+        self.responder: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]] | None = None
+
+    async def __call__(self, request) -> Any:
+        body = json.loads(request.content)
+        self.calls.append({'url': str(request.url), 'body': body, 'headers': request.headers})
+        if self.responder is not None:
+            return httpx.Response(200, json=await self.responder(body))
+        payload = self.responses.pop(0) if self.responses else {'status': 'success', 'response': {}}
+        if isinstance(payload, httpx.Response):
+            return payload
+        return httpx.Response(200, json=payload)
+
+
+@pytest.fixture
+def transport(monkeypatch: pytest.MonkeyPatch, session) -> RecordingTransport:
+    """Makes every ``AsyncClient`` created in a test use a recording transport."""
+    recording_transport = RecordingTransport()
+    async_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, 'AsyncClient', lambda **kwargs: async_client(
+        transport=httpx.MockTransport(recording_transport), **kwargs))
+    return recording_transport
+
+
+@pytest.fixture
+def api(transport) -> AsyncHttpNetClient:
+    return AsyncHttpNetClient(auth_token='token')
+
+
+def test_client_exposes_all_services(api) -> None:
+    for attribute in ('domains', 'domain_contacts', 'domain_jobs',
+                      'dns_zone_configs', 'dns_records', 'dns_zones',
+                      'nameserver_sets', 'dns_templates',
+                      'mailboxes', 'email_organizations', 'email_domain_settings'):
+        assert hasattr(api, attribute)
+
+
+def test_service_requires_an_async_client(session) -> None:
+    with pytest.raises(TypeError, match='AsyncClient'):
+        AsyncService(ContactService(Client(auth_token='token')))
+
+
+def test_call_async_sends_auth_token_and_parameters(transport) -> None:
+    async def call() -> None:
+        async with AsyncClient(auth_token='token', owner_account_id='acct') as client:
+            await client.call_async('dns', 'zonesFind', {'limit': 10})
+
+    asyncio.run(call())
+    assert transport.calls[0]['url'] == 'https://partner.http.net/api/dns/v1/json/zonesFind'
+    assert transport.calls[0]['body'] == {'authToken': 'token', 'ownerAccountId': 'acct', 'limit': 10}
+
+
+def test_get_looks_the_element_up_through_find(api, transport) -> None:
+    transport.responses.append({'status': 'success', 'response': {
+        'data': [apidata.ZONE_CONFIG], 'totalEntries': 1, 'totalPages': 1,
+    }})
+    zone_config = asyncio.run(api.dns_zone_configs.get('15010100000010'))
+    assert isinstance(zone_config, ZoneConfig)
+    assert transport.calls[0]['body']['filter']['subFilter'] == [
+        {'field': 'ZoneConfigId', 'value': '15010100000010'}
+    ]
+
+
+def test_get_raises_key_error_when_nothing_matches(api, transport) -> None:
+    transport.responses.append({'status': 'success', 'response': {'data': [], 'totalPages': 0}})
+    with pytest.raises(KeyError, match='1'):
+        asyncio.run(api.dns_zone_configs.get('1'))
+
+
+def test_domains_are_retrieved_through_info(api, transport) -> None:
+    transport.responses.append({'status': 'success', 'response': apidata.DOMAIN})
+    domain = asyncio.run(api.domains.get('example.com'))
+    assert domain.name == 'example.com'
+    assert transport.calls[0]['url'].endswith('/domainInfo')
+    assert transport.calls[0]['body']['domainName'] == 'example.com'
+
+
+def test_find_iterates_all_pages(api, transport) -> None:
+    for page in (1, 2):
+        transport.responses.append({'status': 'success', 'response': {
+            'data': [{**apidata.ZONE_CONFIG, 'id': str(page)}], 'totalPages': 2,
+        }})
+
+    async def find() -> list[ZoneConfig]:
+        return [zone_config async for zone_config in api.dns_zone_configs]
+
+    assert [z.id for z in asyncio.run(find())] == ['1', '2']
+    assert [call['body']['page'] for call in transport.calls] == [1, 2]
+
+
+def test_find_with_concurrency_keeps_the_page_order(api, transport) -> None:
+    async def respond(body: dict[str, Any]) -> dict[str, Any]:
+        # Later pages are answered first.
+        await asyncio.sleep(0.01 * (5 - body['page']))
+        return {'status': 'success', 'response': {
+            'data': [{**apidata.ZONE_CONFIG, 'id': str(body['page'])}], 'totalPages': 4,
+        }}
+
+    async def find() -> list[ZoneConfig]:
+        return [zone_config async for zone_config in api.dns_zone_configs.find(concurrency=3)]
+
+    transport.responder = respond
+    assert [z.id for z in asyncio.run(find())] == ['1', '2', '3', '4']
+
+
+def test_find_rejects_arguments_of_the_sync_find(api, transport) -> None:
+    async def find() -> None:
+        async for _ in api.dns_zone_configs.find(stream=True):
+            pass
+
+    with pytest.raises(TypeError, match="'stream'"):
+        asyncio.run(find())
+    assert not transport.calls
+
+
+def test_find_waits_for_the_pages_it_no_longer_needs(api, transport) -> None:
+    async def respond(body: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(0.01 * (body['page'] - 1))
+        return {'status': 'success', 'response': {
+            'data': [{**apidata.ZONE_CONFIG, 'id': str(body['page'])}], 'totalPages': 4,
+        }}
+
+    async def find_first() -> set[asyncio.Task]:
+        async with contextlib.aclosing(api.dns_zone_configs.find(concurrency=3)) as zone_configs:
+            async for _ in zone_configs:
+                break
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    transport.responder = respond
+    assert asyncio.run(find_first()) == set()
+
+
+def test_concurrent_reads_with_gather(api, transport) -> None:
+    async def count_all() -> list[int]:
+        return await asyncio.gather(*(api.domains.count() for _ in range(20)))
+
+    assert asyncio.run(count_all()) == [0] * 20
+    assert len(transport.calls) == 20
+
+
+def test_count_sends_filter(api, transport) -> None:
+    asyncio.run(api.dns_records.count(where=Field('RecordType').is_in(['A', 'AAAA'])))
+    assert transport.calls[0]['body']['filter']['subFilterConnective'] == 'OR'
+
+
+def test_failed_reads_are_retried(api, transport, monkeypatch) -> None:
+    async def sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr(asyncio, 'sleep', sleep)
+    transport.responses.append(httpx.Response(503))
+    assert asyncio.run(api.domains.count()) == 0
+    assert len(transport.calls) == 2
+
+
+def test_limiter_bounds_requests_in_flight(transport) -> None:
+    limiter = RateLimiter(rate=1000, max_in_flight=3)
+    in_flight: list[int] = []
+
+    async def respond(body: dict[str, Any]) -> dict[str, Any]:
+        in_flight.append(limiter.in_flight)
+        await asyncio.sleep(0.01)
+        return {'status': 'success', 'response': {}}
+
+    async def count_all() -> None:
+        async with AsyncHttpNetClient(auth_token='token', limiter=limiter) as api:
+            await asyncio.gather(*(api.domains.count() for _ in range(10)))
+
+    transport.responder = respond
+    asyncio.run(count_all())
+    assert len(in_flight) == 10
+    assert max(in_flight) <= 3
+    assert limiter.in_flight == 0
+
+
+def test_identical_reads_are_coalesced(transport) -> None:
+    async def respond(body: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(0.01)
+        return {'status': 'success', 'response': {'totalEntries': 7}}
+
+    async def count_all() -> list[int]:
+        async with AsyncHttpNetClient(auth_token='token', coalesce=True) as api:
+            return await asyncio.gather(*(api.domains.count() for _ in range(10)))
+
+    transport.responder = respond
+    assert asyncio.run(count_all()) == [7] * 10
+    assert len(transport.calls) == 1
+
+
+def test_transfers_are_counted(api, transport) -> None:
+    asyncio.run(api.domains.count())
+    assert transport.calls[0]['headers']['accept-encoding'] == 'gzip, deflate'
+    assert api.stats.calls == 1
+    assert api.stats.methods['domainsFind'].response_bytes > 0
+
+
+def test_create_serializes_element(api, transport) -> None:
+    transport.responses.append({'status': 'success', 'response': {
+        'id': '1', 'name': 'ns', 'nameservers': ['ns1.example.com'],
+    }})
+    nameserver_set = NameserverSet(name='ns', nameservers=['ns1.example.com'])
+    created = asyncio.run(api.nameserver_sets.create(nameserver_set))
+    assert created.id == '1'
+    assert transport.calls[0]['url'].endswith('/nameserverSetCreate')
+    assert transport.calls[0]['body']['nameserverSet'] == {'name': 'ns', 'nameservers': ['ns1.example.com']}
+
+
+def test_delete_sends_id(api, transport) -> None:
+    asyncio.run(api.email_organizations.delete('1'))
+    assert transport.calls[0]['url'].endswith('/organizationDelete')
+    assert transport.calls[0]['body']['organizationId'] == '1'
+
+
+def test_zone_create_sends_records(api, transport) -> None:
+    transport.responses.append({'status': 'success', 'response': {'zoneConfig': apidata.ZONE_CONFIG, 'records': []}})
+    zone = Zone(
+        zone_config=ZoneConfig(name='example.com'),
+        records=[DnsRecord(name='www.example.com', type=RecordType.A, content='192.0.2.1')],
+    )
+    created = asyncio.run(api.dns_zones.create(zone, use_default_nameserver_set=True))
+    assert created.zone_config.id == apidata.ZONE_CONFIG['id']
+    assert transport.calls[0]['url'].endswith('/zoneCreate')
+    assert transport.calls[0]['body']['useDefaultNameserverSet'] is True
+    assert transport.calls[0]['body']['records'][0]['content'] == '192.0.2.1'
+
+
+def test_zone_update_is_split_by_record_count(api, transport) -> None:
+    async def respond(body: dict[str, Any]) -> dict[str, Any]:
+        return {'status': 'success', 'response': {'zoneConfig': body['zoneConfig'], 'records': body['recordsToAdd']}}
+
+    transport.responder = respond
+    records = [DnsRecord(name=f'{i}.example.com', type=RecordType.A, content='192.0.2.1') for i in range(3)]
+    zone = asyncio.run(api.dns_zones.update(ZoneConfig(id='z1'), records_to_add=records, max_records=2))
+    assert [len(call['body']['recordsToAdd']) for call in transport.calls] == [2, 1]
+    assert [r.name for r in zone.records] == ['2.example.com']
+
+
+def test_zone_update_many_reports_failures(api, transport) -> None:
+    async def respond(body: dict[str, Any]) -> dict[str, Any]:
+        if body['zoneConfig']['id'] == 'z2':
+            return {'status': 'error', 'errors': [{'text': 'Nope', 'code': 42}]}
+        return {'status': 'success', 'response': {'zoneConfig': body['zoneConfig'], 'records': []}}
+
+    transport.responder = respond
+    record = DnsRecord(name='example.com', type=RecordType.TXT, content='v=spf1 -all')
+    progress: list[tuple[int, int]] = []
+    results = asyncio.run(api.dns_zones.update_many(
+        [(ZoneConfig(id=f'z{i}'), [record], [], []) for i in range(1, 4)], concurrency=2,
+        progress=lambda result, done, total: progress.append((done, total))))
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ServiceException)
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_template_delete_requires_id_or_name(api, transport) -> None:
+    with pytest.raises(ValueError, match='id or name'):
+        asyncio.run(api.dns_templates.delete())
+    asyncio.run(api.dns_templates.delete(template_name='default'))
+    assert transport.calls[0]['url'].endswith('/templateDelete')
+    assert transport.calls[0]['body']['templateName'] == 'default'
+
+
+def test_template_create_sends_record_templates(api, transport) -> None:
+    transport.responses.append({'status': 'success', 'response': {'id': 't1', 'name': 'default'}})
+    record_template = RecordTemplate(name='##DOMAIN##', type=RecordType.A, content='192.0.2.1')
+    template = asyncio.run(api.dns_templates.create(Template(name='default'), [record_template]))
+    assert template.id == 't1'
+    assert transport.calls[0]['url'].endswith('/templateCreate')
+    assert transport.calls[0]['body']['recordTemplates'][0]['content'] == '192.0.2.1'
+
+
+def test_default_nameserver_set(api, transport) -> None:
+    transport.responses.append({'status': 'success', 'response': apidata.NAMESERVER_SET})
+    nameserver_set = asyncio.run(api.nameserver_sets.get_default())
+    assert nameserver_set.id == apidata.NAMESERVER_SET['id']
+    assert transport.calls[0]['url'].endswith('/nameserverSetGetDefault')
+
+
+def test_mailbox_delete_sends_address_and_date(api, transport) -> None:
+    asyncio.run(api.mailboxes.delete(email_address='info@example.com', exec_date=datetime(2020, 1, 1)))
+    assert transport.calls[0]['url'].endswith('/mailboxDelete')
+    assert transport.calls[0]['body'] == {
+        'authToken': 'token', 'emailAddress': 'info@example.com', 'execDate': '2020-01-01T00:00:00',
+    }
+
+
+def test_domain_writes_are_awaitable(api, transport) -> None:
+    asyncio.run(api.domains.delete('example.com'))
+    assert transport.calls[0]['url'].endswith('/domainDelete')
+    assert transport.calls[0]['body']['domainName'] == 'example.com'
+
+
+def test_error_status_raises_with_messages(api, transport) -> None:
+    transport.responses.append({'status': 'error', 'errors': [{'text': 'Nope', 'code': 42}]})
+    with pytest.raises(ServiceException, match=r'Nope \(42\)\.'):
+        asyncio.run(api.domains.count())
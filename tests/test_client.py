@@ -1,4 +1,4 @@
-from httpnet.client import HttpNetClient
+from httpnet.client import HttpNetClient, RequestsTransport
 
 
 def test_client_exposes_all_services() -> None:
@@ -8,3 +8,13 @@ def test_client_exposes_all_services() -> None:
                       'nameserver_sets', 'dns_templates',
                       'mailboxes', 'email_organizations', 'email_domain_settings'):
         assert hasattr(api, attribute)
+
+
+def test_client_passes_the_transport_on(session) -> None:
+    transport = RequestsTransport(pool_size=32)
+    api = HttpNetClient(auth_token='dummy', transport=transport)
+    api.domains.count()
+    api.dns_records.count()
+    assert len(session.calls) == 2
+    assert api.domains._client.transport is transport
+    assert api.dns_records._client is api.domains._client
@@ -1,9 +1,43 @@
-from datetime import datetime
-from typing import Any
+import gc
+import gzip
+import http.server
+import json
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any, ClassVar
 
+import dateutil.parser
+import dateutil.tz
 import pytest
+import requests
 
-from httpnet._core import Client, CrudService, Element, Service, ServiceException
+import httpnet._core
+from httpnet._core import (
+    Client,
+    Condition,
+    CrudService,
+    Element,
+    Field,
+    Platform,
+    RateLimiter,
+    RequestCompression,
+    RequestsTransport,
+    ResponseCache,
+    RetryPolicy,
+    Service,
+    ServiceException,
+    Transport,
+    _json_dumps,
+    _json_loads,
+    _parse_datetime,
+    _StreamedPage,
+    all_of,
+    any_of,
+)
+from httpnet.dns import RecordType
 
 
 class Widget(Element):
@@ -59,6 +93,482 @@ class TestClient:
         assert session.calls[0]['body']['authToken'] == 'token'
 
 
+class FakeTransport(Transport):
+    def __init__(self) -> None:
+        self.posts: list[dict[str, Any]] = []
+        self.closed = False
+
+    def post(self, url, data, headers, timeout) -> dict[str, Any]:
+        self.posts.append({'url': url, 'data': data, 'headers': headers, 'timeout': timeout})
+        return {'status': 'success'}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestJsonCodec:
+    @pytest.fixture(params=['orjson', 'json'])
+    def backend(self, request, monkeypatch: pytest.MonkeyPatch) -> str:
+        if request.param == 'orjson':
+            pytest.importorskip('orjson')
+        else:
+            monkeypatch.setattr(httpnet._core, 'orjson', None)
+        return request.param
+
+    def test_encoding_is_compact_utf8(self, backend) -> None:
+        assert _json_dumps({'name': 'bücher.de', 'ttl': [1, 2]}) == '{"name":"bücher.de","ttl":[1,2]}'.encode()
+
+    def test_values_orjson_rejects_are_encoded(self, backend) -> None:
+        assert _json_dumps({'id': 2 ** 70}) == b'{"id":1180591620717411303424}'
+
+    def test_enums_and_datetimes_are_encoded(self, backend) -> None:
+        value = {'type': RecordType.A, 'date': datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)}
+        assert _json_dumps(value) == b'{"type":"A","date":"2026-01-02T03:04:05+00:00"}'
+
+    def test_other_objects_are_rejected(self, backend) -> None:
+        with pytest.raises(TypeError):
+            _json_dumps({'value': object()})
+
+    def test_decoding(self, backend) -> None:
+        assert _json_loads('{"name":"bücher.de"}'.encode()) == {'name': 'bücher.de'}
+
+    def test_request_body_is_not_copied_more_than_once(self) -> None:
+        parameters = {'limit': 10}
+        request = Client(auth_token='token', owner_account_id='acct')._request(parameters)
+        assert request == {'limit': 10, 'authToken': 'token', 'ownerAccountId': 'acct'}
+        assert parameters == {'limit': 10}
+
+
+class TestTransport:
+    def test_client_uses_the_given_transport(self) -> None:
+        transport = FakeTransport()
+        client = Client(auth_token='token', timeout=5.0, transport=transport)
+        assert client.call('dns', 'zonesFind') == {'status': 'success'}
+        post = transport.posts[0]
+        assert post['url'] == 'https://partner.http.net/api/dns/v1/json/zonesFind'
+        assert post['data'] == b'{"authToken":"token"}'
+        assert post['headers'] == {'User-Agent': Client.USER_AGENT, 'Accept-Encoding': 'gzip, deflate'}
+        assert post['timeout'] == 5.0
+        client.close()
+        assert transport.closed
+
+    def test_default_transport(self) -> None:
+        assert isinstance(Client(auth_token='token').transport, RequestsTransport)
+
+    def test_pool_settings_are_applied(self) -> None:
+        transport = RequestsTransport(pool_size=32, pool_hosts=2, pool_block=True)
+        adapter = transport._session().get_adapter('https://partner.http.net/api')
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+        assert adapter.poolmanager.connection_pool_kw['block'] is True
+        assert adapter.poolmanager.pools._maxsize == 2
+
+    def test_threads_share_the_pool_but_not_the_session(self) -> None:
+        transport = RequestsTransport()
+        sessions = [transport._session()]
+        thread = threading.Thread(target=lambda: sessions.append(transport._session()))
+        thread.start()
+        thread.join()
+        assert sessions[0] is transport._session()
+        assert sessions[0] is not sessions[1]
+        assert sessions[0].get_adapter('https://') is sessions[1].get_adapter('https://')
+
+    def test_connections_are_closed_without_keep_alive(self, session) -> None:
+        client = Client(auth_token='token', transport=RequestsTransport(keep_alive=False))
+        client.call('dns', 'zonesFind')
+        assert session.calls[0]['headers']['Connection'] == 'close'
+
+
+class TestCompression:
+    def test_large_zone_updates_are_compressed(self) -> None:
+        transport = FakeTransport()
+        client = Client(auth_token='token', transport=transport, compression=RequestCompression(threshold=1000))
+        records = [{'name': f'host{i}', 'type': 'A', 'content': '192.0.2.1'} for i in range(100)]
+        client.call('dns', 'zoneUpdate', {'recordsToAdd': records})
+        post = transport.posts[0]
+        assert post['headers']['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(post['data']))['recordsToAdd'] == records
+        stats = client.stats.methods['zoneUpdate']
+        assert stats.request_bytes_sent == len(post['data'])
+        assert stats.bytes_saved == stats.request_bytes - len(post['data']) > 0
+
+    def test_small_bodies_and_other_methods_are_not_compressed(self) -> None:
+        transport = FakeTransport()
+        client = Client(auth_token='token', transport=transport, compression=RequestCompression(threshold=1000))
+        client.call('dns', 'zoneUpdate', {'recordsToAdd': []})
+        client.call('dns', 'recordsFind', {'filter': 'x' * 2000})
+        assert all('Content-Encoding' not in post['headers'] for post in transport.posts)
+        assert client.stats.calls == 2
+        assert client.stats.bytes_saved == 0
+
+    def test_requests_are_not_compressed_by_default(self) -> None:
+        transport = FakeTransport()
+        Client(auth_token='token', transport=transport).call('dns', 'zoneUpdate', {'records': 'x' * 100000})
+        assert 'Content-Encoding' not in transport.posts[0]['headers']
+
+    @pytest.mark.parametrize('arguments', [dict(threshold=-1), dict(level=0), dict(level=10)])
+    def test_invalid_arguments(self, arguments) -> None:
+        with pytest.raises(ValueError):
+            RequestCompression(**arguments)
+
+    def test_compressed_responses_are_measured(self) -> None:
+        payload = json.dumps({'status': 'success', 'response': {'data': [{'name': 'host'}] * 500}}).encode()
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers['Content-Length']))
+                body = gzip.compress(payload)
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Content-Encoding', 'gzip')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = http.server.HTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            client = Client(auth_token='token', base_url=f'http://127.0.0.1:{server.server_port}')
+            assert len(client.call('dns', 'recordsFind')['response']['data']) == 500
+        finally:
+            server.shutdown()
+            thread.join()
+            server.server_close()
+        assert client.stats.response_bytes == len(payload)
+        assert client.stats.response_bytes_received == len(gzip.compress(payload))
+
+
+class FailingTransport(FakeTransport):
+    """Raises the given errors for the first posts, then succeeds."""
+
+    def __init__(self, *errors: Exception) -> None:
+        super().__init__()
+        self.errors = list(errors)
+
+    def post(self, url, data, headers, timeout) -> dict[str, Any]:
+        response = super().post(url, data, headers, timeout)
+        if self.errors:
+            raise self.errors.pop(0)
+        return response
+
+
+def http_error(status: int, headers: dict[str, str] | None = None) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(response=response)
+
+
+class TestRetryPolicy:
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        sleeps: list[float] = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+        return sleeps
+
+    def test_reads_are_retried(self, sleeps) -> None:
+        transport = FailingTransport(requests.ConnectionError(), http_error(503))
+        client = Client(auth_token='token', transport=transport, retry=RetryPolicy(backoff=1, jitter=False))
+        assert client.call('dns', 'zonesFind') == {'status': 'success'}
+        assert len(transport.posts) == 3
+        assert sleeps == [1, 2]
+
+    def test_attempts_are_capped(self) -> None:
+        transport = FailingTransport(*(requests.Timeout() for _ in range(3)))
+        client = Client(auth_token='token', transport=transport, retry=RetryPolicy(attempts=2))
+        with pytest.raises(requests.Timeout):
+            client.call('dns', 'zonesFind')
+        assert len(transport.posts) == 2
+
+    def test_client_errors_are_not_retried(self) -> None:
+        transport = FailingTransport(http_error(400))
+        with pytest.raises(requests.HTTPError):
+            Client(auth_token='token', transport=transport).call('dns', 'zonesFind')
+        assert len(transport.posts) == 1
+
+    @pytest.mark.parametrize('parameters', [None, {'clientTransactionId': 'tx-1'}])
+    def test_writes_are_not_retried(self, parameters) -> None:
+        transport = FailingTransport(http_error(503))
+        with pytest.raises(requests.HTTPError):
+            Client(auth_token='token', transport=transport).call('dns', 'zoneCreate', parameters)
+        assert len(transport.posts) == 1
+
+    def test_retry_after_is_honoured(self, sleeps) -> None:
+        transport = FailingTransport(http_error(429, {'Retry-After': '7'}))
+        Client(auth_token='token', transport=transport).call('dns', 'zonesFind')
+        assert sleeps == [7]
+
+    def test_long_retry_after_gives_up(self) -> None:
+        transport = FailingTransport(http_error(429, {'Retry-After': '3600'}))
+        with pytest.raises(requests.HTTPError):
+            Client(auth_token='token', transport=transport).call('dns', 'zonesFind')
+
+    def test_retry_after_date(self) -> None:
+        assert RetryPolicy().delay(1, 'Wed, 21 Oct 2015 07:28:00 GMT') == 0
+        assert RetryPolicy(jitter=False).delay(1, 'soon') == 0.5
+
+    def test_backoff_is_jittered_and_capped(self) -> None:
+        policy = RetryPolicy(attempts=10, backoff=1, max_delay=5)
+        assert all(0 <= policy.delay(attempt) <= min(5, 2 ** (attempt - 1)) for attempt in range(1, 10))
+        assert RetryPolicy(attempts=10, backoff=1, max_delay=5, jitter=False).delay(9) == 5
+
+    def test_single_attempt_disables_retries(self) -> None:
+        assert not RetryPolicy(attempts=1).retries('zonesFind')
+
+    def test_invalid_attempts(self) -> None:
+        with pytest.raises(ValueError, match='Attempts'):
+            RetryPolicy(attempts=0)
+
+
+class TestRateLimiter:
+    @pytest.fixture
+    def sleeps(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        sleeps: list[float] = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+        return sleeps
+
+    def test_weights(self) -> None:
+        limiter = RateLimiter(1, weights={'*Find': 0.5, 'domainTransfer': 5, 'zonesFind': 2})
+        assert limiter.weight('contactsFind') == 0.5
+        assert limiter.weight('zonesFind') == 2
+        assert limiter.weight('domainTransfer') == 5
+        assert limiter.weight('zoneCreate') == 1
+
+    def test_burst_is_not_throttled(self, sleeps) -> None:
+        limiter = RateLimiter(rate=1, burst=3)
+        for _ in range(3):
+            with limiter.throttle('zonesFind'):
+                pass
+        assert sleeps == []
+
+    def test_requests_beyond_the_burst_wait(self, sleeps) -> None:
+        limiter = RateLimiter(rate=2, burst=1, weights={'domainTransfer': 3})
+        with limiter.throttle('zonesFind'):
+            pass
+        assert limiter.wait_time == pytest.approx(0.5, abs=0.05)
+        with limiter.throttle('domainTransfer'):
+            pass
+        assert sleeps == [pytest.approx(1.5, abs=0.05)]
+        assert limiter.wait_time == pytest.approx(2, abs=0.05)
+
+    def test_wait_time_of_a_full_bucket(self) -> None:
+        assert RateLimiter(rate=10).wait_time == 0
+
+    def test_requests_in_flight_are_limited(self) -> None:
+        limiter = RateLimiter(rate=1000, max_in_flight=2)
+        in_flight: list[int] = []
+        barrier = threading.Barrier(2)
+
+        def request() -> None:
+            with limiter.throttle('zonesFind'):
+                in_flight.append(limiter.in_flight)
+                barrier.wait(timeout=1)
+                time.sleep(0.01)
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(in_flight) == 2
+        assert limiter.in_flight == 0
+
+    def test_client_throttles_requests_but_not_cache_hits(self, session, sleeps) -> None:
+        limiter = RateLimiter(rate=1, burst=1)
+        client = Client(auth_token='token', cache=ResponseCache(), limiter=limiter)
+        client.call('dns', 'zonesFind')
+        client.call('dns', 'zonesFind')
+        assert sleeps == []
+        client.call('dns', 'zoneConfigsFind')
+        assert len(sleeps) == 1
+
+    @pytest.mark.parametrize('arguments', [
+        dict(rate=0), dict(rate=1, burst=0), dict(rate=1, max_in_flight=0),
+    ])
+    def test_invalid_arguments(self, arguments) -> None:
+        with pytest.raises(ValueError):
+            RateLimiter(**arguments)
+
+
+class TestCoalescing:
+    def call_concurrently(self, client: Client, calls: list[tuple[str, str, dict[str, Any] | None]]) -> list[Any]:
+        results: list[Any] = [None] * len(calls)
+        barrier = threading.Barrier(len(calls))
+
+        def call(index: int) -> None:
+            barrier.wait(timeout=1)
+            try:
+                results[index] = client.call(*calls[index])
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=call, args=(index,)) for index in range(len(calls))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    @pytest.fixture
+    def slow_session(self, session):
+        def respond(body: dict[str, Any]) -> dict[str, Any]:
+            time.sleep(0.1)
+            return {'status': 'success', 'response': {'page': body.get('page')}}
+
+        session.responder = respond
+        return session
+
+    def test_identical_reads_share_one_request(self, slow_session) -> None:
+        client = Client(auth_token='token', coalesce=True)
+        results = self.call_concurrently(client, [('dns', 'zonesFind', {'page': 1})] * 10)
+        assert len(slow_session.calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_different_reads_are_not_coalesced(self, slow_session) -> None:
+        client = Client(auth_token='token', coalesce=True)
+        results = self.call_concurrently(client, [('dns', 'zonesFind', {'page': page}) for page in (1, 2)])
+        assert len(slow_session.calls) == 2
+        assert [result['response']['page'] for result in results] == [1, 2]
+
+    def test_writes_are_not_coalesced(self, slow_session) -> None:
+        client = Client(auth_token='token', coalesce=True)
+        self.call_concurrently(client, [('dns', 'zoneDelete', {'zoneName': 'example.com'})] * 3)
+        assert len(slow_session.calls) == 3
+
+    def test_reads_are_not_coalesced_by_default(self, slow_session) -> None:
+        self.call_concurrently(Client(auth_token='token'), [('dns', 'zonesFind', None)] * 3)
+        assert len(slow_session.calls) == 3
+
+    def test_failures_are_shared(self, session) -> None:
+        def respond(body: dict[str, Any]) -> dict[str, Any]:
+            time.sleep(0.1)
+            raise requests.HTTPError('400 Client Error')
+
+        session.responder = respond
+        client = Client(auth_token='token', coalesce=True)
+        results = self.call_concurrently(client, [('dns', 'zonesFind', None)] * 3)
+        assert len(session.calls) == 1
+        assert all(isinstance(result, requests.HTTPError) for result in results)
+
+    def test_later_reads_make_a_new_request(self, session) -> None:
+        client = Client(auth_token='token', coalesce=True)
+        client.call('dns', 'zonesFind')
+        client.call('dns', 'zonesFind')
+        assert len(session.calls) == 2
+
+
+class TestResponseCache:
+    def test_repeated_reads_are_answered_from_the_cache(self, session) -> None:
+        cache = ResponseCache()
+        service = WidgetService(Client(auth_token='token', cache=cache))
+        session.responses.append({'status': 'success', 'response': {
+            'data': [{'id': '1', 'name': 'gadget'}], 'totalPages': 1,
+        }})
+        assert service.get('1').name == 'gadget'
+        assert service.get('1').name == 'gadget'
+        assert len(session.calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_different_parameters_are_cached_separately(self, session) -> None:
+        service = WidgetService(Client(auth_token='token', cache=ResponseCache()))
+        service.count(Name='a')
+        service.count(Name='b')
+        service.count(Name='a')
+        assert len(session.calls) == 2
+
+    def test_writes_are_not_cached_and_invalidate_the_service(self, session) -> None:
+        cache = ResponseCache()
+        service = WidgetService(Client(auth_token='token', cache=cache))
+        service.count()
+        cache.put('other', 'widgetsFind', None, {'status': 'success'})
+        service.delete('1')
+        service.delete('1')
+        assert len(session.calls) == 3
+        assert len(cache) == 1
+        service.count()
+        assert len(session.calls) == 4
+
+    def test_reads_overtaken_by_a_write_are_not_cached(self, session) -> None:
+        read_started = threading.Event()
+        write_done = threading.Event()
+
+        def respond(body: dict[str, Any]) -> dict[str, Any]:
+            if 'widget' in body:
+                return {'status': 'success', 'response': body['widget']}
+            if not write_done.is_set():
+                read_started.set()
+                write_done.wait(timeout=1)
+                return {'status': 'success', 'response': {'totalEntries': 1}}
+            return {'status': 'success', 'response': {'totalEntries': 2}}
+
+        session.responder = respond
+        cache = ResponseCache()
+        service = WidgetService(Client(auth_token='token', cache=cache))
+        counts: list[int] = []
+        reader = threading.Thread(target=lambda: counts.append(service.count()))
+        reader.start()
+        assert read_started.wait(timeout=1)
+        service.update(Widget(id='1', name='gadget'))
+        write_done.set()
+        reader.join()
+        assert counts == [1]
+        assert len(cache) == 0
+        assert service.count() == 2
+
+    def test_invalidating_all_services_changes_every_generation(self) -> None:
+        cache = ResponseCache()
+        generation = cache.generation('dns')
+        cache.invalidate('domain')
+        assert cache.generation('dns') == generation
+        cache.invalidate()
+        cache.put('dns', 'zonesFind', None, {'status': 'success'}, generation)
+        assert len(cache) == 0
+
+    def test_failed_and_pending_responses_are_not_cached(self, session) -> None:
+        service = WidgetService(Client(auth_token='token', cache=ResponseCache()))
+        session.responses.append({'status': 'error', 'errors': []})
+        session.responses.append({'status': 'pending', 'response': {}})
+        with pytest.raises(ServiceException):
+            service.count()
+        service.count()
+        service.count()
+        assert len(session.calls) == 3
+
+    def test_responses_expire(self, monkeypatch) -> None:
+        now = [1000.0]
+        monkeypatch.setattr('time.monotonic', lambda: now[0])
+        cache = ResponseCache(ttl=10)
+        cache.put('dns', 'zonesFind', {}, {'status': 'success'})
+        now[0] += 9
+        assert cache.get('dns', 'zonesFind', {}) is not None
+        now[0] += 1
+        assert cache.get('dns', 'zonesFind', {}) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_response_is_evicted(self) -> None:
+        cache = ResponseCache(max_size=2)
+        for method in ('aFind', 'bFind'):
+            cache.put('dns', method, None, {'method': method})
+        cache.get('dns', 'aFind')
+        cache.put('dns', 'cFind', None, {'method': 'cFind'})
+        assert cache.get('dns', 'aFind') == {'method': 'aFind'}
+        assert cache.get('dns', 'bFind') is None
+
+    def test_parameter_order_does_not_matter(self) -> None:
+        cache = ResponseCache()
+        cache.put('dns', 'zonesFind', {'a': 1, 'b': 2}, {'status': 'success'})
+        assert cache.get('dns', 'zonesFind', {'b': 2, 'a': 1}) is not None
+
+    @pytest.mark.parametrize('method, read', [
+        ('zonesFind', True), ('domainInfo', True), ('nameserverSetGetDefault', True),
+        ('zoneUpdate', False), ('domainStatus', False),
+    ])
+    def test_read_methods(self, method, read) -> None:
+        assert ResponseCache.is_read_method(method) is read
+
+
 class TestElement:
     def test_fields_are_derived_from_annotations(self) -> None:
         assert Widget._fields == ('id', 'name', 'created')
@@ -102,6 +612,203 @@ class TestElement:
         crate = Crate.from_json({'payload': [{'a': 1}, 'b', None]})
         assert crate.payload == [{'a': 1}, 'b', None]
 
+    def test_decoding_plan_is_created_once_per_class(self) -> None:
+        Widget.from_json({'name': 'gadget'})
+        plan = Widget._decoding_plan()
+        Widget.from_json({'name': 'gadget'})
+        assert Widget._decoding_plan() is plan
+        assert Crate._decoding_plan() is not plan
+        assert set(plan) == {'id', 'name', 'created'}
+
+    def test_irregularly_spelled_key_is_accepted(self) -> None:
+        # Keys only have to convert to the name of a field, as before.
+        crate = Crate.from_json({'Labels': {'a': 'b'}})
+        assert crate.labels == {'a': 'b'}
+        assert 'Labels' in Crate._decoding_plan()
+
+    def test_undecodable_optional_value_is_kept(self) -> None:
+        widget = Widget.from_json({'name': 'gadget', 'created': 'not a date'})
+        assert widget.created == 'not a date'
+
+    def test_encoding_plan_is_created_once_per_class(self) -> None:
+        Widget(name='gadget').to_json()
+        plan = Widget._encoding_plan()
+        assert Widget._encoding_plan() is plan
+        assert [(field, field_id) for field, field_id, _ in plan] == [
+            ('id', 'id'), ('name', 'name'), ('created', 'created')
+        ]
+
+    def test_to_json_of_values_that_differ_from_the_annotation(self) -> None:
+        # The plan only takes shortcuts for values of the annotated type.
+        widget = Widget(id=1, name='gadget', created='2026-01-02')
+        assert widget.to_json() == {'id': 1, 'name': 'gadget', 'created': '2026-01-02'}
+        crate = Crate(prices={'a': datetime(2026, 1, 2)}, labels=(('a', 'b'),))
+        assert crate.to_json() == {'prices': {'a': '2026-01-02T00:00:00'}, 'labels': [['a', 'b']]}
+
+    def test_from_json_with_fields_skips_the_others(self) -> None:
+        # Unknown keys and invalid values of other fields are not even looked at.
+        widget = Widget.from_json({'id': '1', 'nope': 'x', 'created': 42}, fields={'id'})
+        assert repr(widget) == "Widget(id='1', name=None, created=None)"
+
+    def test_empty_string_of_optional_field_is_none(self) -> None:
+        assert Widget.from_json({'name': 'gadget', 'created': ''}).created is None
+
+
+class TestParseDatetime:
+    @pytest.mark.parametrize('value', [
+        '2015-01-01T00:00:00',
+        '2015-09-02T10:14:02Z',
+        '2015-09-02T10:14:02.5Z',
+        '2015-09-02T10:14:02.123456',
+        '2015-09-02T10:14:02+00:00',
+        '2015-09-02T10:14:02+01:00',
+        '2015-09-02T10:14:02-05:30',
+        '2015-09-02 10:14:02',
+        '2015-12-31',
+        # Not a format of the API, parsed by dateutil
+        'Sep 2 2015 10:14',
+    ])
+    def test_same_result_as_dateutil(self, value) -> None:
+        parsed = _parse_datetime(value)
+        assert parsed == dateutil.parser.parse(value)
+        assert parsed.utcoffset() == dateutil.parser.parse(value).utcoffset()
+
+    def test_utc_is_the_time_zone_of_dateutil(self) -> None:
+        assert _parse_datetime('2015-09-02T10:14:02Z').tzinfo is dateutil.tz.UTC
+
+    @pytest.mark.parametrize('value', ['2015-13-01T00:00:00', '', 'tomorrow'])
+    def test_invalid_value_raises_the_error_of_dateutil(self, value) -> None:
+        with pytest.raises(dateutil.parser.ParserError):
+            _parse_datetime(value)
+
+
+class TestFilter:
+    def test_equality_omits_relation(self) -> None:
+        assert (Field('RecordType') == 'A').to_json() == {'field': 'RecordType', 'value': 'A'}
+
+    @pytest.mark.parametrize('condition, relation', [
+        (Field('Ttl') != 1, 'unequal'),
+        (Field('Ttl') > 1, 'greater'),
+        (Field('Ttl') >= 1, 'greaterEqual'),
+        (Field('Ttl') < 1, 'less'),
+        (Field('Ttl') <= 1, 'lessEqual'),
+    ])
+    def test_comparisons(self, condition: Condition, relation: str) -> None:
+        assert condition.to_json() == {'field': 'Ttl', 'value': '1', 'relation': relation}
+
+    def test_values_are_converted(self) -> None:
+        renew_on = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert (Field('DomainRenewOn') < renew_on).to_json()['value'] == '2025-01-01T00:00:00+00:00'
+        assert (Field('Hidden') == True).to_json()['value'] == 'true'  # noqa: E712
+        assert (Field('Platform') == Platform.HTTP_NET).to_json()['value'] == Platform.HTTP_NET.value
+
+    def test_unknown_relation(self) -> None:
+        with pytest.raises(ValueError, match='relation'):
+            Condition('Ttl', 1, 'like')
+
+    def test_nesting(self) -> None:
+        a, b, c = (Field('RecordType') == t for t in 'ABC')
+        assert (a & (b | c)).to_json() == {
+            'subFilterConnective': 'AND',
+            'subFilter': [
+                {'field': 'RecordType', 'value': 'A'},
+                {'subFilterConnective': 'OR', 'subFilter': [
+                    {'field': 'RecordType', 'value': 'B'},
+                    {'field': 'RecordType', 'value': 'C'},
+                ]},
+            ],
+        }
+
+    def test_same_connectives_are_flattened(self) -> None:
+        a, b, c = (Field('RecordType') == t for t in 'ABC')
+        assert len(((a | b) | c).to_json()['subFilter']) == 3
+        assert all_of(a, all_of(b, c)).to_json() == all_of(a, b, c).to_json()
+
+    def test_single_filter_is_not_wrapped(self) -> None:
+        assert any_of(Field('RecordType') == 'A').to_json() == {'field': 'RecordType', 'value': 'A'}
+
+    def test_is_in(self) -> None:
+        assert Field('RecordType').is_in(['A', 'AAAA']).to_json() == {
+            'subFilterConnective': 'OR',
+            'subFilter': [{'field': 'RecordType', 'value': 'A'}, {'field': 'RecordType', 'value': 'AAAA'}],
+        }
+
+    def test_empty_filters_are_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            Field('RecordType').is_in([])
+        with pytest.raises(ValueError):
+            any_of()
+
+    def test_find_sends_filter(self, client, session) -> None:
+        list(WidgetService(client).find(where=Field('WidgetName').is_in(['a', 'b'])))
+        assert session.calls[0]['body']['filter']['subFilterConnective'] == 'OR'
+
+    def test_keyword_filters_are_combined_with_filter(self, client, session) -> None:
+        WidgetService(client).count(where=Field('WidgetAddDate') > '2020-01-01', WidgetName='a')
+        assert session.calls[0]['body']['filter'] == {
+            'subFilterConnective': 'AND',
+            'subFilter': [
+                {'field': 'WidgetName', 'value': 'a'},
+                {'field': 'WidgetAddDate', 'value': '2020-01-01', 'relation': 'greater'},
+            ],
+        }
+
+
+def chunked(document: Any, size: int) -> list[bytes]:
+    data = json.dumps(document, ensure_ascii=False).encode()
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+class TestStreamedPage:
+    PAGE: ClassVar = {
+        'errors': [],
+        'response': {
+            'data': [{'id': str(i), 'name': 'bücher', 'ttl': 86400 + i, 'nested': {'a': [1, None, True]}}
+                     for i in range(20)],
+            'limit': 20,
+            'totalEntries': 123,
+            'totalPages': 7,
+        },
+        'status': 'success',
+    }
+
+    @pytest.mark.parametrize('size', [1, 3, 7, 4096])
+    def test_elements_and_body(self, size: int) -> None:
+        page = _StreamedPage(chunked(self.PAGE, size))
+        assert list(page) == self.PAGE['response']['data']
+        assert page.body == {'limit': 20, 'totalEntries': 123, 'totalPages': 7}
+
+    def test_body_before_data(self) -> None:
+        page = _StreamedPage(chunked({'response': {'totalPages': 2, 'data': [{'id': '1'}]}, 'status': 'success'}, 5))
+        assert list(page) == [{'id': '1'}]
+        assert page.body == {'totalPages': 2}
+
+    def test_elements_are_yielded_before_the_page_is_complete(self) -> None:
+        chunks = chunked(self.PAGE, 16)
+        read: list[bytes] = []
+
+        def arrive() -> Iterator[bytes]:
+            for chunk in chunks:
+                read.append(chunk)
+                yield chunk
+
+        assert next(iter(_StreamedPage(arrive()))) == self.PAGE['response']['data'][0]
+        assert len(read) < len(chunks) / 10
+
+    def test_empty_page(self) -> None:
+        page = _StreamedPage(chunked({'response': {'data': [], 'totalPages': 0}, 'status': 'success'}, 2))
+        assert list(page) == []
+        assert page.body == {'totalPages': 0}
+
+    def test_rejected_request(self) -> None:
+        document = {'errors': [{'code': 10205, 'text': 'Invalid token'}], 'response': None, 'status': 'error'}
+        with pytest.raises(ServiceException, match='Invalid token'):
+            list(_StreamedPage(chunked(document, 4)))
+
+    def test_truncated_response(self) -> None:
+        with pytest.raises(ValueError):
+            list(_StreamedPage(chunked(self.PAGE, 50)[:-3]))
+
 
 class TestService:
     def test_element_class_is_resolved_from_type_parameter(self, client) -> None:
@@ -122,6 +829,74 @@ class TestService:
         assert service._find_method_name == 'widgetsFind'
         assert service._find_filter_name == 'WidgetId'
 
+    def test_find_streams_pages(self, client, session, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(RequestsTransport, 'STREAM_CHUNK_SIZE', 7)
+        for page in (1, 2):
+            session.responses.append({'status': 'success', 'response': {
+                'data': [{'id': f'{page}.{i}', 'name': 'gadget'} for i in range(3)], 'totalPages': 2,
+            }})
+        widgets = list(WidgetService(client).find(stream=True, fields=['id']))
+        assert [widget.id for widget in widgets] == ['1.0', '1.1', '1.2', '2.0', '2.1', '2.2']
+        assert [call['body']['page'] for call in session.calls] == [1, 2]
+        assert all(call['stream'] for call in session.calls)
+
+    def test_find_streams_a_single_page(self, client, session) -> None:
+        session.responses.append({'status': 'success', 'response': {'data': [{'id': '1'}], 'totalPages': 2}})
+        assert len(list(WidgetService(client).find(page=2, stream=True, raw=True))) == 1
+        assert session.calls[0]['body']['page'] == 2
+
+    def test_streaming_cannot_prefetch(self, client) -> None:
+        with pytest.raises(ValueError, match='streaming'):
+            list(WidgetService(client).find(stream=True, concurrency=2))
+
+    def test_transports_without_streaming_yield_the_whole_body(self) -> None:
+        client = Client(auth_token='token', transport=FakeTransport())
+        assert list(client.stream('dns', 'zonesFind')) == [b'{"status":"success"}']
+
+    def test_get_many_filters_for_chunks_of_keys(self, client, session) -> None:
+        def respond(body: dict[str, Any]) -> dict[str, Any]:
+            # A chunk of a single key is a single condition.
+            keys = [sub_filter['value'] for sub_filter in body['filter'].get('subFilter', [body['filter']])]
+            return {'status': 'success', 'response': {
+                'data': [{'id': key, 'name': f'gadget {key}'} for key in keys if key != '4'],
+                'totalPages': 1,
+            }}
+
+        session.responder = respond
+        widgets = WidgetService(client).get_many(['3', '1', '2', '1'], chunk_size=2, missing_ok=True)
+        assert list(widgets) == ['3', '1', '2']
+        assert widgets['2'].name == 'gadget 2'
+        assert len(session.calls) == 2
+        assert session.calls[0]['body']['limit'] == 2
+        assert session.calls[0]['body']['filter'] == {
+            'subFilterConnective': 'OR',
+            'subFilter': [{'field': 'WidgetId', 'value': '3'}, {'field': 'WidgetId', 'value': '1'}],
+        }
+
+    def test_get_many_reports_missing_keys(self, client, session) -> None:
+        session.responses.append({
+            'status': 'success', 'response': {'data': [{'id': '1', 'name': 'gadget'}], 'totalPages': 1},
+        })
+        with pytest.raises(KeyError) as exc_info:
+            WidgetService(client).get_many(['1', '2', '3'])
+        assert exc_info.value.args[0] == ['2', '3']
+
+    def test_get_many_pages_through_chunk(self, client, session) -> None:
+        session.responses += [
+            {'status': 'success', 'response': {'data': [{'id': '1', 'name': 'a'}], 'totalPages': 2}},
+            {'status': 'success', 'response': {'data': [{'id': '2', 'name': 'b'}], 'totalPages': 2}},
+        ]
+        assert list(WidgetService(client).get_many(['1', '2'])) == ['1', '2']
+        assert [call['body']['page'] for call in session.calls] == [1, 2]
+
+    def test_get_many_without_keys(self, client, session) -> None:
+        assert WidgetService(client).get_many([]) == {}
+        assert session.calls == []
+
+    def test_get_many_rejects_empty_chunks(self, client) -> None:
+        with pytest.raises(ValueError, match='chunk_size'):
+            WidgetService(client).get_many(['1'], chunk_size=0)
+
     def test_get_looks_the_element_up_through_find(self, client, session) -> None:
         session.responses.append({
             'status': 'success',
@@ -159,6 +934,79 @@ class TestService:
         assert [w.id for w in widgets] == ['1', '2']
         assert [call['body']['page'] for call in session.calls] == [1, 2]
 
+    def test_find_reports_totals_with_the_first_page(self, client, session) -> None:
+        session.responder = lambda body: {'status': 'success', 'response': {
+            'data': [{'id': str(body['page'])}], 'totalEntries': 3, 'totalPages': 3,
+        }}
+        widgets = WidgetService(client).find(limit=1)
+        assert not session.calls
+        assert (widgets.total_entries, widgets.total_pages, len(widgets)) == (3, 3, 3)
+        assert widgets.pages_fetched == 1
+        assert [w.id for w in widgets] == ['1', '2', '3']
+        assert widgets.pages_fetched == 3
+        assert len(session.calls) == 3
+
+    @pytest.mark.parametrize('stream', [False, True])
+    def test_find_listing_is_true_without_a_request(self, client, session, stream: bool) -> None:
+        assert WidgetService(client).find(stream=stream)
+        assert not session.calls
+
+    def test_find_length_of_a_single_page(self, client, session) -> None:
+        session.responses.append({'status': 'success', 'response': {
+            'data': [{'id': '3'}, {'id': '4'}], 'totalEntries': 5, 'totalPages': 3,
+        }})
+        widgets = WidgetService(client).find(limit=2, page=2)
+        assert (len(widgets), widgets.total_entries) == (2, 5)
+
+    def test_find_streamed_length_of_a_single_page(self, client, session) -> None:
+        session.responses.append({'status': 'success', 'response': {
+            'data': [{'id': '3'}, {'id': '4'}], 'totalEntries': 5, 'totalPages': 3,
+        }})
+        widgets = WidgetService(client).find(limit=2, page=2, stream=True, raw=True)
+        assert [w['id'] for w in widgets] == ['3', '4']
+        assert (len(widgets), widgets.total_entries) == (2, 5)
+
+    @pytest.mark.parametrize('concurrency', [None, 2])
+    def test_find_releases_pages_once_they_are_iterated(self, client, monkeypatch, concurrency) -> None:
+        class Data(list):
+            """Unlike a list, can be referenced weakly."""
+
+        pages: dict[int, weakref.ref[Data]] = {}
+
+        def find_page(parameters: Any, page: int) -> dict[str, Any]:
+            data = Data([{'id': str(page), 'name': 'w'}])
+            pages[page] = weakref.ref(data)
+            return {'data': data, 'totalEntries': 4, 'totalPages': 4}
+
+        service = WidgetService(client)
+        monkeypatch.setattr(service, '_find_page', find_page)
+        widgets = service.find(concurrency=concurrency)
+        assert len(widgets) == 4
+        for widget in widgets:
+            if widget.id == '4':
+                gc.collect()
+                assert [page for page, data in pages.items() if data() is not None] == [4]
+        assert (len(widgets), widgets.total_pages) == (4, 4)
+
+    def test_find_pages(self, client, session) -> None:
+        session.responder = lambda body: {'status': 'success', 'response': {
+            'data': [{'id': f'{body["page"]}.{i}'} for i in range(2)], 'totalPages': 2,
+        }}
+        widgets = WidgetService(client).find(raw=True)
+        assert next(widgets)['id'] == '1.0'
+        assert [[w['id'] for w in page] for page in widgets.pages()] == [['1.1'], ['2.0', '2.1']]
+
+    def test_find_streamed_totals_are_known_after_the_first_page(self, client, session) -> None:
+        session.responses.append({'status': 'success', 'response': {
+            'data': [{'id': '1'}, {'id': '2'}], 'totalEntries': 2, 'totalPages': 1,
+        }})
+        widgets = WidgetService(client).find(stream=True, raw=True)
+        assert widgets.total_entries is None
+        with pytest.raises(TypeError):
+            len(widgets)
+        assert [w['id'] for w in widgets] == ['1', '2']
+        assert (widgets.total_entries, len(widgets), widgets.pages_fetched) == (2, 2, 1)
+
     def test_find_builds_filters_and_sorting(self, client, session) -> None:
         session.responses.append({'status': 'success', 'response': {'totalPages': 0}})
         list(WidgetService(client).find(limit=5, sort='~name', Name='gadget'))
@@ -170,6 +1018,83 @@ class TestService:
             'subFilter': [{'field': 'Name', 'value': 'gadget'}],
         }
 
+    def test_find_with_concurrency_keeps_the_page_order(self, client, session) -> None:
+        session.responder = lambda body: {'status': 'success', 'response': {
+            'data': [{'id': str(body['page']), 'name': 'w'}], 'totalPages': 5,
+        }}
+        widgets = list(WidgetService(client).find(concurrency=3))
+        assert [w.id for w in widgets] == ['1', '2', '3', '4', '5']
+        assert session.calls[0]['body']['page'] == 1
+        assert sorted(call['body']['page'] for call in session.calls) == [1, 2, 3, 4, 5]
+
+    def test_find_with_concurrency_requests_pages_in_parallel(self, client, session) -> None:
+        # Both remaining pages have to be in flight at the same time for the
+        # barrier to let either of them pass.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def respond(body: dict[str, Any]) -> dict[str, Any]:
+            if body['page'] > 1:
+                barrier.wait()
+            return {'status': 'success', 'response': {'data': [], 'totalPages': 3}}
+
+        session.responder = respond
+        list(WidgetService(client).find(concurrency=2))
+        assert len(session.calls) == 3
+
+    def test_find_with_concurrency_stops_after_a_single_page(self, client, session) -> None:
+        session.responses.append({'status': 'success', 'response': {'data': [], 'totalPages': 1}})
+        list(WidgetService(client).find(concurrency=4))
+        assert len(session.calls) == 1
+
+    def test_find_rejects_invalid_concurrency(self, client) -> None:
+        with pytest.raises(ValueError, match='Concurrency'):
+            list(WidgetService(client).find(concurrency=0))
+
+    def test_find_with_prefetch_requests_the_next_page_before_it_is_needed(self, client, session) -> None:
+        requested = {page: threading.Event() for page in range(1, 11)}
+
+        def respond(body: dict[str, Any]) -> dict[str, Any]:
+            requested[body['page']].set()
+            return {'status': 'success', 'response': {
+                'data': [{'id': str(body['page']), 'name': 'w'}], 'totalPages': 10,
+            }}
+
+        session.responder = respond
+        widgets = WidgetService(client).find(prefetch=2)
+        assert next(widgets).id == '1'
+        assert requested[2].wait(5)
+        assert requested[3].wait(5)
+        # Further pages are only requested as the consumer advances.
+        assert not requested[4].is_set()
+        assert [w.id for w in widgets] == [str(page) for page in range(2, 11)]
+
+    def test_find_raw_yields_the_json_data(self, client, session) -> None:
+        data = {'id': '1', 'name': 'gadget', 'created': '2026-01-02T03:04:05', 'unknown': True}
+        session.responses.append({'status': 'success', 'response': {'data': [data], 'totalPages': 1}})
+        assert list(WidgetService(client).find(raw=True)) == [data]
+
+    def test_find_with_fields_converts_only_those(self, client, session) -> None:
+        session.responses.append({'status': 'success', 'response': {'data': [
+            {'id': '1', 'name': 'gadget', 'created': '2026-01-02T03:04:05'},
+        ], 'totalPages': 1}})
+        widget, = WidgetService(client).find(fields=['id', 'created'])
+        assert isinstance(widget, Widget)
+        assert widget.id == '1'
+        assert widget.name is None
+        assert widget.created == datetime(2026, 1, 2, 3, 4, 5)
+
+    def test_find_with_unknown_fields_is_rejected(self, client) -> None:
+        with pytest.raises(KeyError, match='nope'):
+            list(WidgetService(client).find(fields=['nope']))
+
+    def test_find_raw_with_fields_is_rejected(self, client) -> None:
+        with pytest.raises(ValueError, match='raw'):
+            list(WidgetService(client).find(raw=True, fields=['id']))
+
+    def test_find_rejects_negative_prefetch(self, client) -> None:
+        with pytest.raises(ValueError, match='Prefetch'):
+            list(WidgetService(client).find(prefetch=-1))
+
     def test_error_status_raises_with_messages(self, client, session) -> None:
         session.responses.append({
             'status': 'error',
@@ -0,0 +1,143 @@
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from httpnet.dns import NameserverSetService, ZoneService
+from httpnet.mirror import Mirror
+
+
+def nameserver_set(id: str, last_change_date: str, name: str | None = None) -> dict[str, Any]:
+    return {
+        'id': id,
+        'name': name or f'set-{id}',
+        'nameservers': ['ns1.example.com'],
+        'lastChangeDate': last_change_date,
+    }
+
+
+class FakeApi:
+    """Answers ``nameserverSetsFind`` and ``zonesFind`` from a list of elements."""
+
+    def __init__(self, elements: list[dict[str, Any]]) -> None:
+        self.elements = elements
+
+    def __call__(self, body: dict[str, Any]) -> dict[str, Any]:
+        elements = list(self.elements)
+        if 'sort' in body:
+            elements.sort(key=lambda e: e.get('lastChangeDate') or e['zoneConfig']['lastChangeDate'],
+                          reverse=body['sort']['order'] == 'desc')
+        limit = body.get('limit', len(elements)) or 1
+        page = body.get('page', 1)
+        return {'status': 'success', 'response': {
+            'data': elements[(page - 1) * limit:page * limit],
+            'totalEntries': len(elements),
+            'totalPages': max(1, -(-len(elements) // limit)),
+        }}
+
+
+@pytest.fixture
+def api(session) -> FakeApi:
+    fake_api = FakeApi([
+        nameserver_set('1', '2020-01-01T00:00:00Z'),
+        nameserver_set('2', '2020-01-02T00:00:00Z'),
+        nameserver_set('3', '2020-01-03T00:00:00Z'),
+    ])
+    session.responder = fake_api
+    return fake_api
+
+
+@pytest.fixture
+def mirror(client, api) -> Mirror:
+    mirror = Mirror(NameserverSetService(client), limit=2)
+    yield mirror
+    mirror.close()
+
+
+class TestMirror:
+    def test_first_sync_retrieves_all_elements(self, mirror, session) -> None:
+        assert mirror.sync() == 3
+        assert len(mirror) == 3
+        assert [ns.id for ns in mirror] == ['1', '2', '3']
+        assert mirror.high_water_mark == '2020-01-03T00:00:00Z'
+        assert 'sort' not in session.calls[0]['body']
+
+    def test_sort_is_derived_from_element(self, mirror) -> None:
+        assert mirror.sort == 'NameserverSetLastChangeDate'
+
+    def test_elements_are_read_locally(self, mirror, session) -> None:
+        mirror.sync()
+        calls = len(session.calls)
+        assert mirror.get('2').name == 'set-2'
+        assert [ns.id for ns in mirror.find(name='set-3')] == ['3']
+        assert len(session.calls) == calls
+
+    def test_find_by_date(self, mirror) -> None:
+        mirror.sync()
+        last_change_date = mirror.get('2').last_change_date
+        assert isinstance(last_change_date, datetime)
+        assert [ns.id for ns in mirror.find(last_change_date=last_change_date)] == ['2']
+        assert [ns.id for ns in mirror.find(name='set-3', last_change_date=last_change_date)] == []
+
+    def test_get_unknown_key(self, mirror) -> None:
+        mirror.sync()
+        with pytest.raises(KeyError):
+            mirror.get('4')
+
+    def test_find_unknown_field(self, mirror) -> None:
+        with pytest.raises(KeyError, match='No field "nam"'):
+            list(mirror.find(nam='set-1'))
+
+    def test_incremental_sync_stops_at_high_water_mark(self, mirror, api, session) -> None:
+        mirror.sync()
+        api.elements.append(nameserver_set('4', '2020-01-04T00:00:00Z'))
+        api.elements[0] = nameserver_set('1', '2020-01-05T00:00:00Z', name='renamed')
+        session.calls.clear()
+
+        # 4 and 1 are new, 3 is at the high-water mark and 2 ends the sync.
+        assert mirror.sync() == 3
+        assert len(session.calls) == 2
+        assert session.calls[0]['body']['sort'] == {'field': 'NameserverSetLastChangeDate', 'order': 'desc'}
+        assert mirror.get('1').name == 'renamed'
+        assert len(mirror) == 4
+        assert mirror.high_water_mark == '2020-01-05T00:00:00Z'
+
+    def test_incremental_sync_without_changes(self, mirror, session) -> None:
+        mirror.sync()
+        session.calls.clear()
+        assert mirror.sync() == 1
+        assert len(session.calls) == 1
+
+    def test_deletion_leads_to_full_sync(self, mirror, api) -> None:
+        mirror.sync()
+        del api.elements[0]
+        mirror.sync()
+        assert [ns.id for ns in mirror] == ['2', '3']
+
+    def test_full_sync(self, mirror, session) -> None:
+        mirror.sync()
+        session.calls.clear()
+        assert mirror.sync(full=True) == 3
+        assert 'sort' not in session.calls[0]['body']
+
+    def test_state_is_persisted(self, client, api, tmp_path) -> None:
+        path = tmp_path / 'mirror.sqlite'
+        mirror = Mirror(NameserverSetService(client), path)
+        mirror.sync()
+        mirror.close()
+
+        mirror = Mirror(NameserverSetService(client), path)
+        assert len(mirror) == 3
+        assert mirror.high_water_mark == '2020-01-03T00:00:00Z'
+        mirror.close()
+
+    def test_zones_are_keyed_by_zone_config(self, client, api) -> None:
+        api.elements = [{
+            'zoneConfig': {'id': 'z1', 'name': 'example.com', 'lastChangeDate': '2020-01-01T00:00:00Z'},
+            'records': [],
+        }]
+        mirror = Mirror(ZoneService(client))
+        mirror.sync()
+        assert mirror.get('z1').zone_config.name == 'example.com'
+        assert mirror.high_water_mark == '2020-01-01T00:00:00Z'
+        mirror.close()
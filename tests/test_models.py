@@ -1,10 +1,13 @@
+import json
 from datetime import datetime
+from typing import Any
 
 import pytest
 
+from httpnet._core import ServiceException
 from httpnet.client import HttpNetClient
-from httpnet.dns import DnsRecord, RecordType, Zone, ZoneConfig, ZoneConfigType
-from httpnet.domain import Contact, ContactType
+from httpnet.dns import DnsRecord, RecordTemplate, RecordType, Template, Zone, ZoneConfig, ZoneConfigType
+from httpnet.domain import Contact, ContactType, Domain
 
 
 class TestRoundTrip:
@@ -20,6 +23,14 @@ class TestRoundTrip:
         assert record.last_change_date == datetime(2026, 1, 2, 3, 4, 5)
         assert record.to_json()['lastChangeDate'] == '2026-01-02T03:04:05'
 
+    def test_unknown_enum_value_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match='NOPE'):
+            RecordTemplate.from_json({'name': 'example.com', 'type': 'NOPE', 'content': '::1'})
+
+    def test_unknown_value_of_optional_enum_is_kept(self) -> None:
+        record = DnsRecord.from_json({'name': 'example.com', 'type': 'NOPE', 'content': '::1'})
+        assert record.type == 'NOPE'
+
     def test_optional_field_is_none_when_null(self) -> None:
         record = DnsRecord.from_json({'name': 'example.com', 'type': 'A', 'content': '::1',
                                       'ttl': None})
@@ -78,6 +89,140 @@ class TestServices:
         assert body['records'][0]['content'] == '::1'
         assert body['useDefaultNameserverSet'] is True
 
+    def test_zone_sync_sends_only_the_differences(self, session) -> None:
+        session.responses.append({'status': 'success', 'response': {'data': [{
+            'zoneConfig': {'id': 'z1', 'name': 'example.com'},
+            'records': [
+                {'id': 'r1', 'name': 'example.com', 'type': 'SOA', 'content': 'ns1.example.com'},
+                {'id': 'r2', 'name': 'www.example.com', 'type': 'A', 'content': '192.0.2.1', 'ttl': 3600},
+                {'id': 'r3', 'name': 'mail.example.com', 'type': 'A', 'content': '192.0.2.2', 'ttl': 3600},
+                {'id': 'r4', 'name': 'old.example.com', 'type': 'A', 'content': '192.0.2.9', 'ttl': 3600},
+                {'id': 'r5', 'name': 'ftp.example.com', 'type': 'A', 'content': '192.0.2.5', 'ttl': 3600},
+            ],
+        }], 'totalPages': 1}})
+        session.responses.append({'status': 'success', 'response': {'records': []}})
+        HttpNetClient(auth_token='token').dns_zones.sync(ZoneConfig(id='z1', name='example.com'), [
+            DnsRecord(name='WWW.example.com.', type=RecordType.A, content='192.0.2.1'),
+            DnsRecord(name='mail.example.com', type=RecordType.A, content='192.0.2.2', ttl=60),
+            DnsRecord(id='r5', name='ftp.example.com', type=RecordType.A, content='192.0.2.6'),
+            DnsRecord(name='new.example.com', type=RecordType.AAAA, content='2001:db8::1'),
+        ])
+
+        assert len(session.calls) == 2
+        body = session.calls[1]['body']
+        assert session.calls[1]['url'].endswith('/zoneUpdate')
+        assert [r['name'] for r in body['recordsToAdd']] == ['new.example.com']
+        assert [(r['id'], r.get('ttl'), r['content']) for r in body['recordsToModify']] == [
+            ('r3', 60, '192.0.2.2'), ('r5', None, '192.0.2.6')]
+        assert [r['id'] for r in body['recordsToDelete']] == ['r4']
+
+    def test_zone_sync_without_differences_sends_nothing(self, session) -> None:
+        session.responses.append({'status': 'success', 'response': {'data': [{
+            'zoneConfig': {'id': 'z1', 'name': 'example.com'},
+            'records': [{'id': 'r1', 'name': 'www.example.com', 'type': 'A', 'content': '192.0.2.1'}],
+        }], 'totalPages': 1}})
+        zone = HttpNetClient(auth_token='token').dns_zones.sync(
+            ZoneConfig(id='z1'), [DnsRecord(name='www.example.com', type=RecordType.A, content='192.0.2.1')])
+        assert len(session.calls) == 1
+        assert zone.zone_config.name == 'example.com'
+
+    def test_zone_sync_compares_domain_names_in_content_normalized(self, session) -> None:
+        session.responses.append({'status': 'success', 'response': {'data': [{
+            'zoneConfig': {'id': 'z1', 'name': 'example.com'},
+            'records': [
+                {'id': 'r1', 'name': 'www.example.com', 'type': 'CNAME', 'content': 'example.com'},
+                {'id': 'r2', 'name': 'example.com', 'type': 'MX', 'content': 'mail.example.com', 'priority': 10},
+                {'id': 'r3', 'name': '_sip._tcp.example.com', 'type': 'SRV', 'content': '5 5060 sip.example.com'},
+            ],
+        }], 'totalPages': 1}})
+        HttpNetClient(auth_token='token').dns_zones.sync(ZoneConfig(id='z1'), [
+            DnsRecord(name='www.example.com', type=RecordType.CNAME, content='Example.COM.'),
+            DnsRecord(name='example.com', type=RecordType.MX, content='mail.example.com.', priority=10),
+            DnsRecord(name='_sip._tcp.example.com', type=RecordType.SRV, content='5 5060 SIP.example.com.'),
+        ])
+        assert len(session.calls) == 1
+
+    def test_zone_sync_counts_identical_records_once(self, session) -> None:
+        session.responses.append({'status': 'success', 'response': {'data': [{
+            'zoneConfig': {'id': 'z1', 'name': 'example.com'},
+            'records': [
+                {'id': 'r1', 'name': 'www.example.com', 'type': 'A', 'content': '192.0.2.1'},
+                {'id': 'r2', 'name': 'ftp.example.com', 'type': 'CNAME', 'content': ' '},
+            ],
+        }], 'totalPages': 1}})
+        HttpNetClient(auth_token='token').dns_zones.sync(ZoneConfig(id='z1'), [
+            DnsRecord(name='www.example.com', type=RecordType.A, content='192.0.2.1'),
+            DnsRecord(name='www.example.com.', type=RecordType.A, content='192.0.2.1'),
+            DnsRecord(name='ftp.example.com', type=RecordType.CNAME, content=' '),
+        ])
+        assert len(session.calls) == 1
+
+    @pytest.mark.parametrize('record_ids, message', [
+        (['r9'], 'not a record of the zone'),
+        (['r1', 'r1'], 'more than once'),
+    ])
+    def test_zone_sync_rejects_unknown_and_repeated_ids(self, session, record_ids, message) -> None:
+        session.responses.append({'status': 'success', 'response': {'data': [{
+            'zoneConfig': {'id': 'z1', 'name': 'example.com'},
+            'records': [{'id': 'r1', 'name': 'www.example.com', 'type': 'A', 'content': '192.0.2.1'}],
+        }], 'totalPages': 1}})
+        with pytest.raises(ValueError, match=message):
+            HttpNetClient(auth_token='token').dns_zones.sync(ZoneConfig(id='z1'), [
+                DnsRecord(id=record_id, name='www.example.com', type=RecordType.A, content=f'192.0.2.{i}')
+                for i, record_id in enumerate(record_ids, start=2)
+            ])
+        assert len(session.calls) == 1
+
+    def test_zone_update_many_reports_each_zone(self, session) -> None:
+        def respond(body: dict[str, Any]) -> dict[str, Any]:
+            if body['zoneConfig']['id'] == 'z2':
+                return {'status': 'error', 'errors': [{'code': 10205, 'text': 'Record invalid'}]}
+            return {'status': 'success', 'response': {'zoneConfig': body['zoneConfig'], 'records': []}}
+
+        session.responder = respond
+        spf = DnsRecord(name='example.com', type=RecordType.TXT, content='v=spf1 -all')
+        progress = []
+        results = HttpNetClient(auth_token='token').dns_zones.update_many(
+            [(ZoneConfig(id=f'z{i}'), [spf], [], []) for i in range(1, 4)], concurrency=2,
+            progress=lambda result, done, total: progress.append((done, total)))
+
+        assert [result.zone_config.id for result in results] == ['z1', 'z2', 'z3']
+        assert [result.succeeded for result in results] == [True, False, True]
+        assert results[0].zone.zone_config.id == 'z1'
+        assert isinstance(results[1].error, ServiceException)
+        assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+        assert all(call['body']['recordsToAdd'][0]['content'] == 'v=spf1 -all' for call in session.calls)
+
+    def test_zone_update_many_rejects_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError, match='Concurrency'):
+            HttpNetClient(auth_token='token').dns_zones.update_many([], concurrency=0)
+
+    def test_zone_update_is_split_by_record_count(self, session) -> None:
+        session.responder = lambda body: {'status': 'success', 'response': {
+            'zoneConfig': body['zoneConfig'], 'records': body['recordsToAdd']}}
+        records = [DnsRecord(name=f'{i}.example.com', type=RecordType.A, content='192.0.2.1') for i in range(5)]
+        zone = HttpNetClient(auth_token='token').dns_zones.update(
+            ZoneConfig(id='z1'), records_to_add=records[:3], records_to_delete=records[3:], max_records=2)
+
+        batches = [(len(call['body']['recordsToDelete']), len(call['body']['recordsToAdd'])) for call in session.calls]
+        assert batches == [(2, 0), (0, 2), (0, 1)]
+        assert all(call['body']['zoneConfig'] == {'id': 'z1'} for call in session.calls)
+        assert [r.name for r in zone.records] == ['2.example.com']
+
+    def test_template_update_is_split_by_size(self, session) -> None:
+        session.responder = lambda body: {'status': 'success', 'response': body['dnsTemplate']}
+        records = [RecordTemplate(name=f'{i}.example.com', type=RecordType.A, content='192.0.2.1')
+                   for i in range(4)]
+        size = len(json.dumps(records[0].to_json(), separators=(',', ':'))) + 1
+        HttpNetClient(auth_token='token').dns_templates.update(
+            Template(id='t1'), records, [], max_bytes=2 * size)
+        assert [len(call['body']['recordTemplatesToAdd']) for call in session.calls] == [2, 2]
+
+    def test_zone_update_rejects_invalid_limits(self, session) -> None:
+        with pytest.raises(ValueError, match='at least 1'):
+            HttpNetClient(auth_token='token').dns_zones.update(ZoneConfig(id='z1'), max_records=0)
+        assert not session.calls
+
     def test_domain_service_uses_custom_id_name(self, session) -> None:
         api = HttpNetClient(auth_token='token')
         session.responses.append({'status': 'success', 'response': {
@@ -136,6 +281,36 @@ class TestServices:
             {'field': filter_name, 'value': 'id-1'}
         ]
 
+    @pytest.mark.parametrize('name, filter_name, json_element', [
+        ('domains', 'DomainName',
+         {'name': 'example.com', 'transferLockEnabled': True, 'contacts': [], 'nameservers': []}),
+        ('email_domain_settings', 'DomainName', {'domainName': 'example.com'}),
+        ('dns_zones', 'ZoneConfigId', {'zoneConfig': {'id': 'example.com'}, 'records': []}),
+    ])
+    def test_get_many_matches_elements_without_id(self, name: str, filter_name: str,
+                                                  json_element: dict, session) -> None:
+        api = HttpNetClient(auth_token='token')
+        session.responses.append({
+            'status': 'success', 'response': {'data': [json_element], 'totalPages': 1},
+        })
+        elements = getattr(api, name).get_many(['example.com', 'example.org'], missing_ok=True)
+        assert list(elements) == ['example.com']
+        assert session.calls[0]['body']['filter']['subFilter'][0]['field'] == filter_name
+
+    @pytest.mark.parametrize('name, json_element', [
+        ('domains', {'name': 'example.com', 'transferLockEnabled': True, 'contacts': [], 'nameservers': []}),
+        ('email_domain_settings', {'domainName': 'example.com'}),
+    ])
+    def test_get_many_matches_domain_names_regardless_of_case(self, name: str, json_element: dict,
+                                                              session) -> None:
+        api = HttpNetClient(auth_token='token')
+        session.responses.append({
+            'status': 'success', 'response': {'data': [json_element], 'totalPages': 1},
+        })
+        elements = getattr(api, name).get_many(['Example.COM', 'example.com.'])
+        assert list(elements) == ['Example.COM', 'example.com.']
+        assert session.calls[0]['body']['filter'] == {'field': 'DomainName', 'value': 'example.com'}
+
     def test_domains_are_retrieved_through_domain_info(self, session) -> None:
         api = HttpNetClient(auth_token='token')
         session.responses.append({
@@ -147,3 +322,74 @@ class TestServices:
         assert domain.name == 'example.com'
         assert session.calls[0]['url'].endswith('/domain/v1/json/domainInfo')
         assert session.calls[0]['body']['domainName'] == 'example.com'
+
+
+class TestProjection:
+    def test_projection_skips_the_checks_of_the_constructor(self) -> None:
+        # A domain requires contacts and name servers, which are not selected.
+        domain = Domain.from_json({'name': 'example.com', 'id': '1', 'transferLockEnabled': True},
+                                  fields=['name', 'id'])
+        assert domain.name == 'example.com'
+        assert domain.transfer_lock_enabled is None
+        assert domain.to_json() == {'name': 'example.com', 'id': '1'}
+
+
+ZONE = {
+    'zoneConfig': {'id': 'z1', 'name': 'example.com', 'type': 'NATIVE',
+                   'soaValues': {'refresh': 86400, 'retry': 7200, 'expire': 3600000,
+                                 'ttl': 172800, 'negativeTtl': 3600}},
+    'records': [{'name': 'example.com', 'type': 'A', 'content': '127.0.0.1',
+                 'lastChangeDate': '2026-01-02T03:04:05'}],
+}
+
+
+class TestLazyElement:
+    def test_fields_are_converted_on_first_access(self) -> None:
+        zone = Zone.from_json(ZONE, lazy=True)
+        assert isinstance(zone.zone_config, ZoneConfig)
+        assert zone.zone_config is zone.zone_config
+        assert zone.records[0].last_change_date == datetime(2026, 1, 2, 3, 4, 5)
+
+    def test_untouched_fields_are_never_converted(self) -> None:
+        # The record would be rejected if it were converted.
+        zone = Zone.from_json({**ZONE, 'records': [{'unknown': 1}]}, lazy=True)
+        assert zone.zone_config.name == 'example.com'
+        with pytest.raises(KeyError, match='unknown'):
+            _ = zone.records
+
+    def test_unknown_key_is_rejected_right_away(self) -> None:
+        with pytest.raises(KeyError, match='nope'):
+            DnsRecord.from_json({'name': 'example.com', 'nope': 1}, lazy=True)
+
+    def test_absent_field_is_none(self) -> None:
+        assert DnsRecord.from_json({'name': 'example.com'}, lazy=True).ttl is None
+
+    def test_repr_and_to_json_are_those_of_an_eager_element(self) -> None:
+        lazy = Zone.from_json(ZONE, lazy=True)
+        eager = Zone.from_json(ZONE)
+        assert repr(lazy) == repr(eager)
+        assert Zone.from_json(ZONE, lazy=True).to_json() == eager.to_json()
+
+    def test_assignment_before_access_wins(self) -> None:
+        record = DnsRecord.from_json({'name': 'example.com', 'ttl': 300}, lazy=True)
+        record.ttl = 60
+        assert record.ttl == 60
+        assert record.to_json() == {'name': 'example.com', 'ttl': 60}
+
+    def test_unknown_attribute_does_not_exist(self) -> None:
+        record = DnsRecord.from_json({'name': 'example.com'}, lazy=True)
+        with pytest.raises(AttributeError, match='nope'):
+            _ = record.nope
+        with pytest.raises(AttributeError, match='nope'):
+            _ = DnsRecord(name='example.com').nope
+
+    def test_fields_and_slots_are_unchanged(self) -> None:
+        record = DnsRecord.from_json({'name': 'example.com'}, lazy=True)
+        assert record._fields == DnsRecord._fields == tuple(DnsRecord.__slots__)
+
+    def test_lazy_listing(self, session) -> None:
+        session.responses.append({'status': 'success', 'response': {
+            'data': [ZONE], 'totalEntries': 1, 'totalPages': 1,
+        }})
+        zone, = HttpNetClient(auth_token='token').dns_zones.find(lazy=True)
+        assert zone.zone_config.id == 'z1'
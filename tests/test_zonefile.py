@@ -0,0 +1,234 @@
+import io
+import re
+import tarfile
+from typing import Any
+
+import pytest
+
+from httpnet._core import ServiceException
+from httpnet.client import HttpNetClient
+from httpnet.dns import DnsRecord, RecordType, SoaValues, ZoneConfig
+from httpnet.zonefile import ZoneExporter, ZoneImporter, read_zone, write_zone
+
+ZONES = {
+    'z1': ('example.com', [
+        {'name': 'www.example.com', 'type': 'A', 'content': '192.0.2.1', 'ttl': 3600},
+        {'name': 'example.com', 'type': 'MX', 'content': 'mail.example.com', 'priority': 10},
+        {'name': 'example.com', 'type': 'SOA',
+         'content': 'ns1.example.net hostmaster.example.com 2026010101 86400 7200 3600000 3600'},
+    ]),
+    'z2': ('example.org', [
+        {'name': 'example.org', 'type': 'SOA',
+         'content': 'ns1.example.net hostmaster.example.org 2026010101 86400 7200 3600000 3600'},
+        {'name': 'example.org', 'type': 'TXT', 'content': 'v=spf1 -all'},
+    ]),
+}
+
+
+def respond(body: dict[str, Any]) -> dict[str, Any]:
+    """Answers ``zoneConfigsFind`` without and ``recordsFind`` with a filter."""
+    if 'filter' not in body:
+        data = [{'id': key, 'name': name} for key, (name, _) in ZONES.items()]
+    else:
+        zone, record_type = body['filter']['subFilter']
+        soa = record_type.get('relation', 'equal') == 'equal'
+        data = [record for record in ZONES[zone['value']][1] if (record['type'] == 'SOA') is soa]
+    return {'status': 'success', 'response': {'data': data, 'totalPages': 1}}
+
+
+@pytest.fixture
+def exporter(session) -> ZoneExporter:
+    session.responder = respond
+    return ZoneExporter(HttpNetClient(auth_token='token'), concurrency=2)
+
+
+class TestWriteZone:
+    def test_records_are_written_fully_qualified(self) -> None:
+        file = io.StringIO()
+        write_zone(ZoneConfig(name='example.com', soa_values=SoaValues(ttl=86400)), [
+            DnsRecord(name='example.com', type=RecordType.NS, content='ns1.example.net', ttl=86400),
+            DnsRecord(name='www.example.com', type=RecordType.CNAME, content='example.com.'),
+            DnsRecord(name='_sip._tcp.example.com', type=RecordType.SRV, content='5 5060 sip.example.com',
+                      priority=10),
+            DnsRecord(name='example.com', type=RecordType.TXT, content='say "hi"'),
+            DnsRecord(name='null.example.com', type=RecordType.NULLMX, content=''),
+        ], file)
+        assert file.getvalue().splitlines() == [
+            '$ORIGIN example.com.',
+            '$TTL 86400',
+            'example.com.\t86400\tIN\tNS\tns1.example.net.',
+            'www.example.com.\tIN\tCNAME\texample.com.',
+            '_sip._tcp.example.com.\tIN\tSRV\t10 5 5060 sip.example.com.',
+            'example.com.\tIN\tTXT\t"say \\"hi\\""',
+            'null.example.com.\tIN\tMX\t0 .',
+        ]
+
+    def test_long_txt_content_is_split_into_strings(self) -> None:
+        file = io.StringIO()
+        write_zone(ZoneConfig(name='example.com'),
+                   [DnsRecord(name='example.com', type=RecordType.TXT, content='x' * 300)], file)
+        assert file.getvalue().splitlines()[1].endswith(f'"{"x" * 255}" "{"x" * 45}"')
+
+    def test_unprintable_txt_characters_are_escaped_as_octets(self) -> None:
+        file = io.StringIO()
+        write_zone(ZoneConfig(name='example.com'),
+                   [DnsRecord(name='example.com', type=RecordType.TXT, content='a\nb\u2028 café')], file)
+        assert file.getvalue().splitlines()[1].endswith('"a\\010b\\226\\128\\168 café"')
+
+    @pytest.mark.parametrize('content', [
+        'x' * 254 + '"' + 'y' * 10,
+        'x' * 254 + '\\' + 'y' * 10,
+        'x' * 253 + '\\"' + 'y' * 10,
+        'ä' * 200,
+        'line\nbreak\ttab\x7f\x00',
+        '\u2028' * 100,
+    ])
+    def test_txt_content_is_read_back(self, content: str) -> None:
+        file = io.StringIO()
+        write_zone(ZoneConfig(name='example.com'),
+                   [DnsRecord(name='example.com', type=RecordType.TXT, content=content)], file)
+        assert file.getvalue().count('\n') == 2
+        strings = re.findall(r'"(?:[^"\\]|\\.)*"', file.getvalue())
+        # An escape stands for a single octet.
+        assert all(len(re.sub(r'\\(?:\d{3}|.)', '.', string[1:-1]).encode()) <= 255 for string in strings)
+        file.seek(0)
+        assert read_zone(file).records[0].content == content
+
+
+class TestZoneExporter:
+    def test_soa_record_comes_first(self, exporter) -> None:
+        file = io.StringIO()
+        exporter.write(ZoneConfig(id='z1', name='example.com'), file)
+        lines = file.getvalue().splitlines()
+        assert lines[1] == ('example.com.\tIN\tSOA\tns1.example.net. hostmaster.example.com. '
+                            '2026010101 86400 7200 3600000 3600')
+        assert lines[2:] == ['www.example.com.\t3600\tIN\tA\t192.0.2.1', 'example.com.\tIN\tMX\t10 mail.example.com.']
+
+    def test_export_directory(self, exporter, tmp_path) -> None:
+        assert exporter.export_directory(tmp_path / 'zones') == 2
+        assert sorted(path.name for path in (tmp_path / 'zones').iterdir()) == ['example.com.zone',
+                                                                               'example.org.zone']
+        assert '"v=spf1 -all"' in (tmp_path / 'zones' / 'example.org.zone').read_text()
+
+    def test_export_tar(self, exporter) -> None:
+        file = io.BytesIO()
+        assert exporter.export_tar(file, 'gz') == 2
+        file.seek(0)
+        with tarfile.open(fileobj=file) as archive:
+            assert archive.getnames() == ['example.com.zone', 'example.org.zone']
+            content = archive.extractfile('example.com.zone').read().decode()
+        assert content.startswith('$ORIGIN example.com.\nexample.com.\tIN\tSOA\t')
+
+    def test_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError, match='Concurrency'):
+            ZoneExporter(HttpNetClient(auth_token='token'), concurrency=0)
+
+
+ZONE_FILE = """\
+$TTL 1h
+$ORIGIN example.com.
+@   IN  SOA ns1.example.net. host\\.master.example.com. (
+            2026010101  ; serial
+            1d 2h 1000h 1h )
+        IN  NS      ns1.example.net.
+www 300 IN  A       192.0.2.1
+        IN  AAAA    2001:db8::1
+@       MX  10 mail
+null    MX  0 .
+_sip._tcp IN 60 SRV 10 5 5060 sip.example.com.
+txt     TXT "v=spf1 -all" " ; quoted" ; comment
+"""
+
+
+class TestReadZone:
+    def test_zone_config_is_taken_from_soa_record(self) -> None:
+        zone_config = read_zone(io.StringIO(ZONE_FILE)).zone_config
+        assert zone_config.name == 'example.com'
+        assert zone_config.email_address == 'host.master@example.com'
+        assert zone_config.soa_values.to_json() == {
+            'refresh': 86400, 'retry': 7200, 'expire': 3600000, 'ttl': 3600, 'negativeTtl': 3600}
+
+    def test_records(self) -> None:
+        records = read_zone(io.StringIO(ZONE_FILE)).records
+        assert [(r.name, r.type, r.content, r.ttl, r.priority) for r in records] == [
+            ('example.com', RecordType.NS, 'ns1.example.net', 3600, None),
+            ('www.example.com', RecordType.A, '192.0.2.1', 300, None),
+            ('www.example.com', RecordType.AAAA, '2001:db8::1', 3600, None),
+            ('example.com', RecordType.MX, 'mail.example.com', 3600, 10),
+            ('null.example.com', RecordType.NULLMX, '', 3600, 0),
+            ('_sip._tcp.example.com', RecordType.SRV, '5 5060 sip.example.com', 60, 10),
+            ('txt.example.com', RecordType.TXT, 'v=spf1 -all ; quoted', 3600, None),
+        ]
+
+    def test_exported_zone_is_read_back(self) -> None:
+        zone = read_zone(io.StringIO(ZONE_FILE))
+        file = io.StringIO()
+        write_zone(zone.zone_config, zone.records, file)
+        file.seek(0)
+        assert [r.to_json() for r in read_zone(file).records] == [r.to_json() for r in zone.records]
+
+    def test_origin_of_file_without_one(self) -> None:
+        zone = read_zone(['www 60 IN A 192.0.2.1\n'], origin='example.com')
+        assert zone.zone_config.name == 'example.com'
+        assert zone.records[0].name == 'www.example.com'
+
+    @pytest.mark.parametrize(('line', 'message'), [
+        ('www IN A 192.0.2.1\n', 'without an origin'),
+        ('www.example.com. CH A 192.0.2.1\n', 'Unsupported class'),
+        ('www.example.com. IN WKS 192.0.2.1\n', 'Unsupported record type'),
+        ('$INCLUDE other.zone\n', 'Unsupported directive'),
+        ('www.example.com. IN\n', 'Incomplete record'),
+        ('@ IN SOA ns1 hostmaster ( 1 2 3\n', 'unbalanced'),
+    ])
+    def test_invalid_file(self, line: str, message: str) -> None:
+        with pytest.raises(ValueError, match=f'Line 1: .*{message}'):
+            read_zone([line])
+
+    @pytest.mark.parametrize('rdata, content', [
+        ('"caf\\195\\169"', 'café'),
+        ('"say \\"hi\\" \\\\o/"', 'say "hi" \\o/'),
+        ('"line\\010break"', 'line\nbreak'),
+        ('caf\\195\\169 \\"quoted\\"', 'café"quoted"'),
+        ('two\\ words', 'two words'),
+    ])
+    def test_txt_escapes(self, rdata: str, content: str) -> None:
+        zone = read_zone(io.StringIO(f'txt IN TXT {rdata}\n'), origin='example.com')
+        assert zone.records[0].content == content
+
+    @pytest.mark.parametrize('rdata', ['"\\256"', '"\\195"'])
+    def test_invalid_txt_escapes_are_rejected(self, rdata: str) -> None:
+        with pytest.raises(ValueError, match='Line 1'):
+            read_zone(io.StringIO(f'txt IN TXT {rdata}\n'), origin='example.com')
+
+
+class TestZoneImporter:
+    def test_zones_are_created_and_reported(self, session, tmp_path) -> None:
+        def respond(body: dict[str, Any]) -> dict[str, Any]:
+            if body['zoneConfig']['name'] == 'example.org':
+                return {'status': 'error', 'errors': [{'code': 10205, 'text': 'Zone exists'}]}
+            return {'status': 'success', 'response': {'zoneConfig': body['zoneConfig'], 'records': body['records']}}
+
+        session.responder = respond
+        (tmp_path / 'example.com.zone').write_text(ZONE_FILE)
+        (tmp_path / 'example.org.zone').write_text('www 60 IN A 192.0.2.1\n')
+        (tmp_path / 'broken.zone').write_text('www 60 IN BOGUS x\n')
+        paths = [tmp_path / name for name in ('example.com.zone', 'example.org.zone', 'broken.zone')]
+        progress = []
+        results = ZoneImporter(HttpNetClient(auth_token='token'), concurrency=2, use_default_nameserver_set=True) \
+            .import_files(paths, progress=lambda result, done, total: progress.append((done, total)))
+
+        assert [result.path for result in results] == paths
+        assert len(results[0].zone.records) == 7
+        assert isinstance(results[1].error, ServiceException)
+        assert results[1].zone_config.name == 'example.org'
+        assert isinstance(results[2].error, ValueError)
+        assert results[2].zone_config is None
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert len(session.calls) == 2
+        assert all(call['url'].endswith('/zoneCreate') for call in session.calls)
+        assert all(call['body']['useDefaultNameserverSet'] for call in session.calls)
+
+    def test_zones_are_recreated(self, session) -> None:
+        session.responses.append({'status': 'success', 'response': {'records': []}})
+        ZoneImporter(HttpNetClient(auth_token='token'), recreate=True).import_zone(read_zone(io.StringIO(ZONE_FILE)))
+        assert session.calls[0]['url'].endswith('/zoneRecreate')